@@ -0,0 +1,40 @@
+"""데이터 수집 상태 테이블
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """어댑터/수집일별 원본 데이터 해시 테이블 생성"""
+    
+    # ingestion_state 테이블 - 변경 없는 수집 결과의 정규화/저장 생략용
+    op.create_table(
+        'ingestion_state',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('adapter', sa.String(length=100), nullable=False),
+        sa.Column('target_date', sa.Date(), nullable=False),
+        sa.Column('payload_hash', sa.String(length=64), nullable=False),
+        sa.Column('record_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('adapter', 'target_date', name='uq_ingestion_state_adapter_date')
+    )
+    op.create_index(op.f('ix_ingestion_state_id'), 'ingestion_state', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """테이블 삭제"""
+    op.drop_index(op.f('ix_ingestion_state_id'), table_name='ingestion_state')
+    op.drop_table('ingestion_state')
@@ -0,0 +1,39 @@
+"""백필 체크포인트 테이블
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """백필 재시작용 체크포인트 테이블 생성"""
+    
+    # backfill_checkpoints 테이블 - 저장까지 완료한 (어댑터, 수집일)
+    op.create_table(
+        'backfill_checkpoints',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('adapter', sa.String(length=100), nullable=False),
+        sa.Column('target_date', sa.Date(), nullable=False),
+        sa.Column('record_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('completed_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('adapter', 'target_date', name='uq_backfill_checkpoint_adapter_date')
+    )
+    op.create_index(op.f('ix_backfill_checkpoints_id'), 'backfill_checkpoints', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """테이블 삭제"""
+    op.drop_index(op.f('ix_backfill_checkpoints_id'), table_name='backfill_checkpoints')
+    op.drop_table('backfill_checkpoints')
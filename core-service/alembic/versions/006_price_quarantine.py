@@ -0,0 +1,54 @@
+"""가격 격리 테이블
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """이상치로 판정된 수집 가격 격리 테이블 생성"""
+    
+    # price_quarantine 테이블 - market_prices에 쓰지 않고 검토를 기다리는 가격
+    op.create_table(
+        'price_quarantine',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('item_id', sa.Integer(), nullable=False),
+        sa.Column('market_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('price', sa.DECIMAL(precision=10, scale=2), nullable=False),
+        sa.Column('unit', sa.String(length=20), nullable=False),
+        sa.Column('origin', sa.String(length=100), nullable=True),
+        sa.Column('source', sa.String(length=100), nullable=True),
+        sa.Column('baseline_median', sa.DECIMAL(precision=10, scale=2), nullable=False),
+        sa.Column('baseline_mad', sa.DECIMAL(precision=10, scale=2), nullable=False),
+        sa.Column('sample_count', sa.Integer(), nullable=False),
+        sa.Column('score', sa.DECIMAL(precision=10, scale=2), nullable=False),
+        sa.Column('reason', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), server_default='pending', nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('reviewed_at', sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(['item_id'], ['items.id'], ),
+        sa.ForeignKeyConstraint(['market_id'], ['markets.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('item_id', 'market_id', 'date', name='uq_quarantine_item_market_date')
+    )
+    op.create_index(op.f('ix_price_quarantine_id'), 'price_quarantine', ['id'], unique=False)
+    op.create_index('idx_price_quarantine_status_date', 'price_quarantine', ['status', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    """테이블 삭제"""
+    op.drop_index('idx_price_quarantine_status_date', table_name='price_quarantine')
+    op.drop_index(op.f('ix_price_quarantine_id'), table_name='price_quarantine')
+    op.drop_table('price_quarantine')
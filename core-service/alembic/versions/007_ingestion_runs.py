@@ -0,0 +1,84 @@
+"""수집 실행 기록 테이블
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """수집 실행 / 어댑터별 실행 기록 테이블 생성"""
+    
+    # ingestion_runs 테이블 - 스케줄러 수집 실행 1회
+    op.create_table(
+        'ingestion_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('trigger', sa.String(length=20), nullable=False),
+        sa.Column('status', sa.String(length=20), server_default='running', nullable=False),
+        sa.Column('started_at', sa.TIMESTAMP(), nullable=False),
+        sa.Column('finished_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('wall_seconds', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.Column('adapter_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('successful', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('unchanged', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('failed', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rows_inserted', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rows_updated', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rows_unchanged', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('rows_quarantined', sa.Integer(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ingestion_runs_id'), 'ingestion_runs', ['id'], unique=False)
+    op.create_index('idx_ingestion_runs_started_at', 'ingestion_runs', ['started_at'], unique=False)
+    
+    # ingestion_run_adapters 테이블 - 실행별 어댑터 단계 소요 시간/행 수/오류
+    op.create_table(
+        'ingestion_run_adapters',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('adapter', sa.String(length=100), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('target_date', sa.Date(), nullable=True),
+        sa.Column('fetch_seconds', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.Column('normalize_seconds', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.Column('validate_seconds', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.Column('write_seconds', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.Column('total_seconds', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.Column('raw_rows', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('invalid_rows', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('unmatched_rows', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('normalized_rows', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('quarantined_rows', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('inserted_rows', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_rows', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('unchanged_rows', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('payload_bytes', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('error_class', sa.String(length=100), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['ingestion_runs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ingestion_run_adapters_id'), 'ingestion_run_adapters', ['id'], unique=False)
+    op.create_index('idx_ingestion_run_adapters_run', 'ingestion_run_adapters', ['run_id'], unique=False)
+    op.create_index('idx_ingestion_run_adapters_adapter', 'ingestion_run_adapters', ['adapter', 'run_id'], unique=False)
+
+
+def downgrade() -> None:
+    """테이블 삭제"""
+    op.drop_index('idx_ingestion_run_adapters_adapter', table_name='ingestion_run_adapters')
+    op.drop_index('idx_ingestion_run_adapters_run', table_name='ingestion_run_adapters')
+    op.drop_index(op.f('ix_ingestion_run_adapters_id'), table_name='ingestion_run_adapters')
+    op.drop_table('ingestion_run_adapters')
+    op.drop_index('idx_ingestion_runs_started_at', table_name='ingestion_runs')
+    op.drop_index(op.f('ix_ingestion_runs_id'), table_name='ingestion_runs')
+    op.drop_table('ingestion_runs')
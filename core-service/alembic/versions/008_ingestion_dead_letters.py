@@ -0,0 +1,63 @@
+"""수집 실패 행 테이블
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """파싱/품목명 매핑에 실패한 원본 행 테이블 생성"""
+    
+    # ingestion_dead_letters 테이블 - replay.py로 네트워크 요청 없이 다시 처리
+    op.create_table(
+        'ingestion_dead_letters',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('adapter', sa.String(length=100), nullable=False),
+        sa.Column('stage', sa.String(length=20), nullable=False),
+        sa.Column('reason', sa.String(length=100), nullable=False),
+        sa.Column('target_date', sa.Date(), nullable=False),
+        sa.Column('payload_hash', sa.String(length=64), nullable=True),
+        sa.Column('record', sa.Text(), nullable=False),
+        sa.Column('record_hash', sa.String(length=64), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(length=20), server_default='pending', nullable=False),
+        sa.Column('occurrences', sa.Integer(), server_default='1', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('last_seen_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('replayed_at', sa.TIMESTAMP(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('adapter', 'target_date', 'record_hash', name='uq_dead_letter_adapter_date_record')
+    )
+    op.create_index(op.f('ix_ingestion_dead_letters_id'), 'ingestion_dead_letters', ['id'], unique=False)
+    op.create_index(
+        'idx_ingestion_dead_letters_status',
+        'ingestion_dead_letters',
+        ['status', 'adapter', 'target_date'],
+        unique=False
+    )
+    
+    # 수집 실행 기록에 어댑터별 실패 행 수 추가
+    op.add_column(
+        'ingestion_run_adapters',
+        sa.Column('dead_letter_rows', sa.Integer(), server_default='0', nullable=False)
+    )
+
+
+def downgrade() -> None:
+    """컬럼/테이블 삭제"""
+    op.drop_column('ingestion_run_adapters', 'dead_letter_rows')
+    op.drop_index('idx_ingestion_dead_letters_status', table_name='ingestion_dead_letters')
+    op.drop_index(op.f('ix_ingestion_dead_letters_id'), table_name='ingestion_dead_letters')
+    op.drop_table('ingestion_dead_letters')
@@ -0,0 +1,40 @@
+"""수집 워터마크 테이블
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """어댑터별 마지막 완료 수집일 테이블 생성"""
+    
+    # ingestion_watermarks 테이블 - 스케줄러가 다음 실행에서 이어서 수집할 기준
+    op.create_table(
+        'ingestion_watermarks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('adapter', sa.String(length=100), nullable=False),
+        sa.Column('last_success_date', sa.Date(), nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=True),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['ingestion_runs.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('adapter', name='uq_ingestion_watermark_adapter')
+    )
+    op.create_index(op.f('ix_ingestion_watermarks_id'), 'ingestion_watermarks', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """테이블 삭제"""
+    op.drop_index(op.f('ix_ingestion_watermarks_id'), table_name='ingestion_watermarks')
+    op.drop_table('ingestion_watermarks')
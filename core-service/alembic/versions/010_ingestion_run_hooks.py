@@ -0,0 +1,58 @@
+"""수집 실행 post-commit 훅 기록 테이블
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """실행별 post-commit 훅 기록 테이블 생성"""
+    
+    # ingestion_run_hooks 테이블 - 저장 후 실행한 뷰/캐시 갱신 훅의 소요 시간/오류
+    op.create_table(
+        'ingestion_run_hooks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('hook', sa.String(length=100), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('touched_keys', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('affected', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('seconds', sa.DECIMAL(precision=10, scale=3), nullable=True),
+        sa.Column('error_class', sa.String(length=100), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['ingestion_runs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ingestion_run_hooks_id'), 'ingestion_run_hooks', ['id'], unique=False)
+    op.create_index('idx_ingestion_run_hooks_run', 'ingestion_run_hooks', ['run_id'], unique=False)
+    
+    # daily_avg_prices는 database/init.sql에서 만드는 materialized view - 있으면 CONCURRENTLY 갱신용 유니크 인덱스 추가
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_matviews WHERE matviewname = 'daily_avg_prices') THEN
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_daily_avg_prices_key
+                    ON daily_avg_prices (item_id, market_id, date);
+            END IF;
+        END
+        $$;
+    """)
+
+
+def downgrade() -> None:
+    """테이블/인덱스 삭제"""
+    op.execute("DROP INDEX IF EXISTS uq_daily_avg_prices_key")
+    op.drop_index('idx_ingestion_run_hooks_run', table_name='ingestion_run_hooks')
+    op.drop_index(op.f('ix_ingestion_run_hooks_id'), table_name='ingestion_run_hooks')
+    op.drop_table('ingestion_run_hooks')
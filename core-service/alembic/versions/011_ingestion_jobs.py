@@ -0,0 +1,54 @@
+"""수집 작업 큐 테이블
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """큐 모드 (어댑터, 수집일) 작업 테이블 생성"""
+    
+    # ingestion_jobs 테이블 - 스케줄러가 넣고 워커가 SELECT ... FOR UPDATE SKIP LOCKED로 가져감
+    op.create_table(
+        'ingestion_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=True),
+        sa.Column('adapter', sa.String(length=100), nullable=False),
+        sa.Column('target_date', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(length=20), server_default='queued', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('max_attempts', sa.Integer(), server_default='3', nullable=False),
+        sa.Column('available_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('locked_by', sa.String(length=200), nullable=True),
+        sa.Column('locked_until', sa.TIMESTAMP(), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error_class', sa.String(length=100), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('started_at', sa.TIMESTAMP(), nullable=True),
+        sa.Column('finished_at', sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['ingestion_runs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ingestion_jobs_id'), 'ingestion_jobs', ['id'], unique=False)
+    op.create_index('idx_ingestion_jobs_claim', 'ingestion_jobs', ['status', 'available_at'], unique=False)
+    op.create_index('idx_ingestion_jobs_run', 'ingestion_jobs', ['run_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """테이블 삭제"""
+    op.drop_index('idx_ingestion_jobs_run', table_name='ingestion_jobs')
+    op.drop_index('idx_ingestion_jobs_claim', table_name='ingestion_jobs')
+    op.drop_index(op.f('ix_ingestion_jobs_id'), table_name='ingestion_jobs')
+    op.drop_table('ingestion_jobs')
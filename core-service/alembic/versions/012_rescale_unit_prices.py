@@ -0,0 +1,123 @@
+"""규격 수량이 기록된 과거 가격을 표준 단위당 가격으로 변환
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19 23:00:00.000000
+
+Data Ingestion이 규격의 수량을 반영해 kg당/마리당/상자당 가격을 저장하기 전에는
+규격 표기를 그대로 단위로 저장했습니다 (예: "10kg" 18,000원). 새로 저장되는 행(kg당 1,800원)과
+같은 품목/시장의 30일 기준 가격, 이상치 기준 분포에서 섞이지 않도록 기록된 수량으로 나눠
+같은 단위로 맞춥니다. 규칙은 data-ingestion/adapters/units.py의 parse_unit과 같습니다
+(마이그레이션은 서비스 코드와 독립적으로 유지하기 위해 여기에 고정).
+
+수집 시 수량을 버리고 "kg"/"마리"만 저장했던 행은 수량을 알 수 없으므로 변환하지 않습니다
+(backfill.py --no-resume으로 최근 기간을 다시 수집하면 갱신됨, data-ingestion/README.md 참고).
+"""
+import re
+from typing import Optional, Sequence, Tuple, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 단위 표기 → (표준 단위, 표준 단위로의 배율)
+UNIT_ALIASES = {
+    "kg": ("kg", 1.0),
+    "kilogram": ("kg", 1.0),
+    "kilo": ("kg", 1.0),
+    "킬로그램": ("kg", 1.0),
+    "킬로": ("kg", 1.0),
+    "g": ("kg", 0.001),
+    "gram": ("kg", 0.001),
+    "그램": ("kg", 0.001),
+    "마리": ("마리", 1.0),
+    "미": ("마리", 1.0),
+    "ea": ("마리", 1.0),
+    "each": ("마리", 1.0),
+    "pcs": ("마리", 1.0),
+    "개": ("마리", 1.0),
+    "상자": ("상자", 1.0),
+    "박스": ("상자", 1.0),
+    "box": ("상자", 1.0),
+}
+
+_QUANTITY_RE = re.compile(
+    r"(?P<qty>\d+(?:[.,]\d+)*)\s*(?P<unit>"
+    + "|".join(sorted((re.escape(alias) for alias in UNIT_ALIASES), key=len, reverse=True))
+    + r")(?![a-z])"
+)
+
+
+def _parse_quantity(raw: str) -> Optional[float]:
+    """수량 문자열 → float ("1,000" → 1000, "0.5" → 0.5, "1,5" → 1.5)"""
+    if "," in raw and "." not in raw:
+        head, _, tail = raw.rpartition(",")
+        raw = raw.replace(",", "") if len(tail) == 3 else f"{head.replace(',', '')}.{tail}"
+    else:
+        raw = raw.replace(",", "")
+    try:
+        quantity = float(raw)
+    except ValueError:
+        return None
+    return quantity if quantity > 0 else None
+
+
+def _parse_label(label: Optional[str]) -> Optional[Tuple[float, str]]:
+    """수량이 기록된 규격 표기 → (표준 단위 기준 수량, 표준 단위), 변환할 것이 없으면 None (중량 > 마리 > 상자 순)"""
+    if not label:
+        return None
+    normalized = label.strip().lower()
+    if normalized in UNIT_ALIASES:
+        unit, factor = UNIT_ALIASES[normalized]
+        return (factor, unit) if (factor, unit) != (1.0, label) else None
+
+    matches = [
+        (UNIT_ALIASES[match.group("unit")], _parse_quantity(match.group("qty")))
+        for match in _QUANTITY_RE.finditer(normalized)
+    ]
+    for preferred in ("kg", "마리", "상자"):
+        for (unit, factor), quantity in matches:
+            if unit == preferred and quantity is not None:
+                return quantity * factor, unit
+    return None
+
+
+def upgrade() -> None:
+    """기록된 수량으로 과거 가격 변환 (예: "10kg" 18,000원 → "kg" 1,800원)"""
+    bind = op.get_bind()
+    labels = [row[0] for row in bind.execute(sa.text("SELECT DISTINCT unit FROM market_prices"))]
+
+    for label in labels:
+        parsed = _parse_label(label)
+        if parsed is None:
+            continue
+        quantity, unit = parsed
+        bind.execute(
+            sa.text("""
+                UPDATE market_prices
+                SET price = ROUND(price / CAST(:quantity AS NUMERIC), 2), unit = :unit
+                WHERE unit = :label
+            """),
+            {"quantity": quantity, "unit": unit, "label": label}
+        )
+
+    # daily_avg_prices는 database/init.sql에서 만드는 materialized view - 있으면 변환한 가격으로 다시 계산
+    if bind.dialect.name == "postgresql":
+        op.execute("""
+            DO $$
+            BEGIN
+                IF EXISTS (SELECT 1 FROM pg_matviews WHERE matviewname = 'daily_avg_prices') THEN
+                    REFRESH MATERIALIZED VIEW daily_avg_prices;
+                END IF;
+            END
+            $$;
+        """)
+
+
+def downgrade() -> None:
+    """원래 규격 표기를 보존하지 않으므로 되돌리지 않음 (이후 수집도 표준 단위당 가격으로 저장)"""
+    pass
@@ -0,0 +1,29 @@
+"""수집 실행 종료 처리 선점 만료 시각
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """ingestion_runs.finishing_until 추가"""
+    
+    # 큐 모드에서 종료 처리를 선점(finishing)한 워커가 이 시각까지 끝내지 못하면 다른 워커가 다시 선점
+    # (기존 finishing 실행은 NULL이므로 바로 다시 선점 가능)
+    op.add_column('ingestion_runs', sa.Column('finishing_until', sa.TIMESTAMP(), nullable=True))
+
+
+def downgrade() -> None:
+    """컬럼 삭제"""
+    op.drop_column('ingestion_runs', 'finishing_until')
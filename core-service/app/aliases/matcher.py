@@ -1,14 +1,20 @@
 """품목 별칭 매칭 모듈"""
 import logging
-from typing import Optional
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 import Levenshtein
 
 from app.database.models import ItemAlias, Item
+from app.monitoring.metrics import record_alias_match
 
 
 logger = logging.getLogger(__name__)
 
+# match_items에서 한 번의 IN 쿼리로 조회할 최대 이름 수
+MATCH_CHUNK_SIZE = 1000
+
 
 class AliasMatcher:
     """
@@ -46,6 +52,7 @@ class AliasMatcher:
             logger.debug(
                 f"Exact match found: '{raw_name}' -> Item ID {exact_match}"
             )
+            record_alias_match("exact")
             return exact_match
         
         # 2. 유사도 기반 매칭
@@ -54,14 +61,93 @@ class AliasMatcher:
             logger.info(
                 f"Similar match found: '{raw_name}' -> Item ID {similar_match}"
             )
+            record_alias_match("similar")
             return similar_match
         
         # 3. 매칭 실패
         logger.warning(
             f"Unmatched item: '{raw_name}' from market {market_id}"
         )
+        record_alias_match("unmatched")
         return None
     
+    def match_items(
+        self,
+        keys: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], Optional[int]]:
+        """
+        여러 (원본 품목명, 시장 ID)를 한 번에 매핑 (수집 배치용)
+        
+        match_item과 같은 규칙(정확 매칭 → 유사도 매칭)을 쓰되, 중복 키는 한 번만 처리하고
+        정확 매칭은 시장별 IN 쿼리로, 유사도 매칭은 시장별 별칭 목록을 한 번만 조회해 비교합니다.
+        
+        Args:
+            keys: (원본 품목명, 시장 ID) 목록 (중복 허용)
+            
+        Returns:
+            {(원본 품목명, 시장 ID): Item ID 또는 None}
+        """
+        names_by_market: Dict[int, List[str]] = defaultdict(list)
+        for raw_name, market_id in dict.fromkeys(keys):
+            names_by_market[market_id].append(raw_name)
+        
+        results: Dict[Tuple[str, int], Optional[int]] = {}
+        for market_id, names in names_by_market.items():
+            # 1. 정확한 매칭 (시장별 IN 쿼리)
+            exact = self._find_exact_matches(names, market_id)
+            for raw_name in names:
+                item_id = exact.get(raw_name)
+                if item_id:
+                    record_alias_match("exact")
+                    results[(raw_name, market_id)] = item_id
+            
+            unresolved = [name for name in names if (name, market_id) not in results]
+            if not unresolved:
+                continue
+            
+            # 2. 유사도 기반 매칭 (시장 별칭 목록은 한 번만 조회)
+            aliases = self._load_market_aliases(market_id)
+            for raw_name in unresolved:
+                item_id = self._best_similar_match(raw_name, aliases)
+                if item_id:
+                    logger.info(
+                        f"Similar match found: '{raw_name}' -> Item ID {item_id}"
+                    )
+                    record_alias_match("similar")
+                else:
+                    # 3. 매칭 실패
+                    logger.warning(
+                        f"Unmatched item: '{raw_name}' from market {market_id}"
+                    )
+                    record_alias_match("unmatched")
+                results[(raw_name, market_id)] = item_id
+        
+        return results
+    
+    def _find_exact_matches(self, raw_names: List[str], market_id: int) -> Dict[str, int]:
+        """
+        정확한 매칭 일괄 조회
+        
+        Args:
+            raw_names: 원본 품목명 목록 (중복 없음)
+            market_id: 시장 ID
+            
+        Returns:
+            {원본 품목명: Item ID} (매칭된 이름만)
+        """
+        matches: Dict[str, int] = {}
+        for start in range(0, len(raw_names), MATCH_CHUNK_SIZE):
+            chunk = raw_names[start:start + MATCH_CHUNK_SIZE]
+            rows = self.db.execute(
+                select(ItemAlias.raw_name, ItemAlias.item_id).where(
+                    ItemAlias.market_id == market_id,
+                    ItemAlias.raw_name.in_(chunk)
+                )
+            ).all()
+            for raw_name, item_id in rows:
+                matches.setdefault(raw_name, item_id)
+        return matches
+    
     def _find_exact_match(self, raw_name: str, market_id: int) -> Optional[int]:
         """
         정확한 매칭 찾기
@@ -92,19 +178,43 @@ class AliasMatcher:
             매칭된 Item ID 또는 None
         """
         # 해당 시장의 모든 별칭 조회
-        aliases = self.db.query(ItemAlias).filter(
-            ItemAlias.market_id == market_id
-        ).all()
+        return self._best_similar_match(raw_name, self._load_market_aliases(market_id))
+    
+    def _load_market_aliases(self, market_id: int) -> List[Tuple[str, int]]:
+        """시장의 모든 별칭 (원본 품목명, Item ID) 조회"""
+        return [
+            (raw_name, item_id)
+            for raw_name, item_id in self.db.execute(
+                select(ItemAlias.raw_name, ItemAlias.item_id).where(
+                    ItemAlias.market_id == market_id
+                )
+            ).all()
+        ]
+    
+    def _best_similar_match(
+        self,
+        raw_name: str,
+        aliases: List[Tuple[str, int]]
+    ) -> Optional[int]:
+        """
+        별칭 목록 중 유사도가 가장 높은 Item ID (임계값 이상만)
         
+        Args:
+            raw_name: 원본 품목명
+            aliases: (별칭, Item ID) 목록
+            
+        Returns:
+            매칭된 Item ID 또는 None
+        """
         best_match = None
         best_similarity = 0.0
         
-        for alias in aliases:
-            similarity = self._calculate_similarity(raw_name, alias.raw_name)
+        for alias_name, item_id in aliases:
+            similarity = self._calculate_similarity(raw_name, alias_name)
             
             if similarity > best_similarity and similarity >= self.similarity_threshold:
                 best_similarity = similarity
-                best_match = alias.item_id
+                best_match = item_id
         
         if best_match:
             logger.debug(
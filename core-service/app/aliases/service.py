@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.aliases.matcher import AliasMatcher
 from app.aliases.schemas import AliasMatchResponse
+from app.monitoring.metrics import record_alias_match
 
 
 class AliasService:
@@ -27,6 +28,7 @@ class AliasService:
         # 정확한 매칭 시도
         exact_match = self.matcher._find_exact_match(raw_name, market_id)
         if exact_match:
+            record_alias_match("exact")
             return AliasMatchResponse(
                 item_id=exact_match,
                 matched=True,
@@ -36,6 +38,7 @@ class AliasService:
         # 유사도 기반 매칭
         similar_match = self.matcher._find_similar_match(raw_name, market_id)
         if similar_match:
+            record_alias_match("similar")
             return AliasMatchResponse(
                 item_id=similar_match,
                 matched=True,
@@ -43,6 +46,7 @@ class AliasService:
             )
         
         # 매칭 실패
+        record_alias_match("unmatched")
         return AliasMatchResponse(
             item_id=None,
             matched=False,
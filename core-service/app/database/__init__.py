@@ -1,11 +1,18 @@
 """데이터베이스 패키지"""
-from app.database.models import Base, Item, Market, MarketPrice, PriceRule, ItemAlias
+from app.database.models import Base, Item, Market, MarketPrice, PriceRule, ItemAlias, IngestionState, BackfillCheckpoint, PriceQuarantine, IngestionRun, IngestionRunAdapter, IngestionRunHook, IngestionDeadLetter, IngestionWatermark, IngestionJob
 from app.database.connection import engine, SessionLocal, get_db, init_db
 from app.database.item_repository import ItemRepository
 from app.database.market_repository import MarketRepository
 from app.database.price_repository import PriceRepository
 from app.database.price_rule_repository import PriceRuleRepository
 from app.database.alias_repository import AliasRepository
+from app.database.ingestion_state_repository import IngestionStateRepository
+from app.database.backfill_checkpoint_repository import BackfillCheckpointRepository
+from app.database.price_quarantine_repository import PriceQuarantineRepository
+from app.database.ingestion_run_repository import IngestionRunRepository
+from app.database.ingestion_dead_letter_repository import IngestionDeadLetterRepository
+from app.database.ingestion_watermark_repository import IngestionWatermarkRepository
+from app.database.ingestion_job_repository import IngestionJobRepository
 
 __all__ = [
     # Models
@@ -15,6 +22,15 @@ __all__ = [
     "MarketPrice",
     "PriceRule",
     "ItemAlias",
+    "IngestionState",
+    "BackfillCheckpoint",
+    "PriceQuarantine",
+    "IngestionRun",
+    "IngestionRunAdapter",
+    "IngestionRunHook",
+    "IngestionDeadLetter",
+    "IngestionWatermark",
+    "IngestionJob",
     # Connection
     "engine",
     "SessionLocal",
@@ -26,4 +42,11 @@ __all__ = [
     "PriceRepository",
     "PriceRuleRepository",
     "AliasRepository",
+    "IngestionStateRepository",
+    "BackfillCheckpointRepository",
+    "PriceQuarantineRepository",
+    "IngestionRunRepository",
+    "IngestionDeadLetterRepository",
+    "IngestionWatermarkRepository",
+    "IngestionJobRepository",
 ]
@@ -0,0 +1,63 @@
+"""백필 체크포인트 리포지토리"""
+from typing import Iterable, Set, Tuple
+from datetime import date
+from sqlalchemy.orm import Session
+from app.database.models import BackfillCheckpoint
+from app.database.base_repository import BaseRepository
+
+class BackfillCheckpointRepository(BaseRepository[BackfillCheckpoint]):
+    """백필 체크포인트 데이터 접근 레이어"""
+    
+    def __init__(self, db: Session):
+        super().__init__(BackfillCheckpoint, db)
+    
+    def get_completed_dates(self, adapter: str, start_date: date, end_date: date) -> Set[date]:
+        """기간 내 완료된 수집일 조회"""
+        rows = (
+            self.db.query(BackfillCheckpoint.target_date)
+            .filter(
+                BackfillCheckpoint.adapter == adapter,
+                BackfillCheckpoint.target_date >= start_date,
+                BackfillCheckpoint.target_date <= end_date
+            )
+            .all()
+        )
+        return {row.target_date for row in rows}
+    
+    def mark_completed(self, checkpoints: Iterable[Tuple[str, date, int]], commit: bool = True) -> int:
+        """
+        완료된 (어댑터, 수집일, 레코드 수) 기록
+        해당 날짜의 가격 저장과 같은 트랜잭션에서 호출 (이미 있으면 레코드 수만 갱신)
+        
+        Args:
+            checkpoints: (어댑터, 수집일, 레코드 수) 목록
+            commit: False면 커밋하지 않음 (호출 측에서 다른 저장과 한 트랜잭션으로 커밋)
+        
+        Returns:
+            기록한 체크포인트 수
+        """
+        count = 0
+        for adapter, target_date, record_count in checkpoints:
+            checkpoint = (
+                self.db.query(BackfillCheckpoint)
+                .filter(
+                    BackfillCheckpoint.adapter == adapter,
+                    BackfillCheckpoint.target_date == target_date
+                )
+                .first()
+            )
+            if checkpoint:
+                checkpoint.record_count = record_count
+            else:
+                self.db.add(BackfillCheckpoint(
+                    adapter=adapter,
+                    target_date=target_date,
+                    record_count=record_count
+                ))
+            count += 1
+        
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return count
@@ -0,0 +1,204 @@
+"""수집 실패 행 리포지토리"""
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from app.database.models import IngestionDeadLetter
+from app.database.base_repository import BaseRepository
+
+# 실패 행 상태
+STATUS_PENDING = "pending"
+STATUS_RESOLVED = "resolved"
+STATUS_DISCARDED = "discarded"
+
+class IngestionDeadLetterRepository(BaseRepository[IngestionDeadLetter]):
+    """수집 실패 행 데이터 접근 레이어"""
+
+    def __init__(self, db: Session):
+        super().__init__(IngestionDeadLetter, db)
+
+    def record(
+        self,
+        adapter: str,
+        target_date: date,
+        letters: List[dict],
+        payload_hash: Optional[str] = None,
+        commit: bool = True
+    ) -> int:
+        """
+        파싱/정규화에 실패한 행 저장
+        Data Ingestion 스케줄러/백필에서 사용
+
+        원본 조각은 JSON으로 저장하고, 같은 (어댑터, 수집일, 원본 조각)이 이미 있으면
+        새 행을 만들지 않고 occurrences만 늘린 뒤 다시 pending으로 둡니다.
+
+        Args:
+            adapter: 어댑터 이름
+            target_date: 수집일
+            letters: {stage, reason, record, error} 딕셔너리 리스트
+            payload_hash: 원본 응답 해시 (ingestion_state.payload_hash와 같은 값, 없으면 None)
+            commit: False면 커밋하지 않음 (호출 측에서 다른 저장과 한 트랜잭션으로 커밋)
+
+        Returns:
+            저장한 고유 행 수
+        """
+        if not letters:
+            return 0
+
+        target_date = _as_date(target_date)
+        serialized: Dict[str, tuple] = {}
+        for letter in letters:
+            record = dump_record(letter['record'])
+            serialized[_record_hash(record)] = (letter, record)
+
+        existing = {
+            entry.record_hash: entry
+            for entry in self.db.query(IngestionDeadLetter).filter(
+                IngestionDeadLetter.adapter == adapter,
+                IngestionDeadLetter.target_date == target_date,
+                IngestionDeadLetter.record_hash.in_(list(serialized))
+            )
+        }
+
+        now = datetime.now()
+        for record_hash, (letter, record) in serialized.items():
+            entry = existing.get(record_hash)
+            if entry:
+                entry.reason = letter['reason']
+                entry.error = letter.get('error')
+                entry.payload_hash = payload_hash or entry.payload_hash
+                entry.occurrences += 1
+                entry.last_seen_at = now
+                entry.status = STATUS_PENDING
+            else:
+                self.db.add(IngestionDeadLetter(
+                    adapter=adapter,
+                    stage=letter['stage'],
+                    reason=letter['reason'],
+                    target_date=target_date,
+                    payload_hash=payload_hash,
+                    record=record,
+                    record_hash=record_hash,
+                    error=letter.get('error')
+                ))
+
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return len(serialized)
+
+    def get_pending(
+        self,
+        adapter: Optional[str] = None,
+        stage: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None
+    ) -> List[IngestionDeadLetter]:
+        """
+        재처리 대기 중인 실패 행 조회 (수집일, ID 순)
+
+        Args:
+            adapter: 어댑터 이름 필터
+            stage: 실패 단계 필터 (parse / normalize)
+            start_date: 수집일 시작 (포함)
+            end_date: 수집일 끝 (포함)
+            limit: 최대 행 수
+        """
+        query = self.db.query(IngestionDeadLetter).filter(IngestionDeadLetter.status == STATUS_PENDING)
+        if adapter:
+            query = query.filter(IngestionDeadLetter.adapter == adapter)
+        if stage:
+            query = query.filter(IngestionDeadLetter.stage == stage)
+        if start_date:
+            query = query.filter(IngestionDeadLetter.target_date >= start_date)
+        if end_date:
+            query = query.filter(IngestionDeadLetter.target_date <= end_date)
+        query = query.order_by(IngestionDeadLetter.target_date, IngestionDeadLetter.id)
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+
+    def get_pending_counts(self) -> List[Dict]:
+        """어댑터/단계/사유별 재처리 대기 행 수"""
+        rows = (
+            self.db.query(
+                IngestionDeadLetter.adapter,
+                IngestionDeadLetter.stage,
+                IngestionDeadLetter.reason,
+                func.count(IngestionDeadLetter.id),
+                func.min(IngestionDeadLetter.target_date),
+                func.max(IngestionDeadLetter.target_date),
+            )
+            .filter(IngestionDeadLetter.status == STATUS_PENDING)
+            .group_by(IngestionDeadLetter.adapter, IngestionDeadLetter.stage, IngestionDeadLetter.reason)
+            .order_by(IngestionDeadLetter.adapter, IngestionDeadLetter.stage, IngestionDeadLetter.reason)
+            .all()
+        )
+        return [
+            {
+                'adapter': adapter,
+                'stage': stage,
+                'reason': reason,
+                'count': count,
+                'first_date': first_date,
+                'last_date': last_date,
+            }
+            for adapter, stage, reason, count, first_date, last_date in rows
+        ]
+
+    def mark_replayed(self, resolved: Iterable[int], failures: Dict[int, dict]) -> None:
+        """
+        재처리 결과 기록
+
+        Args:
+            resolved: 저장(또는 격리)까지 끝난 실패 행 ID
+            failures: 여전히 실패하는 행 {ID: {reason, error}} - pending으로 두고 사유 갱신
+        """
+        now = datetime.now()
+        resolved = set(resolved)
+        ids = resolved | set(failures)
+        if not ids:
+            return
+
+        for entry in self.db.query(IngestionDeadLetter).filter(IngestionDeadLetter.id.in_(list(ids))):
+            entry.attempts += 1
+            entry.replayed_at = now
+            if entry.id in resolved:
+                entry.status = STATUS_RESOLVED
+            else:
+                entry.reason = failures[entry.id]['reason']
+                entry.error = failures[entry.id].get('error')
+
+        self.db.commit()
+
+    def discard(self, ids: Iterable[int]) -> int:
+        """실패 행 폐기 (재처리하지 않음)"""
+        entries = (
+            self.db.query(IngestionDeadLetter)
+            .filter(
+                IngestionDeadLetter.id.in_(list(ids)),
+                IngestionDeadLetter.status == STATUS_PENDING
+            )
+            .all()
+        )
+        for entry in entries:
+            entry.status = STATUS_DISCARDED
+        self.db.commit()
+        return len(entries)
+
+
+def dump_record(record) -> str:
+    """원본 조각 JSON (공백 없이, 키 정렬)"""
+    return json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def _record_hash(record: str) -> str:
+    return hashlib.sha256(record.encode('utf-8')).hexdigest()
+
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
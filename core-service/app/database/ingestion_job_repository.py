@@ -0,0 +1,263 @@
+"""수집 작업 큐 리포지토리"""
+import json
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, func, or_
+from app.database.models import IngestionJob, IngestionRun
+from app.database.base_repository import BaseRepository
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# 아직 끝나지 않은 작업 상태
+OPEN_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+class IngestionJobRepository(BaseRepository[IngestionJob]):
+    """
+    수집 작업 큐 데이터 접근 레이어
+
+    PostgreSQL에서는 SELECT ... FOR UPDATE SKIP LOCKED로 여러 워커가 같은 작업을 동시에 가져가지 않습니다.
+    가져간 작업은 locked_until까지 다른 워커에게 보이지 않으며, 그 전에 complete/fail하지 못하면
+    (워커 종료, 응답 없음) 다른 워커가 다시 가져갑니다 (at-least-once, 저장은 diff_upsert라 다시 실행해도 결과 동일).
+    """
+
+    def __init__(self, db: Session):
+        super().__init__(IngestionJob, db)
+
+    def enqueue(
+        self,
+        run_id: Optional[int],
+        jobs: Iterable[Tuple[str, date]],
+        max_attempts: int = 3
+    ) -> int:
+        """
+        (어댑터, 수집일) 작업 추가
+        Data Ingestion 스케줄러의 큐 모드에서 사용
+
+        같은 (어댑터, 수집일)이 아직 대기/실행 중이면 추가하지 않습니다 (이전 실행이 밀려 있어도 중복 수집 없음).
+
+        Returns:
+            추가한 작업 수
+        """
+        jobs = list(dict.fromkeys(jobs))
+        if not jobs:
+            return 0
+
+        open_jobs = set(
+            self.db.query(IngestionJob.adapter, IngestionJob.target_date).filter(
+                IngestionJob.status.in_(OPEN_STATUSES),
+                IngestionJob.adapter.in_({adapter for adapter, _day in jobs})
+            )
+        )
+        now = datetime.now()
+        added = 0
+        for adapter, target_date in jobs:
+            if (adapter, target_date) in open_jobs:
+                continue
+            self.db.add(IngestionJob(
+                run_id=run_id,
+                adapter=adapter,
+                target_date=target_date,
+                status=STATUS_QUEUED,
+                attempts=0,
+                max_attempts=max_attempts,
+                available_at=now
+            ))
+            added += 1
+        self.db.commit()
+        return added
+
+    def claim(
+        self,
+        worker: str,
+        visibility_seconds: float,
+        adapters: Optional[Sequence[str]] = None
+    ) -> Optional[IngestionJob]:
+        """
+        실행할 작업 하나 가져오기 (대기 중이거나 가시성 제한이 지난 작업, 오래된 순)
+
+        가시성 제한이 지난 작업이 이미 max_attempts번 시도되었으면 failed로 끝내고 다음 작업을 찾습니다.
+
+        Args:
+            worker: 워커 식별자 (locked_by)
+            visibility_seconds: 가시성 제한 (초) - 이 시간 안에 complete/fail해야 함
+            adapters: 이 워커가 실행할 수 있는 어댑터 (None이면 전체)
+
+        Returns:
+            가져간 작업 (status=running, attempts 증가) 또는 None
+        """
+        while True:
+            now = datetime.now()
+            query = self.db.query(IngestionJob).filter(or_(
+                and_(IngestionJob.status == STATUS_QUEUED, IngestionJob.available_at <= now),
+                and_(IngestionJob.status == STATUS_RUNNING, IngestionJob.locked_until < now),
+            ))
+            if adapters is not None:
+                query = query.filter(IngestionJob.adapter.in_(list(adapters)))
+            job = (
+                query.order_by(IngestionJob.available_at, IngestionJob.id)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if job is None:
+                self.db.commit()
+                return None
+
+            if job.status == STATUS_RUNNING and job.attempts >= job.max_attempts:
+                job.status = STATUS_FAILED
+                job.result = None
+                job.error_class = "VisibilityTimeout"
+                job.error_message = (
+                    f"{job.locked_by} did not finish attempt {job.attempts} before {job.locked_until}"
+                )
+                job.locked_by = None
+                job.locked_until = None
+                job.finished_at = now
+                self.db.commit()
+                continue
+
+            job.status = STATUS_RUNNING
+            job.attempts += 1
+            job.locked_by = worker
+            job.locked_until = now + timedelta(seconds=visibility_seconds)
+            job.started_at = now
+            self.db.commit()
+            return job
+
+    def complete(self, job_id: int, worker: str, result: dict) -> Optional[str]:
+        """
+        작업 완료 기록
+
+        Returns:
+            done (가시성 제한이 지나 다른 워커가 가져간 작업이면 None - 결과는 버림)
+        """
+        job = self._locked(job_id, worker)
+        if job is None:
+            return None
+        job.status = STATUS_DONE
+        self._finish(job, result)
+        self.db.commit()
+        return job.status
+
+    def fail(self, job_id: int, worker: str, result: dict, retry_seconds: float) -> Optional[str]:
+        """
+        작업 실패 기록 (시도 횟수가 남았으면 retry_seconds * 2^(시도-1)초 뒤 다시 대기열로)
+
+        Returns:
+            queued (재시도 대기) / failed (시도 횟수 소진) / None (다른 워커가 가져간 작업)
+        """
+        job = self._locked(job_id, worker)
+        if job is None:
+            return None
+        if job.attempts < job.max_attempts:
+            job.status = STATUS_QUEUED
+            job.available_at = datetime.now() + timedelta(seconds=retry_seconds * 2 ** (job.attempts - 1))
+            job.locked_by = None
+            job.locked_until = None
+            job.result = _dump_result(result)
+            job.error_class = result.get("error_class")
+            job.error_message = result.get("error")
+        else:
+            job.status = STATUS_FAILED
+            self._finish(job, result)
+        self.db.commit()
+        return job.status
+
+    def count_open(self, run_id: int) -> int:
+        """실행의 대기/실행 중 작업 수"""
+        return (
+            self.db.query(func.count(IngestionJob.id))
+            .filter(IngestionJob.run_id == run_id, IngestionJob.status.in_(OPEN_STATUSES))
+            .scalar()
+        )
+
+    def get_run_jobs(self, run_id: int) -> List[IngestionJob]:
+        """실행의 작업 (어댑터, 수집일 순)"""
+        return (
+            self.db.query(IngestionJob)
+            .filter(IngestionJob.run_id == run_id)
+            .order_by(IngestionJob.adapter, IngestionJob.target_date, IngestionJob.id)
+            .all()
+        )
+
+    def get_finished_run_ids(self) -> List[int]:
+        """
+        모든 작업이 끝났지만 아직 종료 기록을 하지 않은 실행
+        (마지막 작업을 끝낸 워커가 종료 기록 전에 멈췄거나, 종료 처리를 선점한 워커가 선점 만료 전에 끝내지 못한 경우)
+        """
+        now = datetime.now()
+        open_jobs = func.sum(case((IngestionJob.status.in_(OPEN_STATUSES), 1), else_=0))
+        rows = (
+            self.db.query(IngestionJob.run_id)
+            .join(IngestionRun, IngestionRun.id == IngestionJob.run_id)
+            .filter(or_(
+                IngestionRun.status == "running",
+                and_(
+                    IngestionRun.status == "finishing",
+                    or_(IngestionRun.finishing_until.is_(None), IngestionRun.finishing_until < now)
+                ),
+            ))
+            .group_by(IngestionJob.run_id)
+            .having(open_jobs == 0)
+            .order_by(IngestionJob.run_id)
+            .all()
+        )
+        return [run_id for (run_id,) in rows]
+
+    def get_status_counts(self) -> List[Dict]:
+        """어댑터/상태별 작업 수 (수집일 범위 포함)"""
+        rows = (
+            self.db.query(
+                IngestionJob.adapter,
+                IngestionJob.status,
+                func.count(IngestionJob.id),
+                func.min(IngestionJob.target_date),
+                func.max(IngestionJob.target_date),
+            )
+            .group_by(IngestionJob.adapter, IngestionJob.status)
+            .order_by(IngestionJob.adapter, IngestionJob.status)
+            .all()
+        )
+        return [
+            {
+                "adapter": adapter,
+                "status": status,
+                "count": count,
+                "first_date": first_date,
+                "last_date": last_date,
+            }
+            for adapter, status, count, first_date, last_date in rows
+        ]
+
+    def _locked(self, job_id: int, worker: str) -> Optional[IngestionJob]:
+        """이 워커가 아직 가지고 있는 작업 (행 잠금)"""
+        job = (
+            self.db.query(IngestionJob)
+            .filter(
+                IngestionJob.id == job_id,
+                IngestionJob.status == STATUS_RUNNING,
+                IngestionJob.locked_by == worker
+            )
+            .with_for_update()
+            .first()
+        )
+        if job is None:
+            self.db.rollback()
+        return job
+
+    @staticmethod
+    def _finish(job: IngestionJob, result: dict):
+        job.result = _dump_result(result)
+        job.error_class = result.get("error_class")
+        job.error_message = result.get("error")
+        job.locked_by = None
+        job.locked_until = None
+        job.finished_at = datetime.now()
+
+
+def _dump_result(result: dict) -> str:
+    return json.dumps(result, ensure_ascii=False, default=str)
@@ -0,0 +1,287 @@
+"""수집 실행 기록 리포지토리"""
+from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, case, func, or_
+from app.database.models import IngestionRun, IngestionRunAdapter, IngestionRunHook
+from app.database.base_repository import BaseRepository
+
+# 어댑터 기록의 단계별 소요 시간 컬럼 (스케줄러 결과의 timings 키 → 컬럼)
+STAGE_COLUMNS = {
+    "fetch": "fetch_seconds",
+    "normalize": "normalize_seconds",
+    "validate": "validate_seconds",
+    "write": "write_seconds",
+}
+
+# 어댑터 기록의 행 수 컬럼 (스케줄러 결과 키 → 컬럼)
+ROW_COLUMNS = {
+    "fetched": "raw_rows",
+    "invalid": "invalid_rows",
+    "unmatched": "unmatched_rows",
+    "normalized": "normalized_rows",
+    "quarantined": "quarantined_rows",
+    "inserted": "inserted_rows",
+    "updated": "updated_rows",
+    "unchanged_rows": "unchanged_rows",
+    "dead_letters": "dead_letter_rows",
+}
+
+# 실패로 집계하는 어댑터 상태
+FAILED_STATUSES = ("failed", "timeout")
+
+class IngestionRunRepository(BaseRepository[IngestionRun]):
+    """수집 실행 기록 데이터 접근 레이어"""
+
+    def __init__(self, db: Session):
+        super().__init__(IngestionRun, db)
+
+    def start_run(self, trigger: str, adapter_count: int, started_at: datetime) -> IngestionRun:
+        """실행 시작 기록 (status=running)"""
+        run = IngestionRun(
+            trigger=trigger,
+            status="running",
+            started_at=started_at,
+            adapter_count=adapter_count
+        )
+        self.db.add(run)
+        self.db.commit()
+        return run
+
+    def claim_finish(self, run_id: int, lease_seconds: float) -> Optional[IngestionRun]:
+        """
+        종료 기록할 실행 선점 (running → finishing)
+        큐 모드에서 여러 워커가 같은 실행을 동시에 종료 기록하지 않도록 한 워커만 성공
+
+        선점은 lease_seconds 동안 유효하며, 그 안에 finish_run하지 못한 실행(워커 종료 등)은
+        다른 워커가 다시 선점합니다. 반환한 실행의 finishing_until을 finish_run/release_finish에
+        넘겨야 하며, 다시 선점된 뒤에는 이전 선점으로 기록하거나 해제할 수 없습니다.
+
+        Returns:
+            선점한 IngestionRun (다른 워커가 선점 중이거나 종료된 실행이면 None)
+        """
+        now = datetime.now()
+        claimed = (
+            self.db.query(IngestionRun)
+            .filter(IngestionRun.id == run_id, _claimable(now))
+            .update(
+                {
+                    IngestionRun.status: "finishing",
+                    IngestionRun.finishing_until: now + timedelta(seconds=lease_seconds),
+                },
+                synchronize_session=False
+            )
+        )
+        self.db.commit()
+        return self.get_by_id(run_id) if claimed else None
+
+    def release_finish(self, run_id: int, lease_until: datetime) -> bool:
+        """
+        종료 기록 선점 해제 (finishing → running)
+        선점한 워커가 종료 기록에 실패했을 때 다른 워커가 바로 다시 처리하도록 되돌림
+
+        Args:
+            run_id: 실행 ID
+            lease_until: claim_finish로 받은 선점 만료 시각 (다른 워커가 다시 선점했으면 해제하지 않음)
+
+        Returns:
+            되돌렸는지 (이미 종료되었거나 다른 워커가 선점한 실행이면 False)
+        """
+        released = (
+            self.db.query(IngestionRun)
+            .filter(
+                IngestionRun.id == run_id,
+                IngestionRun.status == "finishing",
+                IngestionRun.finishing_until == lease_until
+            )
+            .update(
+                {IngestionRun.status: "running", IngestionRun.finishing_until: None},
+                synchronize_session=False
+            )
+        )
+        self.db.commit()
+        return bool(released)
+
+    def finish_run(
+        self,
+        run_id: int,
+        summary: dict,
+        lease_until: Optional[datetime] = None
+    ) -> Optional[IngestionRun]:
+        """
+        실행 종료 기록 (합계 갱신 + 어댑터별 기록 추가)
+        Data Ingestion 스케줄러의 run_collection 요약을 그대로 받음
+
+        합계 갱신은 실행이 아직 기록 가능한 상태일 때만 반영되는 조건부 UPDATE이며,
+        반영되지 않으면 어댑터별/훅 기록도 추가하지 않습니다 (한 실행을 두 번 종료 기록하지 않음).
+
+        Args:
+            run_id: start_run으로 만든 실행 ID
+            summary: status, wall_seconds, successful, unchanged, failed, rows_*,
+                adapters(어댑터별 결과: status, target_date, timings, 행 수, payload_bytes,
+                error_class, error), hooks(post-commit 훅 결과: hook, status, touched_keys,
+                affected, seconds, error_class, error, 선택) 포함
+            lease_until: 큐 모드에서 claim_finish로 받은 선점 만료 시각
+                (주어지면 같은 선점이 아직 유효한 finishing 실행만, 없으면 running 실행만 기록)
+
+        Returns:
+            갱신한 IngestionRun (없거나 이미 종료/선점 만료된 실행이면 None)
+        """
+        now = datetime.now()
+        if lease_until is None:
+            recordable = IngestionRun.status == "running"
+        else:
+            recordable = and_(
+                IngestionRun.status == "finishing",
+                IngestionRun.finishing_until == lease_until,
+                IngestionRun.finishing_until > now
+            )
+        updated = (
+            self.db.query(IngestionRun)
+            .filter(IngestionRun.id == run_id, recordable)
+            .update(
+                {
+                    IngestionRun.status: summary["status"],
+                    IngestionRun.finished_at: now,
+                    IngestionRun.finishing_until: None,
+                    IngestionRun.wall_seconds: summary["wall_seconds"],
+                    IngestionRun.successful: summary["successful"],
+                    IngestionRun.unchanged: summary["unchanged"],
+                    IngestionRun.failed: summary["failed"],
+                    IngestionRun.rows_inserted: summary["rows_inserted"],
+                    IngestionRun.rows_updated: summary["rows_updated"],
+                    IngestionRun.rows_unchanged: summary["rows_unchanged"],
+                    IngestionRun.rows_quarantined: summary.get("rows_quarantined", 0),
+                },
+                synchronize_session=False
+            )
+        )
+        if not updated:
+            self.db.rollback()
+            return None
+
+        for result in summary["adapters"]:
+            timings = result.get("timings", {})
+            self.db.add(IngestionRunAdapter(
+                run_id=run_id,
+                adapter=result["adapter"],
+                status=result["status"],
+                target_date=result.get("target_date"),
+                total_seconds=result.get("total_seconds"),
+                payload_bytes=result.get("payload_bytes", 0),
+                error_class=result.get("error_class"),
+                error_message=result.get("error"),
+                **{column: timings.get(stage) for stage, column in STAGE_COLUMNS.items()},
+                **{column: result.get(key, 0) for key, column in ROW_COLUMNS.items()},
+            ))
+
+        for hook in summary.get("hooks", []):
+            self.db.add(IngestionRunHook(
+                run_id=run_id,
+                hook=hook["hook"],
+                status=hook["status"],
+                touched_keys=hook.get("touched_keys", 0),
+                affected=hook.get("affected", 0),
+                seconds=hook.get("seconds"),
+                error_class=hook.get("error_class"),
+                error_message=hook.get("error"),
+            ))
+
+        self.db.commit()
+        return self.get_by_id(run_id)
+
+    def get_run(self, run_id: int) -> Optional[IngestionRun]:
+        """실행 기록 조회 (어댑터별/훅 기록 포함)"""
+        return (
+            self.db.query(IngestionRun)
+            .options(selectinload(IngestionRun.adapters), selectinload(IngestionRun.hooks))
+            .filter(IngestionRun.id == run_id)
+            .first()
+        )
+
+    def get_recent_runs(
+        self,
+        limit: int = 20,
+        status: Optional[str] = None,
+        adapter: Optional[str] = None
+    ) -> List[IngestionRun]:
+        """
+        최근 실행 기록 조회 (최신순, 어댑터별 기록 포함)
+
+        Args:
+            limit: 최대 실행 수
+            status: 실행 상태 필터
+            adapter: 이 어댑터가 포함된 실행만
+        """
+        query = self.db.query(IngestionRun).options(
+            selectinload(IngestionRun.adapters),
+            selectinload(IngestionRun.hooks)
+        )
+        if status:
+            query = query.filter(IngestionRun.status == status)
+        if adapter:
+            query = query.filter(
+                IngestionRun.adapters.any(IngestionRunAdapter.adapter == adapter)
+            )
+        return query.order_by(IngestionRun.started_at.desc(), IngestionRun.id.desc()).limit(limit).all()
+
+    def get_stage_stats(self, since: datetime) -> List[Dict]:
+        """
+        어댑터별 단계 소요 시간 통계 (평균/최대)
+
+        Args:
+            since: 이 시각 이후 시작한 실행만 집계
+
+        Returns:
+            어댑터별 {adapter, runs, failed, payload_bytes, stages: {단계: {avg, max}}} 리스트
+        """
+        stage_columns = [getattr(IngestionRunAdapter, column) for column in STAGE_COLUMNS.values()]
+        rows = (
+            self.db.query(
+                IngestionRunAdapter.adapter,
+                func.count(IngestionRunAdapter.id),
+                func.sum(case((IngestionRunAdapter.status.in_(FAILED_STATUSES), 1), else_=0)),
+                func.sum(IngestionRunAdapter.payload_bytes),
+                *(func.avg(column) for column in stage_columns),
+                *(func.max(column) for column in stage_columns),
+            )
+            .join(IngestionRun, IngestionRun.id == IngestionRunAdapter.run_id)
+            .filter(IngestionRun.started_at >= since)
+            .group_by(IngestionRunAdapter.adapter)
+            .order_by(IngestionRunAdapter.adapter)
+            .all()
+        )
+
+        stages = list(STAGE_COLUMNS)
+        stats = []
+        for adapter, runs, failed, payload_bytes, *values in rows:
+            averages, maxima = values[:len(stages)], values[len(stages):]
+            stats.append({
+                "adapter": adapter,
+                "runs": runs,
+                "failed": int(failed or 0),
+                "payload_bytes": int(payload_bytes or 0),
+                "stages": {
+                    stage: {
+                        "avg": _seconds(average),
+                        "max": _seconds(maximum),
+                    }
+                    for stage, average, maximum in zip(stages, averages, maxima)
+                },
+            })
+        return stats
+
+
+def _seconds(value) -> Optional[float]:
+    return round(float(value), 3) if value is not None else None
+
+
+def _claimable(now: datetime):
+    """종료 기록을 선점할 수 있는 실행 조건 (running, 또는 선점이 만료된 finishing)"""
+    return or_(
+        IngestionRun.status == "running",
+        and_(
+            IngestionRun.status == "finishing",
+            or_(IngestionRun.finishing_until.is_(None), IngestionRun.finishing_until < now)
+        ),
+    )
@@ -0,0 +1,58 @@
+"""수집 상태 리포지토리"""
+from typing import Optional
+from datetime import date
+from sqlalchemy.orm import Session
+from app.database.models import IngestionState
+from app.database.base_repository import BaseRepository
+
+class IngestionStateRepository(BaseRepository[IngestionState]):
+    """수집 상태 데이터 접근 레이어"""
+    
+    def __init__(self, db: Session):
+        super().__init__(IngestionState, db)
+    
+    def get_state(self, adapter: str, target_date: date) -> Optional[IngestionState]:
+        """어댑터/수집일의 수집 상태 조회"""
+        return (
+            self.db.query(IngestionState)
+            .filter(
+                IngestionState.adapter == adapter,
+                IngestionState.target_date == target_date
+            )
+            .first()
+        )
+    
+    def get_payload_hash(self, adapter: str, target_date: date) -> Optional[str]:
+        """마지막으로 저장까지 완료한 원본 데이터 해시 조회"""
+        state = self.get_state(adapter, target_date)
+        return state.payload_hash if state else None
+    
+    def save_payload_hash(
+        self,
+        adapter: str,
+        target_date: date,
+        payload_hash: str,
+        record_count: int,
+        commit: bool = True
+    ) -> IngestionState:
+        """
+        원본 데이터 해시 저장 (있으면 갱신)
+        저장(bulk_insert)이 성공한 뒤에만 호출 (commit=False면 가격 저장과 같은 트랜잭션으로 호출 측에서 커밋)
+        """
+        state = self.get_state(adapter, target_date)
+        if state:
+            state.payload_hash = payload_hash
+            state.record_count = record_count
+        else:
+            state = IngestionState(
+                adapter=adapter,
+                target_date=target_date,
+                payload_hash=payload_hash,
+                record_count=record_count
+            )
+            self.db.add(state)
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return state
@@ -0,0 +1,54 @@
+"""수집 워터마크 리포지토리"""
+from typing import Dict, Optional
+from datetime import date
+from sqlalchemy.orm import Session
+from app.database.models import IngestionWatermark
+from app.database.base_repository import BaseRepository
+
+class IngestionWatermarkRepository(BaseRepository[IngestionWatermark]):
+    """수집 워터마크 데이터 접근 레이어"""
+    
+    def __init__(self, db: Session):
+        super().__init__(IngestionWatermark, db)
+    
+    def get_watermark(self, adapter: str) -> Optional[date]:
+        """어댑터의 마지막 완료 수집일 (없으면 None)"""
+        watermark = self._get(adapter)
+        return watermark.last_success_date if watermark else None
+    
+    def get_watermarks(self) -> Dict[str, date]:
+        """전체 어댑터의 마지막 완료 수집일"""
+        return {
+            watermark.adapter: watermark.last_success_date
+            for watermark in self.db.query(IngestionWatermark).all()
+        }
+    
+    def advance(self, adapter: str, last_success_date: date, run_id: Optional[int] = None) -> date:
+        """
+        워터마크 전진 (기존 값보다 뒤일 때만 갱신)
+        Data Ingestion 스케줄러에서 해당 수집일까지의 저장이 모두 커밋된 뒤에 호출
+        
+        Returns:
+            갱신 후 워터마크
+        """
+        watermark = self._get(adapter)
+        if watermark is None:
+            self.db.add(IngestionWatermark(
+                adapter=adapter,
+                last_success_date=last_success_date,
+                run_id=run_id
+            ))
+        elif last_success_date > watermark.last_success_date:
+            watermark.last_success_date = last_success_date
+            watermark.run_id = run_id
+        else:
+            return watermark.last_success_date
+        self.db.commit()
+        return last_success_date
+    
+    def _get(self, adapter: str) -> Optional[IngestionWatermark]:
+        return (
+            self.db.query(IngestionWatermark)
+            .filter(IngestionWatermark.adapter == adapter)
+            .first()
+        )
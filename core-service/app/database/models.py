@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DECIMAL, ForeignKey, TIMESTAMP, Boolean, Index, UniqueConstraint
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Date, DECIMAL, ForeignKey, TIMESTAMP, Boolean, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -214,3 +214,237 @@ class MonthlyPrice(Base):
         Index('idx_monthly_prices_item_period', 'item_id', 'year', 'month'),
         UniqueConstraint('item_id', 'year', 'month', name='uq_item_year_month'),
     )
+
+
+# 데이터 수집 상태 모델
+
+class IngestionState(Base):
+    """수집 상태 테이블 (어댑터/수집일별 마지막 원본 데이터 해시)"""
+    __tablename__ = "ingestion_state"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    adapter = Column(String(100), nullable=False)
+    target_date = Column(Date, nullable=False)
+    payload_hash = Column(String(64), nullable=False)
+    record_count = Column(Integer, nullable=False, server_default='0')
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    
+    # 유니크 제약
+    __table_args__ = (
+        UniqueConstraint('adapter', 'target_date', name='uq_ingestion_state_adapter_date'),
+    )
+
+
+class BackfillCheckpoint(Base):
+    """백필 체크포인트 테이블 (저장까지 완료한 어댑터/수집일)"""
+    __tablename__ = "backfill_checkpoints"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    adapter = Column(String(100), nullable=False)
+    target_date = Column(Date, nullable=False)
+    record_count = Column(Integer, nullable=False, server_default='0')
+    completed_at = Column(TIMESTAMP, server_default=func.now())
+    
+    # 유니크 제약
+    __table_args__ = (
+        UniqueConstraint('adapter', 'target_date', name='uq_backfill_checkpoint_adapter_date'),
+    )
+
+
+class PriceQuarantine(Base):
+    """가격 격리 테이블 (최근 가격 분포에서 크게 벗어나 저장하지 않은 수집 가격)"""
+    __tablename__ = "price_quarantine"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    item_id = Column(Integer, ForeignKey("items.id"), nullable=False)
+    market_id = Column(Integer, ForeignKey("markets.id"), nullable=False)
+    date = Column(Date, nullable=False)
+    price = Column(DECIMAL(10, 2), nullable=False)
+    unit = Column(String(20), nullable=False)
+    origin = Column(String(100))
+    source = Column(String(100))
+    baseline_median = Column(DECIMAL(10, 2), nullable=False)  # 최근 가격 중앙값
+    baseline_mad = Column(DECIMAL(10, 2), nullable=False)     # 최근 가격 중앙값 절대 편차
+    sample_count = Column(Integer, nullable=False)            # 기준 분포의 가격 수
+    score = Column(DECIMAL(10, 2), nullable=False)            # 수정 Z 점수 (|0.6745 * 편차 / MAD|)
+    reason = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False, server_default='pending')  # pending / released / discarded
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    reviewed_at = Column(TIMESTAMP)
+    
+    # 인덱스 및 유니크 제약
+    __table_args__ = (
+        Index('idx_price_quarantine_status_date', 'status', 'date'),
+        UniqueConstraint('item_id', 'market_id', 'date', name='uq_quarantine_item_market_date'),
+    )
+
+
+class IngestionRun(Base):
+    """수집 실행 기록 테이블 (스케줄러 run_collection 1회)"""
+    __tablename__ = "ingestion_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    trigger = Column(String(20), nullable=False)                        # schedule / manual / replay
+    status = Column(String(20), nullable=False, server_default='running')  # running / finishing / success / partial / failed
+    started_at = Column(TIMESTAMP, nullable=False)
+    finished_at = Column(TIMESTAMP)
+    finishing_until = Column(TIMESTAMP)                                 # 큐 모드 종료 처리 선점 만료 시각 (finishing)
+    wall_seconds = Column(DECIMAL(10, 3))
+    adapter_count = Column(Integer, nullable=False, server_default='0')
+    successful = Column(Integer, nullable=False, server_default='0')
+    unchanged = Column(Integer, nullable=False, server_default='0')
+    failed = Column(Integer, nullable=False, server_default='0')
+    rows_inserted = Column(Integer, nullable=False, server_default='0')
+    rows_updated = Column(Integer, nullable=False, server_default='0')
+    rows_unchanged = Column(Integer, nullable=False, server_default='0')
+    rows_quarantined = Column(Integer, nullable=False, server_default='0')
+    
+    # 관계
+    adapters = relationship(
+        "IngestionRunAdapter",
+        back_populates="run",
+        cascade="all, delete-orphan",
+        order_by="IngestionRunAdapter.id"
+    )
+    hooks = relationship(
+        "IngestionRunHook",
+        back_populates="run",
+        cascade="all, delete-orphan",
+        order_by="IngestionRunHook.id"
+    )
+    
+    # 인덱스
+    __table_args__ = (
+        Index('idx_ingestion_runs_started_at', 'started_at'),
+    )
+
+
+class IngestionRunAdapter(Base):
+    """수집 실행의 어댑터별 기록 테이블 (단계별 소요 시간, 행 수, 오류)"""
+    __tablename__ = "ingestion_run_adapters"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey("ingestion_runs.id", ondelete="CASCADE"), nullable=False)
+    adapter = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False)  # success / unchanged / empty / failed / timeout
+    target_date = Column(Date)
+    
+    # 단계별 소요 시간 (초, 실행하지 않은 단계는 NULL)
+    fetch_seconds = Column(DECIMAL(10, 3))
+    normalize_seconds = Column(DECIMAL(10, 3))
+    validate_seconds = Column(DECIMAL(10, 3))
+    write_seconds = Column(DECIMAL(10, 3))
+    total_seconds = Column(DECIMAL(10, 3))
+    
+    # 행 수
+    raw_rows = Column(Integer, nullable=False, server_default='0')
+    invalid_rows = Column(Integer, nullable=False, server_default='0')
+    unmatched_rows = Column(Integer, nullable=False, server_default='0')
+    normalized_rows = Column(Integer, nullable=False, server_default='0')
+    quarantined_rows = Column(Integer, nullable=False, server_default='0')
+    inserted_rows = Column(Integer, nullable=False, server_default='0')
+    updated_rows = Column(Integer, nullable=False, server_default='0')
+    unchanged_rows = Column(Integer, nullable=False, server_default='0')
+    dead_letter_rows = Column(Integer, nullable=False, server_default='0')  # ingestion_dead_letters에 저장한 실패 행
+    
+    payload_bytes = Column(BigInteger, nullable=False, server_default='0')  # 수신한 응답 본문 크기
+    error_class = Column(String(100))
+    error_message = Column(Text)
+    
+    # 관계
+    run = relationship("IngestionRun", back_populates="adapters")
+    
+    # 인덱스
+    __table_args__ = (
+        Index('idx_ingestion_run_adapters_run', 'run_id'),
+        Index('idx_ingestion_run_adapters_adapter', 'adapter', 'run_id'),
+    )
+
+
+class IngestionRunHook(Base):
+    """수집 실행의 post-commit 훅 기록 테이블 (뷰/캐시 갱신 소요 시간, 오류)"""
+    __tablename__ = "ingestion_run_hooks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey("ingestion_runs.id", ondelete="CASCADE"), nullable=False)
+    hook = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False)                     # success / skipped / failed
+    touched_keys = Column(Integer, nullable=False, server_default='0')  # 전달한 (품목, 시장, 날짜) 키 수
+    affected = Column(Integer, nullable=False, server_default='0')      # 훅이 갱신/삭제한 대상 수
+    seconds = Column(DECIMAL(10, 3))
+    error_class = Column(String(100))
+    error_message = Column(Text)
+    
+    # 관계
+    run = relationship("IngestionRun", back_populates="hooks")
+    
+    # 인덱스
+    __table_args__ = (
+        Index('idx_ingestion_run_hooks_run', 'run_id'),
+    )
+
+
+class IngestionDeadLetter(Base):
+    """수집 실패 행 테이블 (파싱 또는 품목명 매핑에 실패하여 저장하지 않은 원본 행)"""
+    __tablename__ = "ingestion_dead_letters"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    adapter = Column(String(100), nullable=False)
+    stage = Column(String(20), nullable=False)    # parse / match
+    reason = Column(String(100), nullable=False)  # 파싱 예외 클래스 또는 unmatched
+    target_date = Column(Date, nullable=False)    # 수집일
+    payload_hash = Column(String(64))             # 원본 응답 해시 (ingestion_state.payload_hash와 같은 값)
+    record = Column(Text, nullable=False)         # 원본 조각 (응답 항목, 테이블 셀, RawPriceData 필드) JSON
+    record_hash = Column(String(64), nullable=False)
+    error = Column(Text)
+    status = Column(String(20), nullable=False, server_default='pending')  # pending / resolved / discarded
+    occurrences = Column(Integer, nullable=False, server_default='1')  # 같은 행이 다시 실패한 횟수 포함
+    attempts = Column(Integer, nullable=False, server_default='0')     # 재처리 시도 횟수
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    last_seen_at = Column(TIMESTAMP, server_default=func.now())
+    replayed_at = Column(TIMESTAMP)
+    
+    # 인덱스 및 유니크 제약
+    __table_args__ = (
+        Index('idx_ingestion_dead_letters_status', 'status', 'adapter', 'target_date'),
+        UniqueConstraint('adapter', 'target_date', 'record_hash', name='uq_dead_letter_adapter_date_record'),
+    )
+
+
+class IngestionWatermark(Base):
+    """수집 워터마크 테이블 (어댑터별로 빠짐없이 저장까지 완료한 마지막 수집일)"""
+    __tablename__ = "ingestion_watermarks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    adapter = Column(String(100), nullable=False, unique=True)
+    last_success_date = Column(Date, nullable=False)
+    run_id = Column(Integer, ForeignKey("ingestion_runs.id", ondelete="SET NULL"))  # 마지막으로 올린 실행
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+
+class IngestionJob(Base):
+    """수집 작업 큐 테이블 (큐 모드에서 스케줄러가 넣고 워커가 가져가는 (어댑터, 수집일) 작업)"""
+    __tablename__ = "ingestion_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey("ingestion_runs.id", ondelete="CASCADE"))  # 작업을 넣은 실행
+    adapter = Column(String(100), nullable=False)
+    target_date = Column(Date, nullable=False)
+    status = Column(String(20), nullable=False, server_default='queued')  # queued / running / done / failed
+    attempts = Column(Integer, nullable=False, server_default='0')        # 가져간 횟수 (가시성 제한 만료 포함)
+    max_attempts = Column(Integer, nullable=False, server_default='3')
+    available_at = Column(TIMESTAMP, nullable=False, server_default=func.now())  # 이 시각부터 가져갈 수 있음 (재시도 대기)
+    locked_by = Column(String(200))                                       # 실행 중인 워커
+    locked_until = Column(TIMESTAMP)                                      # 가시성 제한 (지나면 다른 워커가 다시 가져감)
+    result = Column(Text)                                                 # 마지막 시도의 어댑터 결과 JSON
+    error_class = Column(String(100))
+    error_message = Column(Text)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    started_at = Column(TIMESTAMP)
+    finished_at = Column(TIMESTAMP)
+    
+    # 인덱스
+    __table_args__ = (
+        Index('idx_ingestion_jobs_claim', 'status', 'available_at'),
+        Index('idx_ingestion_jobs_run', 'run_id', 'status'),
+    )
@@ -0,0 +1,191 @@
+"""가격 격리 리포지토리"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from app.database.models import PriceQuarantine
+from app.database.base_repository import BaseRepository
+from app.database.price_repository import UPSERT_CHUNK_SIZE, PriceRepository
+
+# 격리 상태
+STATUS_PENDING = "pending"
+STATUS_RELEASED = "released"
+STATUS_DISCARDED = "discarded"
+
+# quarantine()이 저장하는 컬럼
+QUARANTINE_COLUMNS = (
+    "price", "unit", "origin", "source",
+    "baseline_median", "baseline_mad", "sample_count", "score", "reason",
+)
+
+class PriceQuarantineRepository(BaseRepository[PriceQuarantine]):
+    """가격 격리 데이터 접근 레이어"""
+
+    def __init__(self, db: Session):
+        super().__init__(PriceQuarantine, db)
+
+    def quarantine(self, rows: List[dict], commit: bool = True) -> int:
+        """
+        이상치로 판정된 가격 격리
+        Data Ingestion 이상치 검사에서 사용 (market_prices에는 쓰지 않음)
+
+        같은 (item_id, market_id, date)가 이미 있으면 새 값으로 덮어쓰고 다시 pending으로 둡니다.
+
+        Args:
+            rows: 정규화된 가격 딕셔너리 + baseline_median, baseline_mad, sample_count, score, reason
+            commit: False면 커밋하지 않음 (호출 측에서 다른 저장과 한 트랜잭션으로 커밋)
+
+        Returns:
+            격리한 행 수
+        """
+        if not rows:
+            return 0
+
+        keys = {(row['item_id'], row['market_id'], _as_date(row['date'])): row for row in rows}
+        existing = {
+            (entry.item_id, entry.market_id, entry.date): entry
+            for entry in self.db.query(PriceQuarantine).filter(
+                PriceQuarantine.item_id.in_({key[0] for key in keys}),
+                PriceQuarantine.market_id.in_({key[1] for key in keys}),
+                PriceQuarantine.date.in_({key[2] for key in keys})
+            )
+        }
+
+        for key, row in keys.items():
+            values = {column: row.get(column) for column in QUARANTINE_COLUMNS}
+            entry = existing.get(key)
+            if entry:
+                for column, value in values.items():
+                    setattr(entry, column, value)
+                entry.status = STATUS_PENDING
+                entry.reviewed_at = None
+            else:
+                self.db.add(PriceQuarantine(
+                    item_id=key[0],
+                    market_id=key[1],
+                    date=key[2],
+                    **values
+                ))
+
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        return len(keys)
+
+    def get_pending(
+        self,
+        item_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[PriceQuarantine]:
+        """검토 대기 중인 격리 가격 조회 (최근 날짜 순)"""
+        query = self.db.query(PriceQuarantine).filter(PriceQuarantine.status == STATUS_PENDING)
+        if item_id is not None:
+            query = query.filter(PriceQuarantine.item_id == item_id)
+        return query.order_by(PriceQuarantine.date.desc(), PriceQuarantine.id).limit(limit).all()
+
+    def get_pending_prices(
+        self,
+        keys: Iterable[Tuple[int, int]],
+        start_date: date,
+        end_date: date
+    ) -> List[Tuple[int, int, int, str, date, float]]:
+        """
+        여러 (품목, 시장)의 기간 내 검토 대기 격리 가격 일괄 조회
+        Data Ingestion 이상치 검사에서 같은 수준의 가격이 계속 격리되었는지 확인할 때 사용
+
+        Args:
+            keys: (item_id, market_id) 목록
+            start_date: 시작일 (포함)
+            end_date: 종료일 (제외)
+
+        Returns:
+            (id, item_id, market_id, unit, date, price) 리스트
+        """
+        keys = list(dict.fromkeys(keys))
+        entries: List[Tuple[int, int, int, str, date, float]] = []
+        for start in range(0, len(keys), UPSERT_CHUNK_SIZE):
+            chunk = keys[start:start + UPSERT_CHUNK_SIZE]
+            entries.extend(
+                (entry_id, item_id, market_id, unit, entry_date, float(price))
+                for entry_id, item_id, market_id, unit, entry_date, price in self.db.execute(
+                    select(
+                        PriceQuarantine.id,
+                        PriceQuarantine.item_id,
+                        PriceQuarantine.market_id,
+                        PriceQuarantine.unit,
+                        PriceQuarantine.date,
+                        PriceQuarantine.price
+                    ).where(
+                        tuple_(PriceQuarantine.item_id, PriceQuarantine.market_id).in_(chunk),
+                        PriceQuarantine.status == STATUS_PENDING,
+                        PriceQuarantine.date >= start_date,
+                        PriceQuarantine.date < end_date
+                    )
+                )
+            )
+        return entries
+
+    def release(
+        self,
+        ids: Iterable[int],
+        changed_keys: Optional[Set[Tuple[int, int, date]]] = None,
+        commit: bool = True
+    ) -> Dict[str, int]:
+        """
+        검토 후 정상으로 판단한 격리 가격을 market_prices에 저장 (PriceRepository.diff_upsert)
+        Data Ingestion 이상치 검사가 같은 수준으로 계속 격리된 가격을 자동 해제할 때도 사용
+
+        Args:
+            ids: 해제할 격리 ID
+            changed_keys: 주어지면 삽입/갱신된 (item_id, market_id, date)를 추가 (post-commit 훅용)
+            commit: False면 커밋하지 않음 (호출 측에서 다른 저장과 한 트랜잭션으로 커밋)
+
+        Returns:
+            {'inserted': n, 'updated': n, 'unchanged': n}
+        """
+        entries = self._get_pending_by_ids(ids)
+        for entry in entries:
+            entry.status = STATUS_RELEASED
+            entry.reviewed_at = datetime.now()
+
+        # diff_upsert가 상태 변경까지 함께 커밋
+        if not entries:
+            if not commit:
+                self.db.flush()
+            return {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        return PriceRepository(self.db).diff_upsert([
+            {
+                'item_id': entry.item_id,
+                'market_id': entry.market_id,
+                'date': entry.date,
+                'price': entry.price,
+                'unit': entry.unit,
+                'origin': entry.origin or '',
+                'source': entry.source or '',
+            }
+            for entry in entries
+        ], changed_keys=changed_keys, commit=commit)
+
+    def discard(self, ids: Iterable[int]) -> int:
+        """격리 가격 폐기 (저장하지 않음)"""
+        entries = self._get_pending_by_ids(ids)
+        for entry in entries:
+            entry.status = STATUS_DISCARDED
+            entry.reviewed_at = datetime.now()
+        self.db.commit()
+        return len(entries)
+
+    def _get_pending_by_ids(self, ids: Iterable[int]) -> List[PriceQuarantine]:
+        return (
+            self.db.query(PriceQuarantine)
+            .filter(
+                PriceQuarantine.id.in_(list(ids)),
+                PriceQuarantine.status == STATUS_PENDING
+            )
+            .all()
+        )
+
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
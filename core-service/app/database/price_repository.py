@@ -1,11 +1,25 @@
 """가격 리포지토리"""
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from datetime import datetime, date, timedelta
+from decimal import Decimal
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, and_
+from sqlalchemy import desc, func, and_, bindparam, literal_column, or_, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.database.models import MarketPrice
 from app.database.base_repository import BaseRepository
 
+# diff_upsert에서 비교/갱신하는 값 컬럼
+UPSERT_VALUE_COLUMNS = ("price", "unit", "origin", "source")
+
+# diff_upsert 한 번의 INSERT/조회에 담는 최대 행 수
+UPSERT_CHUNK_SIZE = 1000
+
+# copy_upsert 입력 행의 컬럼 순서
+COPY_COLUMNS = ("item_id", "market_id", "date", "price", "unit", "origin", "source")
+
+# copy_upsert가 COPY용 텍스트를 만들 때 한 번에 묶는 행 수
+COPY_BUFFER_ROWS = 10000
+
 class PriceRepository(BaseRepository[MarketPrice]):
     """가격 데이터 접근 레이어"""
     
@@ -199,6 +213,326 @@ class PriceRepository(BaseRepository[MarketPrice]):
         self.db.commit()
         return count
     
+    def diff_upsert(
+        self,
+        price_dicts: List[dict],
+        changed_keys: Optional[Set[Tuple[int, int, date]]] = None,
+        commit: bool = True
+    ) -> Dict[str, int]:
+        """
+        변경된 가격만 저장하는 대량 upsert
+        Data Ingestion Service에서 사용
+        
+        (item_id, market_id, date)가 없으면 삽입, 있으면 price/unit/origin/source 중
+        하나라도 다를 때만 갱신합니다. 같은 값은 다시 쓰지 않으므로 dead tuple과 WAL이
+        생기지 않습니다.
+        - PostgreSQL: INSERT ... ON CONFLICT DO UPDATE ... WHERE ... IS DISTINCT FROM
+          한 문장으로 비교/저장하고 RETURNING (xmax = 0)으로 삽입/갱신을 구분
+        - 그 외: 대상 키를 한 번에 조회해 비교한 뒤 삽입/갱신 행만 executemany
+        
+        Args:
+            price_dicts: 가격 데이터 딕셔너리 리스트
+                각 딕셔너리는 item_id, market_id, date, price, unit, origin, source 포함
+                (같은 키가 여러 번 있으면 마지막 값 사용)
+            changed_keys: 주어지면 삽입/갱신된 (item_id, market_id, date)를 추가
+                (스케줄러 post-commit 훅이 바뀐 키만 갱신하는 데 사용)
+            commit: False면 커밋하지 않음 (호출 측에서 다른 저장과 한 트랜잭션으로 커밋)
+        
+        Returns:
+            {'inserted': n, 'updated': n, 'unchanged': n}
+        """
+        rows = self._dedupe_price_rows(price_dicts)
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        if not rows:
+            return counts
+        
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+            if self.db.get_bind().dialect.name == "postgresql":
+                inserted, updated = self._diff_upsert_postgres(chunk, changed_keys)
+            else:
+                inserted, updated = self._diff_upsert_generic(chunk, changed_keys)
+            counts['inserted'] += inserted
+            counts['updated'] += updated
+            counts['unchanged'] += len(chunk) - inserted - updated
+        
+        if commit:
+            self.db.commit()
+        return counts
+    
+    def copy_upsert(
+        self,
+        rows: Iterable[Sequence],
+        changed_keys: Optional[Set[Tuple[int, int, date]]] = None,
+        commit: bool = True
+    ) -> Dict[str, int]:
+        """
+        대량 행 저장 (diff_upsert와 같은 규칙, 행 단위 dict/ORM 객체 없이)
+        Data Ingestion 백필에서 컬럼 배치(NormalizedPriceBatch.iter_rows)를 받아 사용
+        
+        - PostgreSQL: 임시 테이블에 COPY FROM STDIN으로 적재한 뒤 INSERT ... SELECT ...
+          ON CONFLICT DO UPDATE ... WHERE ... IS DISTINCT FROM 한 문장으로 반영
+          (같은 키는 마지막 행 사용, 삽입/갱신 수는 서버에서 집계)
+        - 그 외: UPSERT_CHUNK_SIZE 행씩 diff_upsert
+        
+        Args:
+            rows: COPY_COLUMNS 순서의 행 (item_id, market_id, date, price, unit, origin, source)
+            changed_keys: 주어지면 삽입/갱신된 (item_id, market_id, date)를 추가
+                (백필이 끝난 뒤 post-commit 훅이 바뀐 키만 갱신하는 데 사용)
+            commit: False면 커밋하지 않음 (호출 측에서 다른 저장과 한 트랜잭션으로 커밋)
+        
+        Returns:
+            {'inserted': n, 'updated': n, 'unchanged': n}
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return self._copy_upsert_generic(rows, changed_keys, commit)
+        
+        connection = self.db.connection()
+        dbapi_connection = connection.connection.dbapi_connection
+        
+        connection.execute(text(
+            "CREATE TEMP TABLE IF NOT EXISTS market_prices_staging ("
+            " seq bigserial, item_id integer, market_id integer, date date,"
+            " price numeric(10, 2), unit varchar(20), origin varchar(100), source varchar(100)"
+            ") ON COMMIT DELETE ROWS"
+        ))
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY market_prices_staging ({', '.join(COPY_COLUMNS)}) FROM STDIN",
+                _CopyReader(rows)
+            )
+        
+        columns = ", ".join(COPY_COLUMNS)
+        upsert = f"""
+            WITH latest AS (
+                SELECT DISTINCT ON (item_id, market_id, date) {columns}
+                FROM market_prices_staging
+                ORDER BY item_id, market_id, date, seq DESC
+            ), upserted AS (
+                INSERT INTO market_prices ({columns})
+                SELECT {columns} FROM latest
+                ON CONFLICT (item_id, market_id, date) DO UPDATE SET
+                    {", ".join(f"{column} = EXCLUDED.{column}" for column in UPSERT_VALUE_COLUMNS)}
+                WHERE ({", ".join(f"market_prices.{column}" for column in UPSERT_VALUE_COLUMNS)})
+                    IS DISTINCT FROM ({", ".join(f"EXCLUDED.{column}" for column in UPSERT_VALUE_COLUMNS)})
+                RETURNING (xmax = 0) AS inserted, item_id, market_id, date
+            )
+        """
+        if changed_keys is None:
+            result = connection.execute(text(upsert + """
+                SELECT
+                    (SELECT count(*) FROM latest) AS total,
+                    count(*) FILTER (WHERE inserted) AS inserted,
+                    count(*) FILTER (WHERE NOT inserted) AS updated
+                FROM upserted
+            """)).one()
+            total, inserted, updated = result.total, result.inserted, result.updated
+        else:
+            # 바뀐 키가 필요하면 변경 행만 돌려받음 (전체 키 수는 스테이징 테이블에서 먼저 집계)
+            total = connection.execute(text(
+                "SELECT count(*) FROM (SELECT DISTINCT item_id, market_id, date FROM market_prices_staging) AS staged"
+            )).scalar()
+            changed = connection.execute(text(
+                upsert + "SELECT inserted, item_id, market_id, date FROM upserted"
+            )).all()
+            changed_keys.update((item_id, market_id, price_date) for _flag, item_id, market_id, price_date in changed)
+            inserted = sum(1 for row in changed if row.inserted)
+            updated = len(changed) - inserted
+        if commit:
+            self.db.commit()
+        
+        return {
+            'inserted': inserted,
+            'updated': updated,
+            'unchanged': total - inserted - updated,
+        }
+    
+    def _copy_upsert_generic(
+        self,
+        rows: Iterable[Sequence],
+        changed_keys: Optional[Set[Tuple[int, int, date]]] = None,
+        commit: bool = True
+    ) -> Dict[str, int]:
+        """COPY 미지원 DB용 - UPSERT_CHUNK_SIZE 행씩 diff_upsert (같은 키는 마지막 행 사용)"""
+        latest = {}
+        for row in rows:
+            latest[(row[0], row[1], row[2])] = row
+        
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        chunk: List[dict] = []
+        for row in latest.values():
+            chunk.append(dict(zip(COPY_COLUMNS, row)))
+            if len(chunk) >= UPSERT_CHUNK_SIZE:
+                for name, count in self.diff_upsert(chunk, changed_keys, commit).items():
+                    counts[name] += count
+                chunk = []
+        if chunk:
+            for name, count in self.diff_upsert(chunk, changed_keys, commit).items():
+                counts[name] += count
+        return counts
+    
+    def _diff_upsert_postgres(self, rows: List[dict], changed_keys: Optional[set] = None) -> Tuple[int, int]:
+        """ON CONFLICT DO UPDATE WHERE IS DISTINCT FROM (변경 행만 RETURNING)"""
+        stmt = pg_insert(MarketPrice).values(rows)
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['item_id', 'market_id', 'date'],
+            set_={column: excluded[column] for column in UPSERT_VALUE_COLUMNS},
+            where=or_(*(
+                getattr(MarketPrice, column).is_distinct_from(excluded[column])
+                for column in UPSERT_VALUE_COLUMNS
+            ))
+        ).returning(
+            literal_column("(xmax = 0)").label("inserted"),
+            MarketPrice.item_id,
+            MarketPrice.market_id,
+            MarketPrice.date
+        )
+        
+        changed = self.db.execute(stmt).all()
+        if changed_keys is not None:
+            changed_keys.update((item_id, market_id, price_date) for _flag, item_id, market_id, price_date in changed)
+        inserted = sum(1 for row in changed if row.inserted)
+        return inserted, len(changed) - inserted
+    
+    def _diff_upsert_generic(self, rows: List[dict], changed_keys: Optional[set] = None) -> Tuple[int, int]:
+        """기존 행을 한 번에 조회해 비교 후 삽입/갱신 (ON CONFLICT 미지원 DB용)"""
+        keys = [(row['item_id'], row['market_id'], row['date']) for row in rows]
+        existing = {
+            (item_id, market_id, price_date): (price_id, (price, unit, origin, source))
+            for price_id, item_id, market_id, price_date, price, unit, origin, source in self.db.execute(
+                select(
+                    MarketPrice.id,
+                    MarketPrice.item_id,
+                    MarketPrice.market_id,
+                    MarketPrice.date,
+                    *(getattr(MarketPrice, column) for column in UPSERT_VALUE_COLUMNS)
+                ).where(tuple_(MarketPrice.item_id, MarketPrice.market_id, MarketPrice.date).in_(keys))
+            )
+        }
+        
+        inserts, updates = [], []
+        for key, row in zip(keys, rows):
+            stored = existing.get(key)
+            if stored is None:
+                inserts.append(row)
+            elif _comparable(stored[1]) != _comparable(tuple(row[c] for c in UPSERT_VALUE_COLUMNS)):
+                updates.append({'_id': stored[0], **{c: row[c] for c in UPSERT_VALUE_COLUMNS}})
+            else:
+                continue
+            if changed_keys is not None:
+                changed_keys.add(key)
+        
+        if inserts:
+            self.db.execute(MarketPrice.__table__.insert(), inserts)
+        if updates:
+            self.db.execute(
+                update(MarketPrice.__table__)
+                .where(MarketPrice.__table__.c.id == bindparam('_id'))
+                .values({c: bindparam(c) for c in UPSERT_VALUE_COLUMNS}),
+                updates
+            )
+        return len(inserts), len(updates)
+    
+    @staticmethod
+    def _dedupe_price_rows(price_dicts: List[dict]) -> List[dict]:
+        """저장할 컬럼만 남기고 같은 키는 마지막 값으로 합침 (bulk_insert와 같은 기본값)"""
+        rows = {}
+        for price_dict in price_dicts:
+            price_date = price_dict['date']
+            if isinstance(price_date, datetime):
+                price_date = price_date.date()
+            key = (price_dict['item_id'], price_dict['market_id'], price_date)
+            rows[key] = {
+                'item_id': price_dict['item_id'],
+                'market_id': price_dict['market_id'],
+                'date': price_date,
+                'price': price_dict['price'],
+                'unit': price_dict['unit'],
+                'origin': price_dict.get('origin', ''),
+                'source': price_dict.get('source', ''),
+            }
+        return list(rows.values())
+    
+    def get_price_samples(
+        self,
+        keys: Iterable[Tuple[int, int]],
+        start_date: date,
+        end_date: date
+    ) -> List[Tuple[int, int, str, float]]:
+        """
+        여러 (품목, 시장)의 기간 내 가격 일괄 조회
+        Data Ingestion 이상치 검사에서 최근 가격 분포를 만들 때 사용
+
+        Args:
+            keys: (item_id, market_id) 목록
+            start_date: 시작일 (포함)
+            end_date: 종료일 (제외)
+
+        Returns:
+            (item_id, market_id, unit, price) 리스트
+        """
+        keys = list(dict.fromkeys(keys))
+        samples: List[Tuple[int, int, str, float]] = []
+        for start in range(0, len(keys), UPSERT_CHUNK_SIZE):
+            chunk = keys[start:start + UPSERT_CHUNK_SIZE]
+            samples.extend(
+                (item_id, market_id, unit, float(price))
+                for item_id, market_id, unit, price in self.db.execute(
+                    select(
+                        MarketPrice.item_id,
+                        MarketPrice.market_id,
+                        MarketPrice.unit,
+                        MarketPrice.price
+                    ).where(
+                        tuple_(MarketPrice.item_id, MarketPrice.market_id).in_(chunk),
+                        MarketPrice.date >= start_date,
+                        MarketPrice.date < end_date
+                    )
+                )
+            )
+        return samples
+
+    def get_recent_prices(
+        self,
+        keys: Iterable[Tuple[int, int]],
+        start_date: date,
+        end_date: date
+    ) -> List[Tuple[int, int, str, date, float]]:
+        """
+        여러 (품목, 시장)의 기간 내 날짜별 가격 일괄 조회
+        Data Ingestion 이상치 검사에서 같은 수준의 가격이 이어졌는지 확인할 때 사용 (이상치가 있는 키만)
+
+        Args:
+            keys: (item_id, market_id) 목록
+            start_date: 시작일 (포함)
+            end_date: 종료일 (제외)
+
+        Returns:
+            (item_id, market_id, unit, date, price) 리스트
+        """
+        keys = list(dict.fromkeys(keys))
+        prices: List[Tuple[int, int, str, date, float]] = []
+        for start in range(0, len(keys), UPSERT_CHUNK_SIZE):
+            chunk = keys[start:start + UPSERT_CHUNK_SIZE]
+            prices.extend(
+                (item_id, market_id, unit, price_date, float(price))
+                for item_id, market_id, unit, price_date, price in self.db.execute(
+                    select(
+                        MarketPrice.item_id,
+                        MarketPrice.market_id,
+                        MarketPrice.unit,
+                        MarketPrice.date,
+                        MarketPrice.price
+                    ).where(
+                        tuple_(MarketPrice.item_id, MarketPrice.market_id).in_(chunk),
+                        MarketPrice.date >= start_date,
+                        MarketPrice.date < end_date
+                    )
+                )
+            )
+        return prices
+
     def get_price_count_in_period(
         self, 
         item_id: int, 
@@ -216,3 +550,60 @@ class PriceRepository(BaseRepository[MarketPrice]):
             )
             .count()
         )
+
+
+class _CopyReader:
+    """
+    행 이터레이터를 COPY FROM STDIN 텍스트 형식으로 읽게 해 주는 파일 객체
+    
+    COPY_BUFFER_ROWS 행씩만 인코딩하므로 전체 데이터를 문자열로 만들지 않습니다.
+    read()는 요청 크기보다 적게 반환할 수 있으며, 빈 bytes는 데이터 끝을 뜻합니다.
+    """
+    
+    def __init__(self, rows: Iterable[Sequence]):
+        self._rows = iter(rows)
+        self._buffer = b""
+        self._position = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        if self._position >= len(self._buffer):
+            self._buffer = self._encode_next()
+            self._position = 0
+        if size is None or size < 0:
+            size = len(self._buffer)
+        data = self._buffer[self._position:self._position + size]
+        self._position += len(data)
+        return data
+    
+    def _encode_next(self) -> bytes:
+        lines = []
+        for row in self._rows:
+            lines.append("\t".join(_copy_value(value) for value in row))
+            if len(lines) >= COPY_BUFFER_ROWS:
+                break
+        if not lines:
+            return b""
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _copy_value(value) -> str:
+    """COPY 텍스트 형식 값 (NULL은 \\N, 구분자/줄바꿈/역슬래시 이스케이프)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        value = value.date()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _comparable(values: tuple) -> tuple:
+    """DECIMAL(10,2) 저장 값과 비교할 수 있도록 가격을 소수 둘째 자리로 맞춤"""
+    price, *rest = values
+    if price is not None:
+        price = Decimal(str(price)).quantize(Decimal('0.01'))
+    return (price, *rest)
@@ -10,6 +10,7 @@ from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.exceptions import AppException
+from app.monitoring.metrics import record_error
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ def create_error_response(
 
 async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
     """커스텀 애플리케이션 예외 핸들러"""
+    record_error(exc.__class__.__name__, exc.status_code)
     logger.warning(
         f"Application exception: {exc.__class__.__name__}",
         extra={
@@ -63,6 +65,7 @@ async def validation_exception_handler(
     exc: RequestValidationError
 ) -> JSONResponse:
     """FastAPI 입력 검증 예외 핸들러"""
+    record_error("ValidationError", status.HTTP_422_UNPROCESSABLE_ENTITY)
     logger.warning(
         "Validation error",
         extra={
@@ -84,6 +87,7 @@ async def sqlalchemy_exception_handler(
     exc: SQLAlchemyError
 ) -> JSONResponse:
     """SQLAlchemy 데이터베이스 예외 핸들러"""
+    record_error("DatabaseError", status.HTTP_500_INTERNAL_SERVER_ERROR)
     logger.error(
         "Database error",
         extra={
@@ -106,6 +110,7 @@ async def general_exception_handler(
     exc: Exception
 ) -> JSONResponse:
     """일반 예외 핸들러"""
+    record_error("InternalServerError", status.HTTP_500_INTERNAL_SERVER_ERROR)
     logger.error(
         "Unexpected error",
         extra={
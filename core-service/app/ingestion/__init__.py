@@ -0,0 +1,16 @@
+"""수집 실행 기록 모듈"""
+from app.ingestion.router import router
+from app.ingestion.service import IngestionRunService
+from app.ingestion.schemas import (
+    IngestionRunResponse,
+    IngestionRunListResponse,
+    StageStatsResponse
+)
+
+__all__ = [
+    "router",
+    "IngestionRunService",
+    "IngestionRunResponse",
+    "IngestionRunListResponse",
+    "StageStatsResponse"
+]
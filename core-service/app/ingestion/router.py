@@ -0,0 +1,59 @@
+"""수집 실행 기록 API 라우터"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.database.connection import get_db
+from app.ingestion.service import IngestionRunService
+from app.ingestion.schemas import (
+    IngestionRunListResponse,
+    IngestionRunResponse,
+    StageStatsResponse
+)
+
+router = APIRouter(prefix="/ingestion", tags=["ingestion"])
+
+@router.get("/runs", response_model=IngestionRunListResponse)
+def get_recent_runs(
+    limit: int = Query(20, ge=1, le=200, description="최대 실행 수"),
+    status: Optional[str] = Query(None, description="실행 상태 (running/success/partial/failed)"),
+    adapter: Optional[str] = Query(None, description="어댑터 이름 (예: GarakAdapter)"),
+    db: Session = Depends(get_db)
+):
+    """
+    최근 수집 실행 조회 (최신순)
+    
+    - 실행별 합계와 어댑터별 단계 소요 시간(fetch/normalize/validate/write), 행 수, 응답 크기, 오류 클래스
+    - 어댑터별 기록의 slowest_stage로 가장 오래 걸린 단계 확인
+    """
+    service = IngestionRunService(db)
+    return service.get_recent_runs(limit, status, adapter)
+
+@router.get("/runs/{run_id}", response_model=IngestionRunResponse)
+def get_run(
+    run_id: int,
+    db: Session = Depends(get_db)
+):
+    """수집 실행 상세 조회"""
+    service = IngestionRunService(db)
+    result = service.get_run(run_id)
+    
+    if not result:
+        raise HTTPException(
+            status_code=404,
+            detail=f"수집 실행 기록이 없습니다 (ID: {run_id})"
+        )
+    
+    return result
+
+@router.get("/stages", response_model=StageStatsResponse)
+def get_stage_stats(
+    days: int = Query(7, ge=1, le=90, description="집계 기간 (일)"),
+    db: Session = Depends(get_db)
+):
+    """
+    어댑터별 단계 소요 시간 통계
+    
+    - 최근 N일 실행의 단계별 평균/최대 소요 시간, 실행/실패 수, 응답 크기 합계
+    """
+    service = IngestionRunService(db)
+    return service.get_stage_stats(days)
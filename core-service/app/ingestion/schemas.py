@@ -0,0 +1,89 @@
+"""수집 실행 기록 스키마"""
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+
+class RowCounts(BaseModel):
+    """단계별 행 수"""
+    raw: int
+    invalid: int
+    unmatched: int
+    normalized: int
+    quarantined: int
+    inserted: int
+    updated: int
+    unchanged: int
+    dead_lettered: int
+
+
+class IngestionRunAdapterResponse(BaseModel):
+    """어댑터별 실행 기록"""
+    adapter: str
+    status: str
+    target_date: Optional[date] = None
+    total_seconds: Optional[float] = None
+    slowest_stage: Optional[str] = None
+    timings: Dict[str, Optional[float]]  # fetch / normalize / validate / write (초, 실행하지 않은 단계는 null)
+    rows: RowCounts
+    payload_bytes: int
+    error_class: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+class IngestionRunHookResponse(BaseModel):
+    """post-commit 훅 실행 기록"""
+    hook: str
+    status: str
+    touched_keys: int
+    affected: int
+    seconds: Optional[float] = None
+    error_class: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+class IngestionRunResponse(BaseModel):
+    """수집 실행 기록"""
+    id: int
+    trigger: str
+    status: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    wall_seconds: Optional[float] = None
+    adapter_count: int
+    successful: int
+    unchanged: int
+    failed: int
+    rows_inserted: int
+    rows_updated: int
+    rows_unchanged: int
+    rows_quarantined: int
+    adapters: List[IngestionRunAdapterResponse]
+    hooks: List[IngestionRunHookResponse] = []
+
+
+class IngestionRunListResponse(BaseModel):
+    """수집 실행 기록 목록"""
+    runs: List[IngestionRunResponse]
+    total: int
+
+
+class StageStat(BaseModel):
+    """단계 소요 시간 통계 (초)"""
+    avg: Optional[float] = None
+    max: Optional[float] = None
+
+
+class AdapterStageStatsResponse(BaseModel):
+    """어댑터별 단계 소요 시간 통계"""
+    adapter: str
+    runs: int
+    failed: int
+    payload_bytes: int
+    stages: Dict[str, StageStat]
+
+
+class StageStatsResponse(BaseModel):
+    """기간 내 어댑터별 단계 소요 시간 통계"""
+    days: int
+    adapters: List[AdapterStageStatsResponse]
@@ -0,0 +1,128 @@
+"""수집 실행 기록 조회 서비스"""
+from typing import Optional
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+
+from app.database.ingestion_run_repository import IngestionRunRepository, STAGE_COLUMNS
+from app.database.models import IngestionRun, IngestionRunAdapter, IngestionRunHook
+from app.ingestion.schemas import (
+    IngestionRunAdapterResponse,
+    IngestionRunHookResponse,
+    IngestionRunListResponse,
+    IngestionRunResponse,
+    RowCounts,
+    StageStatsResponse,
+)
+
+
+class IngestionRunService:
+    """수집 실행 기록 비즈니스 로직"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.run_repo = IngestionRunRepository(db)
+
+    def get_recent_runs(
+        self,
+        limit: int = 20,
+        status: Optional[str] = None,
+        adapter: Optional[str] = None
+    ) -> IngestionRunListResponse:
+        """
+        최근 수집 실행 조회
+
+        Args:
+            limit: 최대 실행 수
+            status: 실행 상태 필터 (running / success / partial / failed)
+            adapter: 이 어댑터가 포함된 실행만 (어댑터 기록도 이 어댑터만 반환)
+        """
+        runs = self.run_repo.get_recent_runs(limit, status, adapter)
+        return IngestionRunListResponse(
+            runs=[self._to_response(run, adapter) for run in runs],
+            total=len(runs)
+        )
+
+    def get_run(self, run_id: int) -> Optional[IngestionRunResponse]:
+        """수집 실행 상세 조회"""
+        run = self.run_repo.get_run(run_id)
+        return self._to_response(run) if run else None
+
+    def get_stage_stats(self, days: int = 7) -> StageStatsResponse:
+        """최근 N일 어댑터별 단계 소요 시간 통계 (가장 느린 단계 찾기용)"""
+        since = datetime.now() - timedelta(days=days)
+        return StageStatsResponse(days=days, adapters=self.run_repo.get_stage_stats(since))
+
+    def _to_response(
+        self,
+        run: IngestionRun,
+        adapter: Optional[str] = None
+    ) -> IngestionRunResponse:
+        """ORM → 응답 모델 (adapter가 있으면 해당 어댑터 기록만)"""
+        return IngestionRunResponse(
+            id=run.id,
+            trigger=run.trigger,
+            status=run.status,
+            started_at=run.started_at,
+            finished_at=run.finished_at,
+            wall_seconds=_float(run.wall_seconds),
+            adapter_count=run.adapter_count,
+            successful=run.successful,
+            unchanged=run.unchanged,
+            failed=run.failed,
+            rows_inserted=run.rows_inserted,
+            rows_updated=run.rows_updated,
+            rows_unchanged=run.rows_unchanged,
+            rows_quarantined=run.rows_quarantined,
+            adapters=[
+                self._to_adapter_response(entry)
+                for entry in run.adapters
+                if adapter is None or entry.adapter == adapter
+            ],
+            hooks=[self._to_hook_response(hook) for hook in run.hooks]
+        )
+
+    @staticmethod
+    def _to_adapter_response(entry: IngestionRunAdapter) -> IngestionRunAdapterResponse:
+        timings = {
+            stage: _float(getattr(entry, column))
+            for stage, column in STAGE_COLUMNS.items()
+        }
+        measured = {stage: seconds for stage, seconds in timings.items() if seconds is not None}
+        return IngestionRunAdapterResponse(
+            adapter=entry.adapter,
+            status=entry.status,
+            target_date=entry.target_date,
+            total_seconds=_float(entry.total_seconds),
+            slowest_stage=max(measured, key=measured.get) if measured else None,
+            timings=timings,
+            rows=RowCounts(
+                raw=entry.raw_rows,
+                invalid=entry.invalid_rows,
+                unmatched=entry.unmatched_rows,
+                normalized=entry.normalized_rows,
+                quarantined=entry.quarantined_rows,
+                inserted=entry.inserted_rows,
+                updated=entry.updated_rows,
+                unchanged=entry.unchanged_rows,
+                dead_lettered=entry.dead_letter_rows,
+            ),
+            payload_bytes=entry.payload_bytes,
+            error_class=entry.error_class,
+            error_message=entry.error_message,
+        )
+
+    @staticmethod
+    def _to_hook_response(hook: IngestionRunHook) -> IngestionRunHookResponse:
+        return IngestionRunHookResponse(
+            hook=hook.hook,
+            status=hook.status,
+            touched_keys=hook.touched_keys,
+            affected=hook.affected,
+            seconds=_float(hook.seconds),
+            error_class=hook.error_class,
+            error_message=hook.error_message,
+        )
+
+
+def _float(value) -> Optional[float]:
+    return float(value) if value is not None else None
@@ -182,7 +182,8 @@ class DashboardService:
                         market_id=trend.market_id,
                         market_name=trend.market_name,
                         period_days=trend.period_days,
-                        data_points=trend.data_points
+                        # prices.schemas와 items.schemas의 PriceTrendPoint는 서로 다른 모델이므로 dict로 변환
+                        data_points=[point.model_dump() for point in trend.data_points]
                     )
                 )
         
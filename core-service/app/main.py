@@ -6,7 +6,10 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.items.router import router as items_router
 from app.aliases.router import router as aliases_router
 from app.prices.router import router as prices_router
+from app.monitoring.router import router as monitoring_router
+from app.ingestion.router import router as ingestion_router
 from app.exceptions import AppException
+from app.monitoring.middleware import QueryTimingMiddleware, MetricsMiddleware
 from app.exception_handlers import (
     app_exception_handler,
     validation_exception_handler,
@@ -35,10 +38,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 SQL 계측 (Server-Timing 헤더) 및 라우트 메트릭
+app.add_middleware(QueryTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(items_router)
 app.include_router(aliases_router)
 app.include_router(prices_router)
+app.include_router(monitoring_router)
+app.include_router(ingestion_router)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,27 @@
+"""런타임 모니터링 모듈"""
+from app.monitoring.query_stats import (
+    QueryStats,
+    get_current_query_stats,
+    install_query_instrumentation,
+    track_queries,
+)
+from app.monitoring.middleware import QueryTimingMiddleware, MetricsMiddleware
+from app.monitoring.metrics import (
+    render_metrics,
+    record_alias_match,
+    record_cache_access,
+    record_error,
+)
+
+__all__ = [
+    "QueryStats",
+    "get_current_query_stats",
+    "install_query_instrumentation",
+    "track_queries",
+    "QueryTimingMiddleware",
+    "MetricsMiddleware",
+    "render_metrics",
+    "record_alias_match",
+    "record_cache_access",
+    "record_error",
+]
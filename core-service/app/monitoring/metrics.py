@@ -0,0 +1,273 @@
+"""
+Prometheus 텍스트 포맷 메트릭
+
+외부 의존성 없이 카운터/히스토그램을 수집하고 /metrics 응답용 텍스트로 렌더링합니다.
+- 라우트별 요청 수, 지연 시간 히스토그램
+- 예외 핸들러 기준 에러 카운터
+- DB 커넥션 풀 상태 및 대기 시간
+- 캐시 적중률, 별칭 매칭 결과
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# 요청 지연 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 커넥션 풀 대기 시간 버킷 (초)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [
+        f'{name}="{_escape(value)}"'
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0):
+        """카운터 증가"""
+        key = tuple(str(v) for v in label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, *label_values: str) -> float:
+        """현재 값 조회"""
+        return self._values.get(tuple(str(v) for v in label_values), 0.0)
+
+    def items(self) -> List[Tuple[LabelValues, float]]:
+        with self._lock:
+            return list(self._values.items())
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} counter",
+        ]
+        for labels, value in sorted(self.items()):
+            lines.append(
+                f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Tuple[str, ...] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # 라벨별 [버킷 카운트..., 합계, 개수]
+        self._series: Dict[LabelValues, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+        """관측값 기록"""
+        key = tuple(str(v) for v in label_values)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [0.0] * (len(self.buckets) + 2)
+                self._series[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def get_sum_count(self, *label_values: str) -> Tuple[float, float]:
+        """라벨별 (관측값 합계, 관측 횟수) 조회"""
+        with self._lock:
+            series = self._series.get(tuple(str(v) for v in label_values))
+            if series is None:
+                return 0.0, 0.0
+            return series[-2], series[-1]
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            snapshot = {k: list(v) for k, v in self._series.items()}
+
+        for labels, series in sorted(snapshot.items()):
+            cumulative = 0.0
+            for i, bound in enumerate(self.buckets):
+                cumulative += series[i]
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} "
+                    f"{_format_value(cumulative)}"
+                )
+            label_str = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{label_str} {_format_value(series[-1])}")
+        return lines
+
+
+def _render_gauge(name: str, description: str, samples: List[Tuple[str, float]]) -> List[str]:
+    """스크레이프 시점에 계산되는 게이지 렌더링 (samples: [(라벨 문자열, 값)])"""
+    lines = [
+        f"# HELP {name} {description}",
+        f"# TYPE {name} gauge",
+    ]
+    for labels, value in samples:
+        lines.append(f"{name}{labels} {_format_value(value)}")
+    return lines
+
+
+# ============================================================================
+# 메트릭 정의
+# ============================================================================
+
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "Total HTTP requests by route and status code",
+    ("method", "route", "status_code")
+)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ("method", "route"),
+    LATENCY_BUCKETS
+)
+
+ERROR_COUNT = Counter(
+    "http_errors_total",
+    "Errors handled by the application exception handlers",
+    ("error_type", "status_code")
+)
+
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled DB connection (includes new connection setup)",
+    (),
+    POOL_WAIT_BUCKETS
+)
+
+CACHE_ACCESS = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache name and result",
+    ("cache", "result")
+)
+
+ALIAS_MATCH = Counter(
+    "alias_match_total",
+    "Alias match outcomes",
+    ("outcome",)
+)
+
+
+def record_request(method: str, route: str, status_code: int, duration_seconds: float):
+    """HTTP 요청 결과 기록"""
+    REQUEST_COUNT.inc(method, route, status_code)
+    REQUEST_LATENCY.observe(duration_seconds, method, route)
+
+
+def record_error(error_type: str, status_code: int):
+    """예외 핸들러에서 처리한 에러 기록"""
+    ERROR_COUNT.inc(error_type, status_code)
+
+
+def record_pool_wait(duration_seconds: float):
+    """커넥션 풀 대기 시간 기록"""
+    DB_POOL_WAIT.observe(duration_seconds)
+
+
+def record_cache_access(cache: str, hit: bool):
+    """캐시 조회 결과 기록"""
+    CACHE_ACCESS.inc(cache, "hit" if hit else "miss")
+
+
+def record_alias_match(outcome: str):
+    """별칭 매칭 결과 기록 (exact / similar / unmatched)"""
+    ALIAS_MATCH.inc(outcome)
+
+
+def _pool_gauges(pool) -> List[str]:
+    """SQLAlchemy QueuePool 상태 게이지"""
+    lines: List[str] = []
+    stats = [
+        ("db_pool_size", "Configured pool size", "size"),
+        ("db_pool_checked_out", "Connections currently checked out", "checkedout"),
+        ("db_pool_checked_in", "Idle connections in the pool", "checkedin"),
+        ("db_pool_overflow", "Connections opened beyond pool_size", "overflow"),
+    ]
+    for name, description, method in stats:
+        getter = getattr(pool, method, None)
+        if getter is None:
+            continue
+        value = getter()
+        if method == "overflow":
+            # QueuePool은 풀이 다 차기 전까지 음수(-pool_size부터)를 반환
+            value = max(value, 0)
+        lines.extend(_render_gauge(name, description, [("", value)]))
+    return lines
+
+
+def _cache_ratio_gauges() -> List[str]:
+    """캐시별 적중률 게이지"""
+    totals: Dict[str, Dict[str, float]] = {}
+    for (cache, result), value in CACHE_ACCESS.items():
+        totals.setdefault(cache, {}).setdefault(result, 0.0)
+        totals[cache][result] += value
+
+    samples = []
+    for cache, results in sorted(totals.items()):
+        lookups = results.get("hit", 0.0) + results.get("miss", 0.0)
+        if lookups:
+            samples.append((
+                _format_labels(("cache",), (cache,)),
+                results.get("hit", 0.0) / lookups
+            ))
+    if not samples:
+        return []
+    return _render_gauge("cache_hit_ratio", "Cache hit ratio since process start", samples)
+
+
+def render_metrics(pool: Optional[object] = None) -> str:
+    """전체 메트릭을 Prometheus 텍스트 포맷으로 렌더링"""
+    lines: List[str] = []
+    for metric in (REQUEST_COUNT, REQUEST_LATENCY, ERROR_COUNT, DB_POOL_WAIT, CACHE_ACCESS, ALIAS_MATCH):
+        lines.extend(metric.render())
+    if pool is not None:
+        lines.extend(_pool_gauges(pool))
+    lines.extend(_cache_ratio_gauges())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,123 @@
+"""
+요청 단위 계측 미들웨어
+
+- QueryTimingMiddleware: 요청별 SQL 통계를 Server-Timing 헤더와 구조화 로그로 노출합니다.
+  개발 모드에서는 쿼리 수가 예산(SQL_QUERY_BUDGET)을 넘으면 경고를 남깁니다.
+- MetricsMiddleware: 라우트별 요청 수와 지연 시간을 /metrics에 기록합니다.
+"""
+import logging
+import os
+import time
+
+from dotenv import load_dotenv
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.monitoring.metrics import record_request
+from app.monitoring.query_stats import track_queries
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 요청당 허용 쿼리 수 (개발 모드 경고 기준)
+SQL_QUERY_BUDGET = int(os.getenv("SQL_QUERY_BUDGET", "30"))
+
+# 개발 모드 여부 (.env의 PYTHON_ENV 사용)
+DEV_MODE = os.getenv("PYTHON_ENV", "production").lower() == "development"
+
+
+class QueryTimingMiddleware:
+    """요청별 쿼리 수/DB 시간을 Server-Timing 헤더로 기록하는 ASGI 미들웨어"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        query_budget: int = SQL_QUERY_BUDGET,
+        dev_mode: bool = DEV_MODE
+    ):
+        self.app = app
+        self.query_budget = query_budget
+        self.dev_mode = dev_mode
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message):
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    total_ms = (time.perf_counter() - start) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.total_time_ms:.2f};desc="{stats.query_count} queries", '
+                        f"db-slowest;dur={stats.slowest_time_ms:.2f}, "
+                        f"app;dur={total_ms:.2f}"
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log_request(scope, status_code, stats, start)
+
+    def _log_request(self, scope: Scope, status_code: int, stats, start: float):
+        """요청 DB 통계 로깅 (예산 초과 시 개발 모드 경고)"""
+        fields = {
+            "path": scope.get("path"),
+            "method": scope.get("method"),
+            "status_code": status_code,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            **stats.to_dict(),
+        }
+
+        if self.dev_mode and stats.query_count > self.query_budget:
+            logger.warning(
+                f"Query budget exceeded: {stats.query_count} queries "
+                f"(budget {self.query_budget}) on {scope.get('method')} {scope.get('path')}",
+                extra=fields
+            )
+        else:
+            logger.info("Request DB stats", extra=fields)
+
+
+class MetricsMiddleware:
+    """라우트별 요청 수/지연 시간을 /metrics용으로 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 경로 파라미터 대신 라우트 템플릿을 라벨로 사용 (카디널리티 제한)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "__unmatched__"
+            record_request(
+                scope.get("method", ""),
+                route_path,
+                status_code,
+                time.perf_counter() - start
+            )
@@ -0,0 +1,114 @@
+"""
+요청 단위 SQL 계측
+
+SQLAlchemy 엔진 이벤트로 쿼리 수, 총 DB 시간, 가장 느린 쿼리를 집계합니다.
+집계 대상은 ContextVar로 전달되므로 요청(또는 벤치마크 구간)마다 독립적으로 측정됩니다.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    """요청 하나에서 실행된 SQL 통계"""
+
+    def __init__(self):
+        self.query_count = 0
+        self.total_time_ms = 0.0
+        self.slowest_time_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed_ms: float):
+        """쿼리 실행 결과 기록"""
+        self.query_count += 1
+        self.total_time_ms += elapsed_ms
+        if elapsed_ms > self.slowest_time_ms:
+            self.slowest_time_ms = elapsed_ms
+            self.slowest_statement = statement
+
+    def to_dict(self) -> dict:
+        """로그/리포트용 딕셔너리 변환"""
+        return {
+            "query_count": self.query_count,
+            "db_time_ms": round(self.total_time_ms, 2),
+            "slowest_query_ms": round(self.slowest_time_ms, 2),
+            "slowest_statement": _shorten(self.slowest_statement),
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats",
+    default=None
+)
+
+
+def get_current_query_stats() -> Optional[QueryStats]:
+    """현재 컨텍스트에서 집계 중인 QueryStats 반환 (없으면 None)"""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 쿼리를 집계
+
+    사용 예:
+        with track_queries() as stats:
+            service.get_dashboard(item_id)
+        print(stats.query_count)
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각을 여기서 제거
+    # (풀에 반환된 연결의 conn.info가 유지되어 실패할 때마다 쌓이지 않도록)
+    conn = exception_context.connection
+    if conn is None or exception_context.execution_context is None:
+        return
+    start_times = conn.info.get("query_start_time")
+    if start_times:
+        start_times.pop()
+
+
+def install_query_instrumentation(engine: Engine):
+    """엔진에 쿼리 계측 이벤트 등록 (중복 등록 방지)"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _shorten(statement: Optional[str], max_length: int = 200) -> Optional[str]:
+    """로그용 SQL 축약 (공백 정리 + 길이 제한)"""
+    if statement is None:
+        return None
+    compact = " ".join(statement.split())
+    if len(compact) > max_length:
+        return compact[:max_length] + "..."
+    return compact
@@ -0,0 +1,56 @@
+"""모니터링 API 엔드포인트"""
+from fastapi import APIRouter, Query
+from fastapi.responses import PlainTextResponse
+
+from app.database.connection import engine
+from app.monitoring.metrics import render_metrics
+from app.monitoring.schemas import SlowQueryListResponse
+from app.monitoring.slow_query import slow_query_recorder
+
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Prometheus 스크레이프용 런타임 메트릭
+
+    - 라우트별 요청 수 / 지연 시간 히스토그램
+    - 예외 핸들러 에러 카운터
+    - DB 커넥션 풀 상태 (checked-out, overflow, 대기 시간)
+    - 캐시 적중률, 별칭 매칭 결과
+    """
+    return PlainTextResponse(
+        render_metrics(engine.pool),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
+@router.get("/admin/slow-queries", response_model=SlowQueryListResponse)
+async def get_slow_queries(
+    limit: int = Query(50, ge=1, le=1000, description="최대 결과 수")
+):
+    """
+    최근 슬로우 쿼리 조회 (관리자용)
+
+    SLOW_QUERY_THRESHOLD_MS가 설정된 경우에만 기록됩니다.
+    바인드 파라미터 값은 타입 표기로 마스킹됩니다.
+    """
+    if slow_query_recorder is None:
+        return SlowQueryListResponse(enabled=False, entries=[], total=0)
+
+    entries = slow_query_recorder.get_entries(limit)
+    return SlowQueryListResponse(
+        enabled=True,
+        threshold_ms=slow_query_recorder.threshold_ms,
+        entries=entries,
+        total=len(entries)
+    )
+
+
+@router.delete("/admin/slow-queries", status_code=204)
+async def clear_slow_queries():
+    """슬로우 쿼리 링 버퍼 비우기 (관리자용)"""
+    if slow_query_recorder is not None:
+        slow_query_recorder.clear()
@@ -0,0 +1,21 @@
+"""모니터링 관련 스키마"""
+from pydantic import BaseModel
+from typing import Any, List, Optional
+
+
+class SlowQueryEntry(BaseModel):
+    """슬로우 쿼리 기록"""
+    recorded_at: str
+    duration_ms: float
+    statement: str
+    parameters: Optional[Any] = None
+    executemany: bool = False
+    plan: Optional[List[str]] = None
+
+
+class SlowQueryListResponse(BaseModel):
+    """슬로우 쿼리 목록 응답"""
+    enabled: bool
+    threshold_ms: Optional[float] = None
+    entries: List[SlowQueryEntry]
+    total: int
@@ -0,0 +1,211 @@
+"""
+슬로우 쿼리 기록기 (opt-in)
+
+SLOW_QUERY_THRESHOLD_MS를 넘는 쿼리의 SQL, 마스킹된 바인드 파라미터, 실행 시간,
+EXPLAIN (ANALYZE off) 실행 계획을 링 버퍼와 로테이팅 로그 파일에 기록합니다.
+임계값이 설정되지 않으면 엔진에 이벤트를 등록하지 않습니다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 동일 SQL에 대해 EXPLAIN을 다시 실행하지 않는 기간 (초)
+EXPLAIN_CACHE_SECONDS = 300
+EXPLAIN_CACHE_SIZE = 256
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """바인드 파라미터 값을 타입 표기로 마스킹 (None은 그대로 유지)"""
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {key: _redact_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact_value(value) for value in parameters]
+    return _redact_value(parameters)
+
+
+def _redact_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return f"<{type(value).__name__}[{len(value)}]>"
+    return f"<{type(value).__name__}>"
+
+
+class SlowQueryRecorder:
+    """임계값을 넘는 쿼리를 기록하는 엔진 이벤트 리스너"""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        buffer_size: int = 100,
+        log_file: Optional[str] = None,
+        explain: bool = True,
+        log_max_bytes: int = 10 * 1024 * 1024,
+        log_backup_count: int = 5
+    ):
+        """
+        Args:
+            threshold_ms: 기록 임계값 (밀리초)
+            buffer_size: 링 버퍼 크기 (최근 N건 보관)
+            log_file: 로테이팅 로그 파일 경로 (None이면 파일 기록 안 함)
+            explain: EXPLAIN 실행 계획 수집 여부 (PostgreSQL 전용)
+            log_max_bytes: 로그 파일 최대 크기
+            log_backup_count: 보관할 로그 파일 수
+        """
+        self.threshold_ms = threshold_ms
+        self.explain = explain
+        self._entries: deque = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self._explain_cache: Dict[str, tuple] = {}
+        self._file_logger: Optional[logging.Logger] = None
+
+        if log_file:
+            self._file_logger = logging.getLogger(f"{__name__}.file")
+            self._file_logger.setLevel(logging.INFO)
+            self._file_logger.propagate = False
+            if not self._file_logger.handlers:
+                handler = RotatingFileHandler(
+                    log_file,
+                    maxBytes=log_max_bytes,
+                    backupCount=log_backup_count,
+                    encoding="utf-8"
+                )
+                handler.setFormatter(logging.Formatter("%(message)s"))
+                self._file_logger.addHandler(handler)
+
+    @classmethod
+    def from_env(cls) -> Optional["SlowQueryRecorder"]:
+        """환경변수로 생성 (SLOW_QUERY_THRESHOLD_MS 미설정 시 None)"""
+        threshold = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "0") or 0)
+        if threshold <= 0:
+            return None
+        return cls(
+            threshold_ms=threshold,
+            buffer_size=int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "100")),
+            log_file=os.getenv("SLOW_QUERY_LOG_FILE", "slow_queries.log") or None,
+            explain=os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true"
+        )
+
+    def install(self, engine: Engine):
+        """엔진에 이벤트 리스너 등록"""
+        if event.contains(engine, "before_cursor_execute", self._before_cursor_execute):
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        logger.info(f"Slow query recorder enabled (threshold {self.threshold_ms}ms)")
+
+    def get_entries(self, limit: Optional[int] = None) -> List[dict]:
+        """최근 기록 조회 (최신순)"""
+        with self._lock:
+            entries = list(reversed(self._entries))
+        return entries[:limit] if limit else entries
+
+    def clear(self):
+        """링 버퍼 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start_times = conn.info.get("slow_query_start_time")
+        if not start_times:
+            return
+        elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+        if elapsed_ms < self.threshold_ms:
+            return
+
+        plan = None
+        if self.explain and not executemany:
+            plan = self._explain(conn, statement, parameters)
+
+        entry = {
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "duration_ms": round(elapsed_ms, 2),
+            "statement": statement,
+            "parameters": redact_parameters(parameters),
+            "executemany": executemany,
+            "plan": plan,
+        }
+
+        with self._lock:
+            self._entries.append(entry)
+
+        logger.warning(
+            f"Slow query: {elapsed_ms:.1f}ms",
+            extra={"duration_ms": entry["duration_ms"], "statement": " ".join(statement.split())[:200]}
+        )
+        if self._file_logger:
+            self._file_logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+
+    def _handle_error(self, exception_context):
+        # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각을 여기서 제거 (풀 연결의 conn.info에 쌓이지 않도록)
+        conn = exception_context.connection
+        if conn is None or exception_context.execution_context is None:
+            return
+        start_times = conn.info.get("slow_query_start_time")
+        if start_times:
+            start_times.pop()
+
+    def _explain(self, conn, statement: str, parameters: Any) -> Optional[List[str]]:
+        """
+        EXPLAIN (ANALYZE off) 실행 계획 조회
+
+        - PostgreSQL의 SELECT/WITH 문만 대상
+        - SAVEPOINT 안에서 실행하여 실패해도 현재 트랜잭션에 영향 없음
+        - 같은 SQL은 EXPLAIN_CACHE_SECONDS 동안 캐시된 계획 재사용
+        """
+        if conn.dialect.name != "postgresql":
+            return None
+        keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+        if keyword not in ("SELECT", "WITH"):
+            return None
+
+        now = time.monotonic()
+        cached = self._explain_cache.get(statement)
+        if cached and now - cached[0] < EXPLAIN_CACHE_SECONDS:
+            return cached[1]
+
+        plan = None
+        explain_cursor = conn.connection.cursor()
+        try:
+            explain_cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                explain_cursor.execute(f"EXPLAIN (ANALYZE off) {statement}", parameters)
+                plan = [row[0] for row in explain_cursor.fetchall()]
+                explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            except Exception as e:
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                logger.debug(f"EXPLAIN failed: {e}")
+        except Exception as e:
+            # 트랜잭션 밖이거나 SAVEPOINT 미지원 등
+            logger.debug(f"EXPLAIN skipped: {e}")
+        finally:
+            explain_cursor.close()
+
+        if len(self._explain_cache) >= EXPLAIN_CACHE_SIZE:
+            self._explain_cache.clear()
+        self._explain_cache[statement] = (now, plan)
+        return plan
+
+
+# 프로세스 전역 기록기 (SLOW_QUERY_THRESHOLD_MS 설정 시에만 생성)
+slow_query_recorder: Optional[SlowQueryRecorder] = SlowQueryRecorder.from_env()
@@ -0,0 +1,6 @@
+"""
+Core Service 벤치마크
+
+- generate_data: 대규모 합성 데이터 생성 (품목/시장/별칭/가격 규칙/가격 이력)
+- run_benchmarks: 서비스 계층 벤치마크 (처리량, p50/p99, 쿼리 수를 JSON으로 출력)
+"""
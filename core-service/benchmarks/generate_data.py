@@ -0,0 +1,360 @@
+"""
+합성 데이터 생성기
+
+items, markets, item_aliases, price_rules, market_prices를 원하는 규모로 채웁니다.
+같은 --seed로 실행하면 같은 데이터가 생성되므로 벤치마크 결과를 비교할 수 있습니다.
+
+합성 데이터 식별 규칙 (--reset으로 삭제 시 사용):
+- 시장 코드: SYN0001 형식
+- 품목 영문명: "Synthetic ..." 접두사
+- 가격 출처: "synthetic"
+
+사용 예:
+    python benchmarks/generate_data.py --items 5000 --markets 40 --years 3
+    python benchmarks/generate_data.py --items 200 --markets 5 --years 1 --reset
+"""
+import argparse
+import csv
+import io
+import logging
+import math
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Sequence
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, Item, Market, MarketPrice, PriceRule, ItemAlias
+
+logger = logging.getLogger(__name__)
+
+SYNTHETIC_MARKET_PREFIX = "SYN"
+SYNTHETIC_ITEM_PREFIX = "Synthetic"
+SYNTHETIC_SOURCE = "synthetic"
+
+# (한글명, 영문명, 카테고리, 기준 가격(원/kg))
+BASE_SPECIES = [
+    ("광어", "Flounder", "fish", 25000),
+    ("우럭", "Rockfish", "fish", 22000),
+    ("참돔", "Red Seabream", "fish", 35000),
+    ("연어", "Salmon", "fish", 30000),
+    ("방어", "Yellowtail", "fish", 28000),
+    ("민어", "Croaker", "fish", 60000),
+    ("농어", "Sea Bass", "fish", 32000),
+    ("고등어", "Mackerel", "fish", 9000),
+    ("갈치", "Hairtail", "fish", 27000),
+    ("삼치", "Spanish Mackerel", "fish", 15000),
+    ("대게", "Snow Crab", "crustacean", 70000),
+    ("킹크랩", "King Crab", "crustacean", 90000),
+    ("꽃게", "Blue Crab", "crustacean", 35000),
+    ("새우", "Shrimp", "crustacean", 30000),
+    ("전복", "Abalone", "shellfish", 55000),
+    ("가리비", "Scallop", "shellfish", 18000),
+    ("굴", "Oyster", "shellfish", 14000),
+    ("홍합", "Mussel", "shellfish", 6000),
+    ("낙지", "Octopus", "cephalopod", 40000),
+    ("오징어", "Squid", "cephalopod", 20000),
+    ("문어", "Giant Octopus", "cephalopod", 45000),
+    ("주꾸미", "Webfoot Octopus", "cephalopod", 33000),
+]
+
+GRADES = ["", "특", "대", "중", "소", "활", "선어", "냉동"]
+ORIGINS = ["국산", "제주", "통영", "여수", "완도", "포항", "중국", "일본", "노르웨이", "러시아"]
+ALIAS_PATTERNS = ["{name}", "활{name}", "{name}(국산)", "{name} 1kg", "{name}(대)", "생{name}"]
+
+
+def chunked(rows: Sequence, size: int) -> Iterator[Sequence]:
+    """시퀀스를 size 단위로 분할"""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+class SyntheticDataGenerator:
+    """규모 조절이 가능한 합성 데이터 생성기"""
+
+    def __init__(
+        self,
+        db: Session,
+        items: int = 500,
+        markets: int = 10,
+        years: float = 1.0,
+        aliases_per_item: int = 3,
+        coverage: float = 0.6,
+        missing_rate: float = 0.05,
+        batch_size: int = 10000,
+        seed: int = 42,
+        end_date: date = None
+    ):
+        """
+        Args:
+            db: 데이터베이스 세션
+            items: 생성할 품목 수
+            markets: 생성할 시장 수
+            years: 가격 이력 기간 (년)
+            aliases_per_item: 시장별 품목당 별칭 수
+            coverage: 가격이 존재하는 (품목, 시장) 조합 비율 (0 ~ 1)
+            missing_rate: 가격이 비는 날(휴장/미수집) 비율
+            batch_size: 가격 INSERT/COPY 배치 크기
+            seed: 난수 시드
+            end_date: 가격 이력 마지막 날짜 (기본: 오늘)
+        """
+        self.db = db
+        self.item_count = items
+        self.market_count = markets
+        self.days = max(1, int(years * 365))
+        self.aliases_per_item = min(aliases_per_item, len(ALIAS_PATTERNS))
+        self.coverage = coverage
+        self.missing_rate = missing_rate
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.end_date = end_date or date.today()
+        self.use_copy = db.get_bind().dialect.name == "postgresql"
+
+    def reset(self):
+        """기존 합성 데이터 삭제 (실제 수집 데이터는 유지)"""
+        market_ids = select(Market.id).where(Market.code.like(f"{SYNTHETIC_MARKET_PREFIX}%"))
+        item_ids = select(Item.id).where(Item.name_en.like(f"{SYNTHETIC_ITEM_PREFIX} %"))
+
+        self.db.execute(delete(MarketPrice).where(MarketPrice.source == SYNTHETIC_SOURCE))
+        self.db.execute(delete(MarketPrice).where(MarketPrice.item_id.in_(item_ids)))
+        self.db.execute(delete(ItemAlias).where(ItemAlias.market_id.in_(market_ids)))
+        self.db.execute(delete(ItemAlias).where(ItemAlias.item_id.in_(item_ids)))
+        self.db.execute(delete(PriceRule).where(PriceRule.item_id.in_(item_ids)))
+        self.db.execute(delete(Item).where(Item.name_en.like(f"{SYNTHETIC_ITEM_PREFIX} %")))
+        self.db.execute(delete(Market).where(Market.code.like(f"{SYNTHETIC_MARKET_PREFIX}%")))
+        self.db.commit()
+        logger.info("Synthetic data removed")
+
+    def generate(self) -> Dict[str, int]:
+        """전체 데이터 생성 후 테이블별 생성 건수 반환"""
+        summary: Dict[str, int] = {}
+
+        started = time.perf_counter()
+        market_ids = self._create_markets()
+        item_specs = self._create_items()
+        summary["markets"] = len(market_ids)
+        summary["items"] = len(item_specs)
+        summary["price_rules"] = self._create_price_rules(item_specs)
+        summary["item_aliases"] = self._create_aliases(item_specs, market_ids)
+        summary["market_prices"] = self._create_prices(item_specs, market_ids)
+        summary["elapsed_seconds"] = round(time.perf_counter() - started, 1)
+        return summary
+
+    def _create_markets(self) -> List[int]:
+        start_no = self._next_synthetic_market_no()
+        rows = [
+            {
+                "name": f"합성시장 {start_no + i:04d}",
+                "code": f"{SYNTHETIC_MARKET_PREFIX}{start_no + i:04d}",
+                "type": "wholesale" if i % 3 else "retail",
+            }
+            for i in range(self.market_count)
+        ]
+        market_ids = self._insert_returning_ids(Market, rows)
+        self.db.commit()
+        logger.info(f"Markets created: {len(market_ids)}")
+        return market_ids
+
+    def _next_synthetic_market_no(self) -> int:
+        codes = self.db.execute(
+            select(Market.code).where(Market.code.like(f"{SYNTHETIC_MARKET_PREFIX}%"))
+        ).scalars().all()
+        numbers = [int(code[len(SYNTHETIC_MARKET_PREFIX):]) for code in codes
+                   if code[len(SYNTHETIC_MARKET_PREFIX):].isdigit()]
+        return max(numbers, default=0) + 1
+
+    def _create_items(self) -> List[dict]:
+        """품목 생성 - 반환값은 가격/별칭 생성에 필요한 품목별 속성"""
+        specs = []
+        rows = []
+        for i in range(self.item_count):
+            name_ko, name_en, category, base_price = BASE_SPECIES[i % len(BASE_SPECIES)]
+            grade = GRADES[(i // len(BASE_SPECIES)) % len(GRADES)]
+            serial = i // (len(BASE_SPECIES) * len(GRADES))
+            display_name = f"{grade}{name_ko}" + (f" {serial}" if serial else "")
+            season_start = self.rng.randint(1, 12)
+
+            rows.append({
+                "name_ko": display_name,
+                "name_en": f"{SYNTHETIC_ITEM_PREFIX} {name_en} {i}",
+                "category": category,
+                "season_start": season_start,
+                "season_end": (season_start + self.rng.randint(1, 4) - 1) % 12 + 1,
+                "default_origin": self.rng.choice(ORIGINS),
+                "unit_default": "kg",
+            })
+            specs.append({
+                "name": display_name,
+                "base_price": base_price * self.rng.uniform(0.7, 1.4),
+            })
+
+        for spec, item_id in zip(specs, self._insert_returning_ids(Item, rows)):
+            spec["id"] = item_id
+        self.db.commit()
+        logger.info(f"Items created: {len(specs)}")
+        return specs
+
+    def _create_price_rules(self, item_specs: List[dict]) -> int:
+        rows = [
+            {
+                "item_id": spec["id"],
+                "high_threshold": round(self.rng.uniform(1.10, 1.25), 2),
+                "low_threshold": round(self.rng.uniform(0.80, 0.92), 2),
+                "min_days": self.rng.choice([14, 30, 60]),
+            }
+            for spec in item_specs
+        ]
+        for batch in chunked(rows, self.batch_size):
+            self.db.execute(insert(PriceRule), list(batch))
+        self.db.commit()
+        logger.info(f"Price rules created: {len(rows)}")
+        return len(rows)
+
+    def _create_aliases(self, item_specs: List[dict], market_ids: List[int]) -> int:
+        """시장별로 품목당 aliases_per_item개의 별칭 생성 (시장 내 raw_name 중복 없음)"""
+        count = 0
+        for market_id in market_ids:
+            seen = set()
+            rows = []
+            for spec in item_specs:
+                patterns = self.rng.sample(ALIAS_PATTERNS, self.aliases_per_item)
+                for pattern in patterns:
+                    raw_name = pattern.format(name=spec["name"])
+                    if raw_name in seen:
+                        continue
+                    seen.add(raw_name)
+                    rows.append({
+                        "item_id": spec["id"],
+                        "market_id": market_id,
+                        "raw_name": raw_name,
+                        "confidence": 1.0 if pattern == "{name}" else 0.95,
+                    })
+            for batch in chunked(rows, self.batch_size):
+                self.db.execute(insert(ItemAlias), list(batch))
+            count += len(rows)
+        self.db.commit()
+        logger.info(f"Item aliases created: {count}")
+        return count
+
+    def _create_prices(self, item_specs: List[dict], market_ids: List[int]) -> int:
+        """(품목, 시장)별 평균 회귀 랜덤워크 + 계절성 가격 이력 생성"""
+        start_date = self.end_date - timedelta(days=self.days - 1)
+        market_factors = {market_id: self.rng.uniform(0.85, 1.25) for market_id in market_ids}
+
+        total = 0
+        buffer: List[tuple] = []
+        started = time.perf_counter()
+
+        for spec in item_specs:
+            phase = self.rng.uniform(0, 2 * math.pi)
+            for market_id in market_ids:
+                if self.rng.random() > self.coverage:
+                    continue
+                base = spec["base_price"] * market_factors[market_id]
+                origin = self.rng.choice(ORIGINS)
+                level = 0.0
+
+                for offset in range(self.days):
+                    # 평균 회귀 랜덤워크 (로그 스케일)
+                    level = level * 0.97 + self.rng.gauss(0, 0.03)
+                    if self.rng.random() < self.missing_rate:
+                        continue
+                    seasonal = 0.12 * math.sin(2 * math.pi * offset / 365 + phase)
+                    price = round(base * math.exp(level + seasonal), -1)
+                    buffer.append((
+                        spec["id"], market_id, start_date + timedelta(days=offset),
+                        max(price, 10), "kg", origin, SYNTHETIC_SOURCE
+                    ))
+
+                if len(buffer) >= self.batch_size:
+                    total += self._flush_prices(buffer)
+                    buffer = []
+                    logger.info(
+                        f"market_prices: {total:,} rows "
+                        f"({total / (time.perf_counter() - started):,.0f} rows/s)"
+                    )
+
+        if buffer:
+            total += self._flush_prices(buffer)
+        logger.info(f"Market prices created: {total:,}")
+        return total
+
+    def _flush_prices(self, rows: List[tuple]) -> int:
+        """가격 배치 저장 (PostgreSQL은 COPY, 그 외에는 executemany)"""
+        columns = ("item_id", "market_id", "date", "price", "unit", "origin", "source")
+        if self.use_copy:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            cursor = self.db.connection().connection.cursor()
+            try:
+                cursor.copy_expert(
+                    f"COPY market_prices ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                    buffer
+                )
+            finally:
+                cursor.close()
+        else:
+            self.db.execute(insert(MarketPrice), [dict(zip(columns, row)) for row in rows])
+        self.db.commit()
+        return len(rows)
+
+    def _insert_returning_ids(self, model, rows: List[dict]) -> List[int]:
+        """배치 INSERT 후 입력 순서대로 생성된 ID 반환"""
+        ids: List[int] = []
+        stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+        for batch in chunked(rows, self.batch_size):
+            ids.extend(self.db.execute(stmt, list(batch)).scalars().all())
+        return ids
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Core Service 합성 데이터 생성기")
+    parser.add_argument("--items", type=int, default=500, help="품목 수 (기본 500)")
+    parser.add_argument("--markets", type=int, default=10, help="시장 수 (기본 10)")
+    parser.add_argument("--years", type=float, default=1.0, help="가격 이력 기간 (년, 기본 1)")
+    parser.add_argument("--aliases-per-item", type=int, default=3, help="시장별 품목당 별칭 수")
+    parser.add_argument("--coverage", type=float, default=0.6, help="가격이 있는 (품목, 시장) 비율")
+    parser.add_argument("--missing-rate", type=float, default=0.05, help="가격이 비는 날 비율")
+    parser.add_argument("--batch-size", type=int, default=10000, help="INSERT/COPY 배치 크기")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--reset", action="store_true", help="기존 합성 데이터 삭제 후 생성")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args = parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        generator = SyntheticDataGenerator(
+            db,
+            items=args.items,
+            markets=args.markets,
+            years=args.years,
+            aliases_per_item=args.aliases_per_item,
+            coverage=args.coverage,
+            missing_rate=args.missing_rate,
+            batch_size=args.batch_size,
+            seed=args.seed
+        )
+        if args.reset:
+            generator.reset()
+        summary = generator.generate()
+    finally:
+        db.close()
+
+    for table, count in summary.items():
+        print(f"{table}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
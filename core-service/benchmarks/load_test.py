@@ -0,0 +1,404 @@
+"""
+Core Service 부하 테스트 (프로세스 내 ASGI)
+
+네트워크 없이 httpx ASGITransport로 FastAPI 앱을 직접 호출합니다.
+실제 트래픽과 비슷한 요청 비율과 Zipf 분포의 품목 인기도로 동시성 단계별 부하를 주고,
+지연 시간 백분위수와 포화 곡선(동시성 대비 처리량/p99)을 JSON으로 출력합니다.
+커넥션 풀(DB_POOL_SIZE/DB_MAX_OVERFLOW)이나 캐시 변경을 배포 전에 검증하는 용도입니다.
+
+기본 요청 비율:
+- dashboard 60%: GET /items/{item_id}/dashboard
+- latest    25%: GET /prices/latest/{item_id}/{market_id}
+- trend     10%: GET /prices/trend/{item_id}/{market_id}
+- search     5%: GET /items?query=...
+
+사용 예:
+    python benchmarks/load_test.py --concurrency 1,4,16,64 --duration 20
+    DB_POOL_SIZE=30 python benchmarks/load_test.py --output pool30.json
+"""
+import argparse
+import asyncio
+import bisect
+import json
+import logging
+import os
+import platform
+import random
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import anyio
+import httpx
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database import engine, MarketPrice
+from app.main import app
+from app.monitoring.metrics import DB_POOL_WAIT
+from benchmarks.run_benchmarks import SEARCH_TERMS, dataset_summary, git_revision
+from benchmarks.stats import summarize_latencies
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIX = "dashboard=60,latest=25,trend=10,search=5"
+ENDPOINTS = ("dashboard", "latest", "trend", "search")
+
+# 처리량 증가율이 이 값 미만이면 포화로 판단
+SATURATION_GAIN = 0.10
+
+_SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+_SERVER_TIMING_DB = re.compile(r"(?:^|,\s*)db;dur=([\d.]+)")
+
+
+class ZipfSampler:
+    """Zipf 분포 샘플러 (순위 k의 확률 ∝ 1 / k^exponent)"""
+
+    def __init__(self, values: List[int], exponent: float, rng: random.Random):
+        self.values = list(values)
+        rng.shuffle(self.values)
+        self.rng = rng
+
+        total = 0.0
+        self.cum_weights: List[float] = []
+        for rank in range(1, len(self.values) + 1):
+            total += 1.0 / rank ** exponent
+            self.cum_weights.append(total)
+
+    def sample(self) -> int:
+        point = self.rng.random() * self.cum_weights[-1]
+        return self.values[bisect.bisect_left(self.cum_weights, point)]
+
+
+class Workload:
+    """요청 비율과 품목 인기도에 따라 요청 경로를 생성"""
+
+    def __init__(
+        self,
+        item_markets: Dict[int, List[int]],
+        mix: Dict[str, float],
+        zipf_exponent: float,
+        seed: int
+    ):
+        self.rng = random.Random(seed)
+        self.item_markets = item_markets
+        self.items = ZipfSampler(sorted(item_markets), zipf_exponent, self.rng)
+
+        self.endpoints = list(mix)
+        self.endpoint_weights: List[float] = []
+        total = 0.0
+        for name in self.endpoints:
+            total += mix[name]
+            self.endpoint_weights.append(total)
+
+    def next_request(self) -> Tuple[str, str]:
+        """(엔드포인트 이름, 요청 경로) 반환"""
+        endpoint = self.rng.choices(self.endpoints, cum_weights=self.endpoint_weights)[0]
+        if endpoint == "search":
+            return endpoint, f"/items?query={self.rng.choice(SEARCH_TERMS)}"
+
+        item_id = self.items.sample()
+        if endpoint == "dashboard":
+            return endpoint, f"/items/{item_id}/dashboard"
+
+        market_id = self.rng.choice(self.item_markets[item_id])
+        if endpoint == "latest":
+            return endpoint, f"/prices/latest/{item_id}/{market_id}"
+        return endpoint, f"/prices/trend/{item_id}/{market_id}"
+
+
+def load_item_markets(max_items: Optional[int] = None) -> Dict[int, List[int]]:
+    """가격이 있는 품목별 시장 목록"""
+    with Session(engine) as db:
+        rows = db.execute(
+            select(MarketPrice.item_id, MarketPrice.market_id)
+            .group_by(MarketPrice.item_id, MarketPrice.market_id)
+        ).all()
+
+    item_markets: Dict[int, List[int]] = defaultdict(list)
+    for item_id, market_id in rows:
+        item_markets[item_id].append(market_id)
+
+    if max_items and len(item_markets) > max_items:
+        keep = sorted(item_markets)[:max_items]
+        item_markets = {item_id: item_markets[item_id] for item_id in keep}
+    return dict(item_markets)
+
+
+def _parse_server_timing(header: Optional[str]) -> Tuple[Optional[int], Optional[float]]:
+    """Server-Timing 헤더에서 (쿼리 수, DB 시간 ms) 추출"""
+    if not header:
+        return None, None
+    queries = _SERVER_TIMING_QUERIES.search(header)
+    db_time = _SERVER_TIMING_DB.search(header)
+    return (
+        int(queries.group(1)) if queries else None,
+        float(db_time.group(1)) if db_time else None,
+    )
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    workload: Workload,
+    concurrency: int,
+    duration: float,
+    warmup: float
+) -> Dict:
+    """
+    동시성 단계 하나 실행 (closed-loop)
+
+    concurrency개의 워커가 응답을 받는 즉시 다음 요청을 보냅니다.
+    워밍업 구간의 요청은 집계에서 제외합니다.
+    """
+    samples: List[tuple] = []
+    exceptions: Counter = Counter()
+    peak_checked_out = 0
+
+    loop_start = time.perf_counter()
+    measure_start = loop_start + warmup
+    deadline = measure_start + duration
+    pool_sum_before: Optional[Tuple[float, float]] = None
+
+    async def worker():
+        nonlocal pool_sum_before
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                return
+            if pool_sum_before is None and now >= measure_start:
+                pool_sum_before = DB_POOL_WAIT.get_sum_count()
+
+            endpoint, path = workload.next_request()
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+            except Exception as e:
+                if start >= measure_start:
+                    exceptions[type(e).__name__] += 1
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            if start >= measure_start:
+                queries, db_time = _parse_server_timing(response.headers.get("server-timing"))
+                samples.append((endpoint, elapsed_ms, response.status_code, queries, db_time))
+
+    async def monitor_pool():
+        nonlocal peak_checked_out
+        while time.perf_counter() < deadline:
+            checkedout = getattr(engine.pool, "checkedout", None)
+            if checkedout is not None:
+                peak_checked_out = max(peak_checked_out, checkedout())
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(monitor_pool(), *(worker() for _ in range(concurrency)))
+    elapsed = max(time.perf_counter() - measure_start, 1e-9)
+
+    pool_sum_after = DB_POOL_WAIT.get_sum_count()
+    pool_sum_before = pool_sum_before or pool_sum_after
+    pool_waits = pool_sum_after[1] - pool_sum_before[1]
+    pool_wait_ms = (
+        (pool_sum_after[0] - pool_sum_before[0]) / pool_waits * 1000 if pool_waits else 0.0
+    )
+
+    return summarize_level(concurrency, samples, exceptions, elapsed, {
+        "peak_checked_out": peak_checked_out,
+        "checkouts": int(pool_waits),
+        "mean_wait_ms": round(pool_wait_ms, 3),
+    })
+
+
+def summarize_level(
+    concurrency: int,
+    samples: List[tuple],
+    exceptions: Counter,
+    elapsed: float,
+    pool: Dict
+) -> Dict:
+    """단계별 결과 집계 (전체 및 엔드포인트별)"""
+    status_counts = Counter(str(status) for _, _, status, _, _ in samples)
+    server_errors = sum(1 for _, _, status, _, _ in samples if status >= 500)
+
+    by_endpoint: Dict[str, Dict] = {}
+    for name in ENDPOINTS:
+        rows = [s for s in samples if s[0] == name]
+        if not rows:
+            continue
+        queries = [s[3] for s in rows if s[3] is not None]
+        db_times = [s[4] for s in rows if s[4] is not None]
+        by_endpoint[name] = {
+            "requests": len(rows),
+            "latency_ms": summarize_latencies([s[1] for s in rows]),
+            "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+            "db_time_ms": round(sum(db_times) / len(db_times), 3) if db_times else None,
+        }
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "errors": server_errors + sum(exceptions.values()),
+        "status_counts": dict(sorted(status_counts.items())),
+        "exceptions": dict(exceptions),
+        "duration_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(samples) / elapsed, 2),
+        "latency_ms": summarize_latencies([s[1] for s in samples]),
+        "endpoints": by_endpoint,
+        "pool": pool,
+    }
+
+
+def saturation_curve(levels: List[Dict]) -> Dict:
+    """
+    포화 곡선과 포화 지점
+
+    포화 지점: 동시성을 올려도 처리량이 SATURATION_GAIN 미만으로만 늘어나기 시작한
+    직전 단계의 동시성 (끝까지 늘어나면 None)
+    """
+    points = [
+        {
+            "concurrency": level["concurrency"],
+            "throughput_rps": level["throughput_rps"],
+            "p50_ms": level["latency_ms"]["p50"],
+            "p99_ms": level["latency_ms"]["p99"],
+            "errors": level["errors"],
+        }
+        for level in levels
+    ]
+
+    saturation = None
+    for previous, current in zip(points, points[1:]):
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 + SATURATION_GAIN):
+            saturation = previous["concurrency"]
+            break
+    return {"points": points, "saturation_concurrency": saturation}
+
+
+async def run_load_test(args) -> Dict:
+    """동시성 단계별 부하 테스트 실행 후 리포트 생성"""
+    item_markets = load_item_markets(args.max_items)
+    if not item_markets:
+        raise SystemExit("market_prices가 비어 있습니다. 먼저 benchmarks/generate_data.py를 실행하세요.")
+
+    if args.threadpool_size:
+        # 동기 엔드포인트가 실행되는 스레드풀 크기 (anyio 기본 40)
+        anyio.to_thread.current_default_thread_limiter().total_tokens = args.threadpool_size
+
+    workload = Workload(item_markets, args.mix, args.zipf, args.seed)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    levels = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://core-service") as client:
+        for concurrency in args.concurrency:
+            logger.info(f"Load level: concurrency={concurrency}")
+            level = await run_level(client, workload, concurrency, args.duration, args.warmup)
+            levels.append(level)
+            logger.info(
+                f"concurrency={concurrency}: {level['throughput_rps']} req/s, "
+                f"p50 {level['latency_ms']['p50']}ms, p99 {level['latency_ms']['p99']}ms, "
+                f"errors {level['errors']}, peak pool checkout {level['pool']['peak_checked_out']}"
+            )
+
+    with Session(engine) as db:
+        dataset = dataset_summary(db)
+
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "dataset": dataset,
+        "config": {
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "warmup_seconds": args.warmup,
+            "mix": args.mix,
+            "zipf_exponent": args.zipf,
+            "items": len(item_markets),
+            "seed": args.seed,
+            "threadpool_size": args.threadpool_size,
+            "pool": {
+                "pool_size": engine.pool.size() if hasattr(engine.pool, "size") else None,
+                "max_overflow": getattr(engine.pool, "_max_overflow", None),
+            },
+        },
+        "levels": levels,
+        "saturation": saturation_curve(levels),
+    }
+
+
+def _parse_mix(value: str) -> Dict[str, float]:
+    mix: Dict[str, float] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"알 수 없는 엔드포인트: {name} (사용 가능: {', '.join(ENDPOINTS)})")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"잘못된 비율: {part}")
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("비율 합계가 0입니다")
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def _parse_levels(value: str) -> List[int]:
+    try:
+        levels = [int(part) for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"잘못된 동시성 목록: {value}")
+    if not levels or min(levels) < 1:
+        raise argparse.ArgumentTypeError("동시성은 1 이상이어야 합니다")
+    return levels
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Core Service 부하 테스트 (ASGI, 네트워크 없음)")
+    parser.add_argument("--concurrency", type=_parse_levels, default=[1, 4, 16, 32, 64],
+                        help="동시성 단계 (쉼표 구분, 기본 1,4,16,32,64)")
+    parser.add_argument("--duration", type=float, default=15.0, help="단계별 측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=2.0, help="단계별 워밍업 시간 (초, 집계 제외)")
+    parser.add_argument("--mix", type=_parse_mix, default=_parse_mix(DEFAULT_MIX),
+                        help=f"엔드포인트 비율 (기본 {DEFAULT_MIX})")
+    parser.add_argument("--zipf", type=float, default=1.1, help="품목 인기도 Zipf 지수 (기본 1.1)")
+    parser.add_argument("--max-items", type=int, help="대상 품목 수 제한")
+    parser.add_argument("--threadpool-size", type=int, help="동기 엔드포인트 스레드풀 크기 (기본 anyio 40)")
+    parser.add_argument("--seed", type=int, default=42, help="요청 생성 시드")
+    parser.add_argument("--output", help="JSON 리포트 저장 경로 (기본: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # 요청 단위 로그가 측정을 방해하지 않도록 억제
+    logging.getLogger("app").setLevel(logging.ERROR)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    args = parse_args(argv)
+
+    report = asyncio.run(run_load_test(args))
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        logger.info(f"Report written to {args.output}")
+    else:
+        print(output)
+
+    print(f"{'concurrency':>11} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'errors':>8}", file=sys.stderr)
+    for point in report["saturation"]["points"]:
+        print(
+            f"{point['concurrency']:>11} {point['throughput_rps']:>10} "
+            f"{point['p50_ms']:>10} {point['p99_ms']:>10} {point['errors']:>8}",
+            file=sys.stderr
+        )
+    print(f"saturation concurrency: {report['saturation']['saturation_concurrency']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
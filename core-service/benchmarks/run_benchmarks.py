@@ -0,0 +1,417 @@
+"""
+Core Service 벤치마크 실행기
+
+서비스 계층의 주요 경로를 반복 실행하여 처리량, 지연 시간 분포(p50/p99),
+작업당 쿼리 수를 JSON으로 출력합니다. 각 케이스는 롤백되는 트랜잭션 안에서
+실행되므로 bulk_insert 케이스도 데이터베이스에 흔적을 남기지 않습니다.
+
+케이스:
+- latest_price: PriceService.get_latest_price
+- trend: PriceService.get_price_trend (30일)
+- dashboard: DashboardService.get_dashboard
+- search: ItemService.search_items
+- alias_match: AliasMatcher.match_item (정확 70% / 변형 20% / 미등록 10%)
+- alias_match_bulk: AliasMatcher.match_items (작업당 --bulk-size개 이름, 같은 분포, 중복 포함)
+- bulk_insert: PriceRepository.bulk_insert (--bulk-size 행)
+- diff_upsert: PriceRepository.diff_upsert (--bulk-size 행, 작업마다 10%만 가격 변경)
+
+사용 예:
+    python benchmarks/generate_data.py --items 5000 --markets 40 --years 3
+    python benchmarks/run_benchmarks.py --iterations 200 --output bench.json
+    python benchmarks/run_benchmarks.py --cases dashboard,search --compare bench.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.aliases.matcher import AliasMatcher
+from app.database import engine, Item, Market, MarketPrice, ItemAlias, PriceRepository
+from app.items.dashboard_service import DashboardService
+from app.items.service import ItemService
+from app.monitoring.query_stats import track_queries
+from app.prices.service import PriceService
+from benchmarks.stats import percent_change, summarize_latencies
+
+logger = logging.getLogger(__name__)
+
+# bulk_insert 케이스가 저장하는 행의 출처 (정리용)
+BULK_INSERT_SOURCE = "benchmark"
+
+SEARCH_TERMS = ["광어", "우럭", "참돔", "연어", "대게", "전복", "오징어", "활", "냉동", "새우"]
+
+
+class BenchmarkContext:
+    """케이스들이 공유하는 샘플 데이터 (시드 고정)"""
+
+    def __init__(self, db: Session, seed: int, sample_size: int = 500):
+        self.rng = random.Random(seed)
+
+        # 가격이 있는 (품목, 시장) 조합만 샘플링
+        pairs = db.execute(
+            select(MarketPrice.item_id, MarketPrice.market_id)
+            .group_by(MarketPrice.item_id, MarketPrice.market_id)
+            .limit(sample_size * 20)
+        ).all()
+        self.price_pairs = self.rng.sample(pairs, min(sample_size, len(pairs)))
+        self.item_ids = sorted({item_id for item_id, _ in self.price_pairs})
+        self.market_ids = db.execute(select(Market.id)).scalars().all()
+
+        aliases = db.execute(
+            select(ItemAlias.raw_name, ItemAlias.market_id).limit(sample_size * 20)
+        ).all()
+        self.aliases = self.rng.sample(aliases, min(sample_size, len(aliases)))
+
+    def random_pair(self):
+        return self.rng.choice(self.price_pairs)
+
+    def random_alias_query(self):
+        """정확 일치 70%, 오타 변형 20%, 미등록 이름 10%"""
+        raw_name, market_id = self.rng.choice(self.aliases)
+        roll = self.rng.random()
+        if roll < 0.7:
+            return raw_name, market_id
+        if roll < 0.9:
+            return raw_name + "ㅇ", market_id
+        return f"미등록품목{self.rng.randint(1, 10**6)}", market_id
+
+
+def _case_latest_price(db: Session, ctx: BenchmarkContext) -> Callable[[], None]:
+    service = PriceService(db)
+
+    def run():
+        item_id, market_id = ctx.random_pair()
+        service.get_latest_price(item_id, market_id)
+    return run
+
+
+def _case_trend(db: Session, ctx: BenchmarkContext) -> Callable[[], None]:
+    service = PriceService(db)
+
+    def run():
+        item_id, market_id = ctx.random_pair()
+        service.get_price_trend(item_id, market_id, 30)
+    return run
+
+
+def _case_dashboard(db: Session, ctx: BenchmarkContext) -> Callable[[], None]:
+    service = DashboardService(db)
+
+    def run():
+        service.get_dashboard(ctx.rng.choice(ctx.item_ids))
+    return run
+
+
+def _case_search(db: Session, ctx: BenchmarkContext) -> Callable[[], None]:
+    service = ItemService(db)
+
+    def run():
+        service.search_items(query=ctx.rng.choice(SEARCH_TERMS), limit=10)
+    return run
+
+
+def _case_alias_match(db: Session, ctx: BenchmarkContext) -> Callable[[], None]:
+    matcher = AliasMatcher(db)
+
+    def run():
+        raw_name, market_id = ctx.random_alias_query()
+        matcher.match_item(raw_name, market_id)
+    return run
+
+
+def _case_alias_match_bulk(db: Session, ctx: BenchmarkContext, bulk_size: int) -> Callable[[], None]:
+    matcher = AliasMatcher(db)
+
+    def run():
+        matcher.match_items([ctx.random_alias_query() for _ in range(bulk_size)])
+    return run
+
+
+def _case_bulk_insert(db: Session, ctx: BenchmarkContext, bulk_size: int) -> Callable[[], None]:
+    repo = PriceRepository(db)
+    # 실제 데이터와 겹치지 않는 미래 날짜 사용 (트랜잭션 종료 시 롤백)
+    state = {"date": date.today() + timedelta(days=3650)}
+
+    def run():
+        state["date"] += timedelta(days=1)
+        rows = [
+            {
+                "item_id": item_id,
+                "market_id": market_id,
+                "date": state["date"],
+                "price": ctx.rng.randint(1000, 100000),
+                "unit": "kg",
+                "origin": "국산",
+                "source": BULK_INSERT_SOURCE,
+            }
+            for item_id, market_id in ctx.price_pairs[:bulk_size]
+        ]
+        repo.bulk_insert(rows)
+    return run
+
+
+def _case_diff_upsert(db: Session, ctx: BenchmarkContext, bulk_size: int) -> Callable[[], None]:
+    repo = PriceRepository(db)
+    # 같은 날짜의 행을 반복 저장 (첫 작업만 삽입, 이후에는 대부분 변경 없음)
+    target_date = date.today() + timedelta(days=7300)
+    rows = [
+        {
+            "item_id": item_id,
+            "market_id": market_id,
+            "date": target_date,
+            "price": ctx.rng.randint(1000, 100000),
+            "unit": "kg",
+            "origin": "국산",
+            "source": BULK_INSERT_SOURCE,
+        }
+        for item_id, market_id in ctx.price_pairs[:bulk_size]
+    ]
+
+    def run():
+        for row in ctx.rng.sample(rows, max(1, len(rows) // 10)):
+            row["price"] = ctx.rng.randint(1000, 100000)
+        repo.diff_upsert(rows)
+    return run
+
+
+def _cleanup_bulk_rows():
+    """
+    bulk_insert/diff_upsert 케이스가 남긴 행 삭제
+
+    SQLite 드라이버(pysqlite)는 SAVEPOINT 기반 롤백이 보장되지 않으므로
+    출처(source)로 한 번 더 정리합니다. PostgreSQL에서는 삭제 대상이 없습니다.
+    """
+    with Session(engine) as db:
+        db.execute(delete(MarketPrice).where(MarketPrice.source == BULK_INSERT_SOURCE))
+        db.commit()
+
+
+CASES = [
+    "latest_price", "trend", "dashboard", "search", "alias_match", "alias_match_bulk",
+    "bulk_insert", "diff_upsert",
+]
+
+# 작업당 --bulk-size 행을 저장하는 케이스
+WRITE_CASES = ("bulk_insert", "diff_upsert")
+
+
+def _build_case(name: str, db: Session, ctx: BenchmarkContext, args) -> Callable[[], None]:
+    if name == "bulk_insert":
+        return _case_bulk_insert(db, ctx, args.bulk_size)
+    if name == "diff_upsert":
+        return _case_diff_upsert(db, ctx, args.bulk_size)
+    if name == "alias_match_bulk":
+        return _case_alias_match_bulk(db, ctx, args.bulk_size)
+    builders = {
+        "latest_price": _case_latest_price,
+        "trend": _case_trend,
+        "dashboard": _case_dashboard,
+        "search": _case_search,
+        "alias_match": _case_alias_match,
+    }
+    return builders[name](db, ctx)
+
+
+def run_case(name: str, ctx: BenchmarkContext, args) -> Dict:
+    """
+    단일 케이스 실행
+
+    세션을 외부 트랜잭션에 묶고(create_savepoint) 끝에서 롤백하므로
+    케이스 내부의 commit()은 SAVEPOINT 해제로만 동작합니다.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
+
+    latencies: List[float] = []
+    query_counts: List[int] = []
+    db_times: List[float] = []
+    errors = 0
+    first_error: Optional[str] = None
+
+    try:
+        operation = _build_case(name, db, ctx, args)
+
+        for _ in range(args.warmup):
+            try:
+                operation()
+            except Exception:
+                db.rollback()
+
+        wall_start = time.perf_counter()
+        for _ in range(args.iterations):
+            with track_queries() as stats:
+                start = time.perf_counter()
+                try:
+                    operation()
+                except Exception as e:
+                    errors += 1
+                    first_error = first_error or f"{type(e).__name__}: {e}"[:300]
+                    db.rollback()
+                    continue
+                latencies.append((time.perf_counter() - start) * 1000)
+            query_counts.append(stats.query_count)
+            db_times.append(stats.total_time_ms)
+        wall_seconds = time.perf_counter() - wall_start
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+        if name in WRITE_CASES:
+            _cleanup_bulk_rows()
+
+    completed = len(latencies)
+    result = {
+        "iterations": args.iterations,
+        "completed": completed,
+        "errors": errors,
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_ops": round(completed / wall_seconds, 2) if wall_seconds else 0.0,
+        "latency_ms": summarize_latencies(latencies),
+        "queries_per_op": {
+            "mean": round(sum(query_counts) / completed, 2) if completed else 0.0,
+            "max": max(query_counts, default=0),
+        },
+        "db_time_ms_per_op": round(sum(db_times) / completed, 3) if completed else 0.0,
+    }
+    if name in WRITE_CASES:
+        rows_per_op = min(args.bulk_size, len(ctx.price_pairs))
+        result["rows_per_op"] = rows_per_op
+        result["throughput_rows"] = round(result["throughput_ops"] * rows_per_op, 1)
+    if first_error:
+        result["first_error"] = first_error
+    return result
+
+
+def dataset_summary(db: Session) -> Dict[str, int]:
+    """벤치마크 대상 데이터 규모"""
+    return {
+        "items": db.scalar(select(func.count()).select_from(Item)),
+        "markets": db.scalar(select(func.count()).select_from(Market)),
+        "item_aliases": db.scalar(select(func.count()).select_from(ItemAlias)),
+        "market_prices": db.scalar(select(func.count()).select_from(MarketPrice)),
+    }
+
+
+def git_revision() -> Optional[str]:
+    """현재 git 커밋 해시 (리포트 식별용, git이 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(args) -> Dict:
+    """선택한 케이스를 순서대로 실행하고 리포트 생성"""
+    with Session(engine) as db:
+        dataset = dataset_summary(db)
+        ctx = BenchmarkContext(db, seed=args.seed, sample_size=args.sample_size)
+
+    if not ctx.price_pairs:
+        raise SystemExit("market_prices가 비어 있습니다. 먼저 benchmarks/generate_data.py를 실행하세요.")
+
+    results = {}
+    for name in args.cases:
+        logger.info(f"Running benchmark: {name}")
+        ctx.rng.seed(args.seed)
+        results[name] = run_case(name, ctx, args)
+        logger.info(
+            f"{name}: {results[name]['throughput_ops']} ops/s, "
+            f"p50 {results[name]['latency_ms']['p50']}ms, "
+            f"p99 {results[name]['latency_ms']['p99']}ms, "
+            f"{results[name]['queries_per_op']['mean']} queries/op"
+        )
+
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "dataset": dataset,
+        "config": {
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "sample_size": args.sample_size,
+            "bulk_size": args.bulk_size,
+        },
+        "results": results,
+    }
+
+
+def compare_reports(baseline: Dict, current: Dict) -> List[str]:
+    """기준 리포트 대비 처리량/p50/p99/쿼리 수 변화율 표"""
+    lines = [f"{'case':<14} {'ops/s':>10} {'p50':>10} {'p99':>10} {'queries':>10}"]
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        lines.append(
+            f"{name:<14} "
+            f"{percent_change(base['throughput_ops'], result['throughput_ops']):>+9}% "
+            f"{percent_change(base['latency_ms']['p50'], result['latency_ms']['p50']):>+9}% "
+            f"{percent_change(base['latency_ms']['p99'], result['latency_ms']['p99']):>+9}% "
+            f"{percent_change(base['queries_per_op']['mean'], result['queries_per_op']['mean']):>+9}%"
+        )
+    return lines
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Core Service 벤치마크")
+    parser.add_argument("--cases", default=",".join(CASES), help="실행할 케이스 (쉼표 구분, 기본: 전체)")
+    parser.add_argument("--iterations", type=int, default=200, help="케이스별 측정 반복 수")
+    parser.add_argument("--warmup", type=int, default=20, help="케이스별 워밍업 반복 수")
+    parser.add_argument("--seed", type=int, default=42, help="샘플링 시드")
+    parser.add_argument("--sample-size", type=int, default=500, help="샘플링할 (품목, 시장) 조합 수")
+    parser.add_argument("--bulk-size", type=int, default=500, help="bulk_insert/diff_upsert/alias_match_bulk 케이스의 작업당 행 수")
+    parser.add_argument("--output", help="JSON 리포트 저장 경로 (기본: stdout)")
+    parser.add_argument("--compare", help="비교할 기준 JSON 리포트")
+    args = parser.parse_args(argv)
+
+    args.cases = [name.strip() for name in args.cases.split(",") if name.strip()]
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"알 수 없는 케이스: {', '.join(unknown)} (사용 가능: {', '.join(CASES)})")
+    return args
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # 벤치마크 중 매칭 실패 경고 로그가 측정을 방해하지 않도록 억제
+    logging.getLogger("app.aliases.matcher").setLevel(logging.ERROR)
+    args = parse_args(argv)
+
+    report = run_benchmarks(args)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        logger.info(f"Report written to {args.output}")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print("\n".join(compare_reports(baseline, report)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""벤치마크 결과 집계 유틸리티"""
+from typing import Dict, List, Sequence
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    백분위수 계산 (선형 보간)
+
+    Args:
+        sorted_values: 오름차순 정렬된 값 목록
+        pct: 백분위 (0 ~ 100)
+    """
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return float(sorted_values[0])
+
+    rank = (len(sorted_values) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = rank - lower
+    return float(sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight)
+
+
+def summarize_latencies(latencies_ms: List[float]) -> Dict[str, float]:
+    """지연 시간 분포 요약 (mean/p50/p90/p99/max, 밀리초)"""
+    values = sorted(latencies_ms)
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "mean": round(sum(values) / len(values), 3),
+        "p50": round(percentile(values, 50), 3),
+        "p90": round(percentile(values, 90), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(values[-1], 3),
+    }
+
+
+def percent_change(baseline: float, current: float) -> float:
+    """기준 대비 변화율 (%) - 기준이 0이면 0 반환"""
+    if not baseline:
+        return 0.0
+    return round((current - baseline) / baseline * 100, 1)
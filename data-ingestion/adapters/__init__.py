@@ -6,6 +6,30 @@
 from .base import MarketAdapter, RawPriceData
 from .garak import GarakAdapter
 from .noryangjin import NoryangjinAdapter
+from .units import ParsedUnit, parse_unit, normalize_unit, convert_prices
+from .price_batch import RawPriceBatch, NormalizedPriceBatch, fetch_price_batch
+from .dead_letters import DeadLetter, DeadLetterSink, collect_dead_letters, record_dead_letter
+from .payload_archive import ArchivedPayload, ArchiveMissError, ArchiveTransport, PayloadArchive, record_payloads
+
+# 공용 HTTP 전송 계층
+from .http_transport import (
+    DeadlineExceededError,
+    HttpTransport,
+    PayloadMeter,
+    get_transport,
+    measure_payload,
+    request_deadline,
+)
+from .rate_limit import TokenBucket, CircuitBreaker, CircuitOpenError
+
+# 공공데이터 응답 캐시
+from .response_cache import (
+    CachedResponse,
+    ResponseCache,
+    RedisResponseCache,
+    DiskResponseCache,
+    get_response_cache,
+)
 
 # 공공데이터 API 어댑터
 from .public_data_base import BasePublicDataAdapter, DataCategory
@@ -30,6 +54,48 @@ __all__ = [
     'GarakAdapter',
     'NoryangjinAdapter',
     
+    # 수량/단위 변환
+    'ParsedUnit',
+    'parse_unit',
+    'normalize_unit',
+    'convert_prices',
+    
+    # 컬럼 배치
+    'RawPriceBatch',
+    'NormalizedPriceBatch',
+    'fetch_price_batch',
+    
+    # 수집 실패 행
+    'DeadLetter',
+    'DeadLetterSink',
+    'collect_dead_letters',
+    'record_dead_letter',
+    
+    # 원본 응답 보관
+    'ArchivedPayload',
+    'ArchiveMissError',
+    'ArchiveTransport',
+    'PayloadArchive',
+    'record_payloads',
+    
+    # 공용 HTTP 전송 계층
+    'HttpTransport',
+    'get_transport',
+    'PayloadMeter',
+    'measure_payload',
+    'request_deadline',
+    'DeadlineExceededError',
+    'TokenBucket',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    
+    # 공공데이터 응답 캐시
+    'CachedResponse',
+    'ResponseCache',
+    'RedisResponseCache',
+    'DiskResponseCache',
+    'get_response_cache',
+    
     # 공공데이터 API 어댑터
     'BasePublicDataAdapter',
     'DataCategory',
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass
 
 @dataclass
@@ -12,6 +12,7 @@ class RawPriceData:
     date: datetime
     origin: str = ""
     source: str = ""
+    market_id: Optional[int] = None  # 여러 시장이 섞인 응답(KAMIS 등)에서 레코드별 시장
 
 class MarketAdapter(ABC):
     """시장 데이터 수집 어댑터 기본 클래스"""
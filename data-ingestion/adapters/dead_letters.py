@@ -0,0 +1,120 @@
+"""
+수집 실패 행 (dead letter) 수집
+
+어댑터 파서가 예외로 건너뛴 행과 DataNormalizer가 버린 행(검증 실패, 품목명 매핑 실패)을
+원본 조각 그대로 모읍니다. 스케줄러/백필이 ingestion_dead_letters 테이블에 저장하고,
+replay.py가 별칭이나 파서를 고친 뒤 네트워크 요청 없이 다시 처리합니다.
+- parse 단계: 어댑터 응답 조각 (가락 응답 항목, 노량진 테이블 셀 목록, KAMIS 응답 항목)
+  → 어댑터의 parse_dead_letter()로 다시 파싱
+- normalize 단계: RawPriceData 필드 목록 (compact_record) → restore_record()로 복원
+
+collect_dead_letters() 블록 밖(벤치마크, 단독 어댑터 호출 등)에서는 아무것도 모으지 않습니다.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Iterator, List, Optional
+
+from .base import RawPriceData
+
+# 실패 단계
+STAGE_PARSE = "parse"
+STAGE_NORMALIZE = "normalize"
+
+# normalize 단계 실패 사유
+REASON_INVALID = "invalid"
+REASON_UNMATCHED = "unmatched"
+
+
+@dataclass
+class DeadLetter:
+    """실패 행 하나"""
+    stage: str
+    reason: str                   # 파싱 예외 클래스 이름 또는 invalid / unmatched
+    record: Any                   # JSON으로 저장할 원본 조각
+    error: Optional[str] = None
+
+
+class DeadLetterSink:
+    """collect_dead_letters 블록 안에서 모은 실패 행 (여러 스레드에서 추가해도 안전)"""
+
+    def __init__(self):
+        self.letters: List[DeadLetter] = []
+        self._lock = threading.Lock()
+
+    def add(self, letter: DeadLetter):
+        with self._lock:
+            self.letters.append(letter)
+
+    def __len__(self) -> int:
+        return len(self.letters)
+
+
+_dead_letter_sink: ContextVar[Optional[DeadLetterSink]] = ContextVar("dead_letter_sink", default=None)
+
+
+@contextmanager
+def collect_dead_letters() -> Iterator[DeadLetterSink]:
+    """
+    블록 안에서 버려진 행 수집
+
+    measure_payload와 마찬가지로 현재 컨텍스트만 집계하므로, 다른 스레드로 파싱을 넘길 때는
+    contextvars.copy_context().run으로 감싸야 함께 모입니다.
+
+    사용 예:
+        with collect_dead_letters() as sink:
+            raw_data = adapter.fetch_data(date)
+            normalized = normalizer.normalize(raw_data, market_id)
+        dead_letter_repository.record(adapter_name, date, [asdict(l) for l in sink.letters])
+    """
+    sink = DeadLetterSink()
+    token = _dead_letter_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _dead_letter_sink.reset(token)
+
+
+def collecting() -> bool:
+    """실패 행을 모으는 중인지 (모으지 않으면 원본 조각을 만들 필요 없음)"""
+    return _dead_letter_sink.get() is not None
+
+
+def record_dead_letter(stage: str, reason: str, record: Any, error: Optional[str] = None):
+    """실패 행 기록 (collect_dead_letters 블록 밖이면 무시)"""
+    sink = _dead_letter_sink.get()
+    if sink is not None:
+        sink.add(DeadLetter(stage, reason, record, error))
+
+
+def compact_record(data: RawPriceData, market_id: Optional[int]) -> list:
+    """normalize 단계 실패 행의 저장 형식 [품목명, 가격, 규격, 날짜, 산지, 출처, 시장 ID]"""
+    return [
+        data.raw_name,
+        data.price,
+        data.unit,
+        _as_date(data.date).isoformat(),
+        data.origin or "",
+        data.source or "",
+        market_id,
+    ]
+
+
+def restore_record(record: list) -> RawPriceData:
+    """compact_record 형식을 RawPriceData로 복원"""
+    raw_name, price, unit, price_date, origin, source, market_id = record
+    return RawPriceData(
+        raw_name=raw_name,
+        price=price,
+        unit=unit,
+        date=date.fromisoformat(price_date),
+        origin=origin,
+        source=source,
+        market_id=market_id,
+    )
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
@@ -2,11 +2,14 @@
 가락시장 데이터 수집 어댑터
 공공데이터 포털 API를 통해 가락시장 경락가 정보를 수집합니다.
 """
-from datetime import datetime
-from typing import List
-import requests
+from datetime import date as date_type, datetime
+from typing import List, Optional
+import httpx
 import logging
 from .base import MarketAdapter, RawPriceData
+from .dead_letters import STAGE_PARSE, record_dead_letter
+from .http_transport import HttpTransport, get_transport
+from .units import normalize_unit
 
 logger = logging.getLogger(__name__)
 
@@ -16,15 +19,17 @@ class GarakAdapter(MarketAdapter):
     
     MARKET_ID = 1  # 가락시장 ID
     
-    def __init__(self, api_key: str, base_url: str = None):
+    def __init__(self, api_key: str, base_url: str = None, transport: Optional[HttpTransport] = None):
         """
         Args:
             api_key: 공공데이터 포털 API 키
             base_url: API 기본 URL (기본값: 공공데이터 포털)
+            transport: HTTP 전송 계층 (기본값: 프로세스 공용 전송 계층)
         """
         self.api_key = api_key
         self.base_url = base_url or "https://www.kamis.or.kr/service/price/xml.do"
         self.timeout = 30
+        self.transport = transport or get_transport()
     
     def get_market_id(self) -> int:
         """시장 ID 반환"""
@@ -54,17 +59,17 @@ class GarakAdapter(MarketAdapter):
                 'p_convert_kg_yn': 'Y',  # kg 단위로 변환
             }
             
-            response = requests.get(
+            response = self.transport.request_sync(
+                'GET',
                 self.base_url,
                 params=params,
                 timeout=self.timeout
             )
-            response.raise_for_status()
             
             data = response.json()
             return self._parse_response(data, date)
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch Garak market data: {str(e)}")
             raise
         except Exception as e:
@@ -92,36 +97,67 @@ class GarakAdapter(MarketAdapter):
         
         for item in items:
             try:
-                # 품목명
-                raw_name = item.get('item_name', '').strip()
-                if not raw_name:
-                    continue
-                
-                # 가격 (중간가 사용)
-                price_str = item.get('dpr2', '0').replace(',', '')
-                price = float(price_str)
-                
-                if price <= 0:
-                    continue
-                
-                # 단위
-                unit = item.get('unit', 'kg').strip()
-                
-                # 산지
-                origin = item.get('origin', '').strip()
-                
-                results.append(RawPriceData(
-                    raw_name=raw_name,
-                    price=price,
-                    unit=unit,
-                    date=date,
-                    origin=origin,
-                    source='가락시장(공공데이터)'
-                ))
-                
+                price_data = self._parse_item(item, date)
             except (ValueError, KeyError) as e:
                 logger.warning(f"Failed to parse item: {item}, error: {str(e)}")
+                record_dead_letter(STAGE_PARSE, type(e).__name__, item, str(e))
                 continue
+            
+            if price_data is not None:
+                results.append(price_data)
         
         logger.info(f"Parsed {len(results)} items from Garak market")
         return results
+    
+    def _parse_item(self, item: dict, date: datetime) -> Optional[RawPriceData]:
+        """
+        응답 항목 하나를 RawPriceData로 변환
+        
+        Returns:
+            RawPriceData, 건너뛸 항목(품목명 없음, 가격 0 이하)이면 None
+            
+        Raises:
+            ValueError, KeyError: 파싱할 수 없는 항목
+        """
+        # 품목명
+        raw_name = item.get('item_name', '').strip()
+        if not raw_name:
+            return None
+        
+        # 가격 (중간가 사용)
+        price_str = item.get('dpr2', '0').replace(',', '')
+        price = float(price_str)
+        
+        if price <= 0:
+            return None
+        
+        # 단위 (수량 보존, 예: "10kg")
+        unit = normalize_unit(item.get('unit'))
+        
+        # 산지
+        origin = item.get('origin', '').strip()
+        
+        return RawPriceData(
+            raw_name=raw_name,
+            price=price,
+            unit=unit,
+            date=date,
+            origin=origin,
+            source='가락시장(공공데이터)'
+        )
+    
+    def parse_dead_letter(self, record: dict, target_date: date_type) -> Optional[RawPriceData]:
+        """
+        저장된 실패 항목 다시 파싱 (replay.py, 네트워크 요청 없음)
+        
+        Args:
+            record: 파싱에 실패했던 응답 항목
+            target_date: 수집일
+            
+        Returns:
+            RawPriceData (시장 ID 포함), 건너뛸 항목이면 None
+        """
+        price_data = self._parse_item(record, datetime.combine(target_date, datetime.min.time()))
+        if price_data is not None:
+            price_data.market_id = self.MARKET_ID
+        return price_data
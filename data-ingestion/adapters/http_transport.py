@@ -0,0 +1,573 @@
+"""
+공용 비동기 HTTP 전송 계층
+
+모든 어댑터가 하나의 httpx 기반 전송 계층을 공유합니다.
+- 호스트별 AsyncClient 커넥션 풀 (HTTP keep-alive 재사용)
+- gzip/deflate 응답 압축
+- 비차단 재시도 (asyncio.sleep 기반 full-jitter backoff, RetryStrategy 판단 재사용)
+- 호스트별 토큰 버킷 속도 제한과 서킷 브레이커 (모든 어댑터/백필 워커가 공유)
+- 백그라운드 이벤트 루프 스레드에서 실행되므로 동기 어댑터도 request_sync로 호출 가능
+  (스케줄러 워커 스레드들이 서로를 막지 않고 같은 커넥션 풀을 공유)
+- 큰 응답은 stream_sync로 본문을 다 받기 전에 청크 단위로 소비 (메모리 일정)
+- measure_payload 블록 안에서 받은 응답 본문 크기를 집계 (스케줄러 실행 기록의 payload_bytes)
+- record_payloads 블록 안에서 받은 원본 응답을 모음 (payload_archive 보관소에 저장)
+- request_deadline 블록 안의 요청은 마감 시각까지만 기다림 (스케줄러 어댑터 마감 시간)
+"""
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+from urllib.parse import urlsplit
+
+import httpx
+from dotenv import load_dotenv
+
+from .payload_archive import record_response, recording
+from .rate_limit import CircuitBreaker, TokenBucket
+from .retry_strategy import RetryStrategy
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 호스트별 최대 동시 연결 수 / 유지할 keep-alive 연결 수
+MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+MAX_KEEPALIVE_PER_HOST = int(os.getenv("HTTP_MAX_KEEPALIVE_PER_HOST", "10"))
+
+# 유휴 keep-alive 연결 유지 시간 (초)
+KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+
+# 기본 요청 타임아웃 (초)
+DEFAULT_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+
+# 호스트별 초당 요청 수 (0이면 제한 없음) / 한 번에 몰아서 보낼 수 있는 요청 수
+RATE_PER_HOST = float(os.getenv("HTTP_RATE_PER_HOST", "5"))
+BURST_PER_HOST = float(os.getenv("HTTP_BURST_PER_HOST", "10"))
+
+# 서킷을 여는 연속 실패 수 / 열린 뒤 확인 요청까지의 시간 (초)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("HTTP_CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RECOVERY_SECONDS = float(os.getenv("HTTP_CIRCUIT_RECOVERY_SECONDS", "30"))
+
+# stream_sync에서 소비자보다 앞서 받아 둘 최대 청크 수
+STREAM_BUFFER_CHUNKS = 16
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "seafood-price-tracker/1.0 (data-ingestion)",
+}
+
+
+class PayloadMeter:
+    """measure_payload 블록 안에서 받은 응답 수와 본문 크기 합계 (여러 스레드에서 더해도 안전)"""
+
+    def __init__(self):
+        self.bytes = 0
+        self.responses = 0
+        self._lock = threading.Lock()
+
+    def add(self, size: int, responses: int = 1):
+        with self._lock:
+            self.bytes += size
+            self.responses += responses
+
+
+_payload_meter: ContextVar[Optional[PayloadMeter]] = ContextVar("payload_meter", default=None)
+
+
+@contextmanager
+def measure_payload() -> Iterator[PayloadMeter]:
+    """
+    블록 안에서 받은 응답 본문(압축 해제 후) 크기 측정
+
+    현재 스레드(컨텍스트)의 요청만 집계하므로, 블록 안에서 다른 스레드로 요청을 넘길 때는
+    contextvars.copy_context().run으로 감싸야 함께 집계됩니다.
+
+    사용 예:
+        with measure_payload() as meter:
+            adapter.fetch_data(date)
+        logger.info(f"{meter.bytes} bytes in {meter.responses} responses")
+    """
+    meter = PayloadMeter()
+    token = _payload_meter.set(meter)
+    try:
+        yield meter
+    finally:
+        _payload_meter.reset(token)
+
+
+def _record_payload(size: int, responses: int = 1):
+    meter = _payload_meter.get()
+    if meter is not None:
+        meter.add(size, responses)
+
+
+class DeadlineExceededError(httpx.TimeoutException):
+    """request_deadline 마감 시각이 지나 요청하지 않거나 응답을 더 기다리지 않음 (재시도 대상 아님)"""
+
+    def __init__(self, message: str = "Request deadline exceeded"):
+        super().__init__(message)
+
+
+_request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(deadline: float) -> Iterator[None]:
+    """
+    블록 안의 요청을 마감 시각(time.monotonic() 기준)까지로 제한
+
+    - 요청 타임아웃은 남은 시간으로 줄이고, 마감이 지나면 새 요청/재시도를 하지 않음
+    - 동기 브리지는 마감 시각까지만 결과를 기다리고 진행 중인 요청은 취소
+    둘 다 DeadlineExceededError로 실패합니다. 바깥 블록의 마감이 더 이르면 그 마감을 유지합니다.
+
+    사용 예:
+        with request_deadline(time.monotonic() + 120):
+            adapter.fetch_data(date)
+    """
+    current = _request_deadline.get()
+    token = _request_deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def _remaining_time() -> Optional[float]:
+    """request_deadline까지 남은 시간 (초, 마감이 없으면 None, 지났으면 DeadlineExceededError)"""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError()
+    return remaining
+
+
+class HttpTransport:
+    """
+    호스트별 커넥션 풀을 가진 비동기 HTTP 전송 계층
+
+    사용 예 (비동기):
+        response = await transport.request("GET", url, params=params)
+
+    사용 예 (동기 어댑터):
+        response = transport.request_sync("GET", url, params=params)
+        responses = transport.request_many_sync([{"method": "GET", "url": u} for u in urls])
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        max_keepalive_per_host: int = MAX_KEEPALIVE_PER_HOST,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        rate_per_host: float = RATE_PER_HOST,
+        burst_per_host: float = BURST_PER_HOST,
+        circuit_failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        circuit_recovery_seconds: float = CIRCUIT_RECOVERY_SECONDS
+    ):
+        """
+        Args:
+            max_connections_per_host: 호스트별 최대 동시 연결 수
+            max_keepalive_per_host: 호스트별 유지할 keep-alive 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간 (초)
+            timeout: 기본 요청 타임아웃 (초)
+            max_retries: 기본 최대 시도 횟수
+            rate_per_host: 호스트별 초당 요청 수 (0이면 제한 없음)
+            burst_per_host: 호스트별 토큰 버킷 크기
+            circuit_failure_threshold: 서킷을 여는 연속 실패 수
+            circuit_recovery_seconds: 서킷이 열린 뒤 확인 요청까지의 시간 (초)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_per_host,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.rate_per_host = rate_per_host
+        self.burst_per_host = burst_per_host
+        self.circuit_failure_threshold = circuit_failure_threshold
+        self.circuit_recovery_seconds = circuit_recovery_seconds
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 비동기 API
+    # ------------------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ) -> httpx.Response:
+        """
+        HTTP 요청 (재시도 포함)
+
+        재시도 대상 여부와 대기 시간은 RetryStrategy가 판단하며,
+        대기는 asyncio.sleep으로 처리하여 다른 요청을 막지 않습니다.
+        매 시도마다 호스트의 서킷 브레이커와 토큰 버킷을 거칩니다.
+        다른 이벤트 루프에서 호출하면 전송 계층 루프로 넘겨 실행합니다
+        (커넥션 풀은 전송 계층 루프에 묶여 있음).
+
+        Returns:
+            본문까지 읽은 httpx.Response (2xx, 조건부 요청이면 304 포함)
+
+        Raises:
+            CircuitOpenError: 호스트 서킷이 열려 있는 경우 (httpx.HTTPError 하위 클래스)
+            DeadlineExceededError: request_deadline 마감이 지난 경우 (httpx.HTTPError 하위 클래스)
+            httpx.HTTPError: 재시도 후에도 실패한 경우
+        """
+        coroutine = self._request(method, url, params, data, headers, timeout, max_retries)
+        loop = self._ensure_loop()
+        if asyncio.get_running_loop() is loop:
+            response = await coroutine
+        else:
+            response = await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, loop))
+        # run_coroutine_threadsafe는 호출 스레드의 컨텍스트를 복사하므로 동기 브리지 요청도 여기서 집계
+        _record_payload(len(response.content))
+        record_response(
+            method, url, params, data,
+            response.status_code, response.headers.get("content-type"), response.content
+        )
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        max_retries: Optional[int]
+    ) -> httpx.Response:
+        """전송 계층 이벤트 루프에서 실행되는 요청/재시도 루프"""
+        return await self._send(method, url, params, data, headers, timeout, max_retries, stream=False)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        max_retries: Optional[int],
+        stream: bool
+    ) -> httpx.Response:
+        """
+        요청/재시도 루프 (서킷 브레이커, 토큰 버킷 포함)
+
+        stream=True면 상태 코드까지만 확인하고 본문은 읽지 않은 응답을 반환합니다
+        (본문을 받기 시작한 뒤에는 재시도하지 않음, 호출 측에서 aclose 필요).
+        """
+        host = _host_key(url)
+        client = self._get_client(url)
+        bucket = self._get_bucket(host)
+        breaker = self._get_breaker(host)
+        max_retries = max_retries or self.max_retries
+        attempt = 0
+
+        while True:
+            # 마감이 지났거나 서킷이 열려 있으면 요청하지 않고 즉시 실패
+            _remaining_time()
+            breaker.before_request()
+            try:
+                wait = bucket.acquire()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                # 마감이 있으면 요청 타임아웃을 남은 시간으로 줄임
+                request_timeout = timeout or self.timeout
+                remaining = _remaining_time()
+                if remaining is not None:
+                    request_timeout = min(request_timeout, remaining)
+                request = client.build_request(
+                    method.upper(),
+                    url,
+                    params=params,
+                    data=data,
+                    headers=headers,
+                    timeout=request_timeout
+                )
+                response = await client.send(request, stream=stream)
+                # 304는 조건부 요청(ETag/Last-Modified 재검증)의 정상 응답
+                if response.status_code != 304 and not response.is_success:
+                    if stream:
+                        await response.aread()
+                        await response.aclose()
+                    response.raise_for_status()
+                breaker.record()
+                return response
+
+            except DeadlineExceededError:
+                # 호스트 장애가 아니므로 서킷 브레이커에 실패로 세지 않음
+                breaker.abort()
+                raise
+
+            except httpx.HTTPError as error:
+                breaker.record(error)
+                attempt += 1
+                if not RetryStrategy.should_retry(error, attempt, max_retries):
+                    raise
+
+                delay = RetryStrategy.get_delay(attempt, error)
+                retry_after = RetryStrategy.get_retry_after(error)
+                if retry_after is not None:
+                    # 서버가 지정한 시간 동안 같은 호스트의 다른 요청도 보류
+                    bucket.pause(retry_after)
+                remaining = _remaining_time()
+                if remaining is not None and delay >= remaining:
+                    # 기다린 뒤에는 마감이 지나므로 재시도하지 않음
+                    raise DeadlineExceededError(
+                        f"Request deadline exceeded before retry {attempt + 1}/{max_retries} ({error})"
+                    ) from error
+                RetryStrategy.log_retry_attempt(host, attempt, max_retries, error, delay)
+                await asyncio.sleep(delay)
+
+            except BaseException:
+                breaker.abort()
+                raise
+
+    async def _pump_stream(
+        self,
+        chunks: asyncio.Queue,
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        chunk_size: int
+    ):
+        """스트리밍 응답 본문을 청크 큐로 전달 (큐가 차면 소비자를 기다림)"""
+        try:
+            response = await self._send(
+                method, url,
+                kwargs.get('params'), kwargs.get('data'), kwargs.get('headers'),
+                kwargs.get('timeout'), kwargs.get('max_retries'),
+                stream=True
+            )
+            try:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    await chunks.put(chunk)
+            finally:
+                await response.aclose()
+            await chunks.put(_STREAM_END)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            await chunks.put(error)
+
+    async def request_many(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        return_exceptions: bool = True
+    ) -> List[Union[httpx.Response, BaseException]]:
+        """여러 요청을 동시에 실행 (각 항목은 request()의 키워드 인자)"""
+        return await asyncio.gather(
+            *(self.request(**kwargs) for kwargs in requests),
+            return_exceptions=return_exceptions
+        )
+
+    async def aclose(self):
+        """모든 호스트 커넥션 풀 종료"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    # ------------------------------------------------------------------
+    # 동기 브리지 (스케줄러 워커 스레드용)
+    # ------------------------------------------------------------------
+
+    def request_sync(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """백그라운드 이벤트 루프에서 요청을 실행하고 결과를 기다림 (request()와 같은 인자)"""
+        return self._run(self.request(method, url, **kwargs))
+
+    def request_many_sync(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        return_exceptions: bool = True
+    ) -> List[Union[httpx.Response, BaseException]]:
+        """백그라운드 이벤트 루프에서 request_many()를 실행하고 결과를 기다림"""
+        return self._run(self.request_many(requests, return_exceptions))
+
+    def stream_sync(
+        self,
+        method: str,
+        url: str,
+        chunk_size: int = 64 * 1024,
+        **kwargs
+    ) -> Iterator[bytes]:
+        """
+        응답 본문을 받는 대로 청크 단위로 반환 (request()와 같은 인자)
+
+        본문 전체를 메모리에 올리지 않으며, 소비가 느리면 STREAM_BUFFER_CHUNKS개까지만
+        받아 두고 다운로드를 멈춥니다. 중간에 반복을 멈추면 연결을 닫습니다.
+        재시도/서킷 브레이커/속도 제한은 응답 헤더를 받기 전까지만 적용됩니다.
+
+        Raises:
+            httpx.HTTPError: 요청 실패 또는 본문 수신 중 오류 (request_deadline 마감 초과 포함)
+        """
+        loop = self._ensure_loop()
+        chunks = self._run(_make_queue(STREAM_BUFFER_CHUNKS))
+        pump = asyncio.run_coroutine_threadsafe(
+            self._pump_stream(chunks, method, url, kwargs, chunk_size), loop
+        )
+        # 원본 응답을 보관할 때만 본문을 모아 둠 (그 외에는 메모리 일정)
+        body: Optional[List[bytes]] = [] if recording() else None
+        try:
+            while True:
+                item = self._wait(asyncio.run_coroutine_threadsafe(chunks.get(), loop))
+                if item is _STREAM_END:
+                    _record_payload(0)
+                    if body is not None:
+                        record_response(
+                            method, url, kwargs.get('params'), kwargs.get('data'), 200, None, b"".join(body)
+                        )
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                _record_payload(len(item), responses=0)
+                if body is not None:
+                    body.append(item)
+                yield item
+        finally:
+            if not pump.done():
+                pump.cancel()
+
+    def close(self):
+        """커넥션 풀과 백그라운드 이벤트 루프 종료"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(timeout=10)
+        except Exception as e:
+            logger.debug(f"HTTP transport close failed: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _run(self, coroutine):
+        loop = self._ensure_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coroutine.close()
+            raise RuntimeError("request_sync는 전송 계층 이벤트 루프 안에서 호출할 수 없습니다 (await request 사용)")
+        return self._wait(asyncio.run_coroutine_threadsafe(coroutine, loop))
+
+    @staticmethod
+    def _wait(future):
+        """전송 계층 루프에 넘긴 작업의 결과 대기 (request_deadline 마감이 지나면 작업을 취소하고 실패)"""
+        try:
+            remaining = _remaining_time()
+        except DeadlineExceededError:
+            future.cancel()
+            raise
+        try:
+            return future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()
+            raise DeadlineExceededError() from None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=_run_loop,
+                    args=(loop,),
+                    name="http-transport",
+                    daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _get_bucket(self, host: str) -> TokenBucket:
+        """호스트별 토큰 버킷 (이벤트 루프 스레드에서만 호출)"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_per_host, self.burst_per_host)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _get_breaker(self, host: str) -> CircuitBreaker:
+        """호스트별 서킷 브레이커 (이벤트 루프 스레드에서만 호출)"""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, self.circuit_failure_threshold, self.circuit_recovery_seconds)
+            self._breakers[host] = breaker
+        return breaker
+
+    def _get_client(self, url: str) -> httpx.AsyncClient:
+        """호스트별 AsyncClient (이벤트 루프 스레드에서만 호출)"""
+        key = _host_key(url)
+        client = self._clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=self.timeout,
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True
+            )
+            self._clients[key] = client
+            logger.debug(f"HTTP connection pool created for {key}")
+        return client
+
+
+_STREAM_END = object()
+
+
+async def _make_queue(maxsize: int) -> asyncio.Queue:
+    """전송 계층 이벤트 루프에 묶인 asyncio.Queue 생성"""
+    return asyncio.Queue(maxsize=maxsize)
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+    loop.close()
+
+
+def _host_key(url: str) -> str:
+    """커넥션 풀 키 (scheme://host:port)"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """프로세스 공용 HttpTransport (최초 호출 시 생성)"""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+            atexit.register(_default_transport.close)
+        return _default_transport
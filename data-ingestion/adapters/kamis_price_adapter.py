@@ -7,16 +7,83 @@ API 정보:
 - 제공기관: 한국농수산식품유통공사
 - 데이터: 도매시장별 일별 경락가격
 - 품목: 수산물 (활어, 선어, 냉동 등)
+
+fetch_data()는 요청을 시장 코드 x 페이지 샤드로 나눠 동시에 요청하고(공용 전송 계층의
+호스트별 속도 제한 적용), 실패한 샤드만 재시도한 뒤 결과를 병합/중복 제거합니다.
+전국/전 품목 응답처럼 큰 응답은 iter_data()/iter_raw_prices()로 본문을 받는 대로
+디코딩하여 한 건씩 처리할 수도 있습니다.
 """
-from typing import List, Dict, Any, Optional
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime, date
 import logging
+import os
+import time
+
+from dotenv import load_dotenv
 
+from .base import RawPriceData
+from .dead_letters import STAGE_PARSE, record_dead_letter
 from .public_data_base import BasePublicDataAdapter, DataCategory
 from .public_data_models import DailyPrice
+from .units import normalize_unit, parse_unit
+
+load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 페이지당 요청 행 수 / 동시에 요청할 샤드 수 / 실패한 샤드 재시도 횟수
+PAGE_SIZE = int(os.getenv("KAMIS_PAGE_SIZE", "500"))
+SHARD_CONCURRENCY = int(os.getenv("KAMIS_SHARD_CONCURRENCY", "4"))
+SHARD_RETRIES = int(os.getenv("KAMIS_SHARD_RETRIES", "2"))
+
+# 시장별로 한 번에 미리 요청할 다음 페이지 수 / 시장별 최대 페이지 수 (무한 페이징 방지)
+PAGE_PREFETCH = 2
+MAX_PAGES = 200
+
+# 병합 시 같은 레코드로 볼 필드
+DEDUPE_FIELDS = ('market_code', 'item_code', 'raw_name', 'kind_name', 'rank', 'unit', 'date')
+
+
+@dataclass(frozen=True)
+class KamisShard:
+    """요청 샤드 (시장 코드 하나의 한 페이지, market_code가 None이면 전체 시장)"""
+    market_code: Optional[str]
+    page: int
+    
+    @property
+    def label(self) -> str:
+        return f"{self.market_code or 'all'}#{self.page}"
+
+
+@dataclass
+class ShardTiming:
+    """샤드 요청 결과 (시도마다 하나씩 기록)"""
+    shard: KamisShard
+    attempt: int
+    seconds: float
+    rows: int = 0
+    error: Optional[str] = None
+
+
+def shard_stats(timings: List[ShardTiming]) -> Dict[str, Any]:
+    """샤드 기록 요약 (샤드 수, 요청/재시도 수, 소요 시간 합계/최대, 가장 느린 샤드)"""
+    if not timings:
+        return {'shards': 0, 'requests': 0, 'retries': 0, 'failed_attempts': 0}
+    
+    slowest = max(timings, key=lambda timing: timing.seconds)
+    return {
+        'shards': len({timing.shard for timing in timings}),
+        'requests': len(timings),
+        'retries': sum(1 for timing in timings if timing.attempt > 1),
+        'failed_attempts': sum(1 for timing in timings if timing.error),
+        'seconds_total': round(sum(timing.seconds for timing in timings), 3),
+        'seconds_max': round(slowest.seconds, 3),
+        'slowest_shard': slowest.shard.label,
+    }
+
 
 class KamisPriceAdapter(BasePublicDataAdapter):
     """KAMIS 도매시장 경락가격 어댑터
@@ -30,13 +97,35 @@ class KamisPriceAdapter(BasePublicDataAdapter):
     # 수산물 카테고리 코드
     SEAFOOD_CATEGORY = "400"  # KAMIS 수산물 카테고리 코드
     
-    def __init__(self, api_key: str, base_url: str = "http://www.kamis.or.kr/service/price"):
+    # 응답에서 가격 항목 배열 위치 (ijson 경로)
+    ITEMS_PREFIX = "data.item"
+    
+    # 페이지 요청 파라미터
+    PAGE_PARAM = "p_pageno"
+    PAGE_SIZE_PARAM = "p_numofrows"
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "http://www.kamis.or.kr/service/price",
+        page_size: int = PAGE_SIZE,
+        shard_concurrency: int = SHARD_CONCURRENCY,
+        shard_retries: int = SHARD_RETRIES
+    ):
         """
         Args:
             api_key: KAMIS API 키
             base_url: API 기본 URL (기본값: KAMIS 공식 URL)
+            page_size: 페이지당 요청 행 수
+            shard_concurrency: 동시에 요청할 샤드 수
+            shard_retries: 실패한 샤드 재시도 횟수 (전송 계층 재시도와 별개)
         """
         super().__init__(api_key, base_url)
+        self.page_size = max(1, page_size)
+        self.shard_concurrency = max(1, shard_concurrency)
+        self.shard_retries = max(0, shard_retries)
+        # 마지막으로 끝난 fetch_data의 샤드 기록 (호출마다 따로 모은 목록을 끝날 때 교체)
+        self.shard_timings: List[ShardTiming] = []
         logger.info("KamisPriceAdapter 초기화 완료")
     
     def get_category(self) -> DataCategory:
@@ -52,16 +141,29 @@ class KamisPriceAdapter(BasePublicDataAdapter):
         date: Optional[datetime] = None,
         **kwargs
     ) -> List[Dict[str, Any]]:
-        """도매시장 경락가격 데이터 수집
+        """도매시장 경락가격 데이터 수집 (샤드 동시 요청)
+        
+        1. 시장 코드마다 1페이지부터 요청 (시장 코드가 없으면 전체 시장 하나)
+        2. 페이지가 가득 찬 시장은 다음 페이지들을 미리 요청 (빈/덜 찬 페이지에서 종료)
+        3. 실패한 샤드만 shard_retries회까지 다시 요청
+        4. 결과를 시장/페이지 순서로 병합하고 중복 제거
+        
+        페이지마다 응답 캐시에 따로 저장되므로, 실패 후 다시 수집하면 성공했던
+        샤드는 캐시에서 바로 반환됩니다. 샤드별 소요 시간은 호출마다 따로 모아 수집 완료 로그에
+        남기고, 호출이 끝나면 shard_timings로 교체합니다 (여러 수집일/워커가 같은 어댑터를 동시에
+        호출해도 섞이지 않음).
         
         Args:
             date: 수집할 날짜 (기본값: 오늘)
             **kwargs: 추가 파라미터
-                - market_codes: 시장 코드 리스트 (선택적)
+                - market_codes: 시장 코드 리스트 (선택적, 시장별로 샤드 분할)
                 - item_codes: 품목 코드 리스트 (선택적)
         
         Returns:
             List[Dict[str, Any]]: 수집된 가격 데이터
+        
+        Raises:
+            httpx.HTTPError: 재시도 후에도 실패한 샤드가 있는 경우
         """
         if date is None:
             date = datetime.now()
@@ -70,32 +172,27 @@ class KamisPriceAdapter(BasePublicDataAdapter):
         
         logger.info(f"KAMIS 가격 데이터 수집 시작: {target_date}")
         
+        started = time.perf_counter()
+        timings: List[ShardTiming] = []
+        
         try:
-            # API 요청 파라미터
-            params = {
-                'p_yyyy': date.strftime("%Y"),
-                'p_period': '1',  # 일별
-                'p_returntype': 'json',
-                'p_productclscode': self.SEAFOOD_CATEGORY,
-                'p_regday': target_date,
-            }
-            
-            # 시장 코드가 지정된 경우
-            market_codes = kwargs.get('market_codes')
-            if market_codes:
-                params['p_countycode'] = ','.join(market_codes)
-            
-            # 품목 코드가 지정된 경우
+            market_codes = kwargs.get('market_codes') or [None]
             item_codes = kwargs.get('item_codes')
-            if item_codes:
-                params['p_itemcategorycode'] = ','.join(item_codes)
             
-            # API 호출
-            response = self.make_request(self.ENDPOINT, params)
+            merged: Dict[Tuple, Dict[str, Any]] = {}
+            pending = [KamisShard(code, 1) for code in market_codes]
             
-            # 응답 파싱
-            parsed_data = self.parse_response(response)
+            with ThreadPoolExecutor(
+                max_workers=self.shard_concurrency,
+                thread_name_prefix="kamis-shard"
+            ) as executor:
+                while pending:
+                    pages = self._fetch_shards(executor, date, pending, item_codes, timings)
+                    pending = self._next_shards(pages, merged)
             
+            parsed_data = list(merged.values())
+            
+            self._log_shard_summary(target_date, time.perf_counter() - started, timings)
             logger.info(
                 f"KAMIS 가격 데이터 수집 완료: {len(parsed_data)}건",
                 extra={'date': target_date, 'count': len(parsed_data)}
@@ -109,6 +206,292 @@ class KamisPriceAdapter(BasePublicDataAdapter):
                 extra={'date': target_date, 'error': str(e)}
             )
             raise
+        
+        finally:
+            self.shard_timings = timings
+    
+    def iter_data(
+        self,
+        date: Optional[datetime] = None,
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """도매시장 경락가격 데이터를 받는 대로 한 건씩 반환 (스트리밍)
+        
+        응답 본문을 내려받는 중에 ijson으로 디코딩하므로 응답 크기와 관계없이
+        메모리 사용량이 일정합니다. 항목 변환 규칙은 parse_response와 같습니다.
+        
+        Args:
+            date: 수집할 날짜 (기본값: 오늘)
+            **kwargs: fetch_data와 같은 추가 파라미터
+        
+        Yields:
+            Dict[str, Any]: 파싱된 가격 데이터
+        """
+        if date is None:
+            date = datetime.now()
+        
+        target_date = date.strftime("%Y-%m-%d")
+        logger.info(f"KAMIS 가격 데이터 스트리밍 수집 시작: {target_date}")
+        
+        params = self._build_params(date, **kwargs)
+        items = self.iter_json_items(self.ENDPOINT, self.ITEMS_PREFIX, params)
+        yield from self.parse_items(items)
+    
+    def iter_raw_prices(
+        self,
+        date: Optional[datetime] = None,
+        **kwargs
+    ) -> Iterator[RawPriceData]:
+        """스트리밍 수집 결과를 DataNormalizer 입력(RawPriceData)으로 변환
+        
+        KAMIS 응답에는 여러 시장이 섞여 있으므로 레코드마다 market_id를 지정합니다.
+        내부 시장과 매핑되지 않는 시장의 항목은 건너뜁니다.
+        
+        사용 예:
+            normalized = normalizer.iter_normalize(adapter.iter_raw_prices(date))
+        
+        Yields:
+            RawPriceData (market_id 포함)
+        """
+        market_mapping = self.get_market_mapping()
+        
+        for data in self.iter_data(date, **kwargs):
+            try:
+                price_data = self._to_raw_price(data, market_mapping)
+            except ValueError:
+                logger.debug(f"날짜 형식 오류: {data['date']}")
+                continue
+            
+            if price_data is not None:
+                yield price_data
+    
+    def parse_dead_letter(self, record: Dict, target_date: date) -> Optional[RawPriceData]:
+        """저장된 실패 항목 다시 파싱 (replay.py, 네트워크 요청 없음)
+        
+        Args:
+            record: 파싱에 실패했던 KAMIS 응답 항목
+            target_date: 수집일 (KAMIS 항목은 자체 날짜(regday)를 사용)
+        
+        Returns:
+            RawPriceData (market_id 포함), 건너뛸 항목이면 None
+        """
+        parsed_item = self._parse_item(record)
+        if parsed_item is None:
+            return None
+        return self._to_raw_price(parsed_item, self.get_market_mapping())
+    
+    def _to_raw_price(self, data: Dict[str, Any], market_mapping: Dict[str, int]) -> Optional[RawPriceData]:
+        """파싱된 항목을 RawPriceData로 변환 (내부 시장과 매핑되지 않으면 None, 날짜 형식 오류는 ValueError)"""
+        market_id = market_mapping.get(data['market_code'])
+        if market_id is None:
+            logger.debug(f"시장 매핑 실패: {data['market_code']}")
+            return None
+        
+        return RawPriceData(
+            raw_name=data['raw_name'],
+            price=data['price'],
+            unit=data['unit'],
+            date=datetime.strptime(data['date'], '%Y-%m-%d').date(),
+            origin=data['origin'],
+            source=data['source'],
+            market_id=market_id
+        )
+    
+    def get_shard_stats(self) -> Dict[str, Any]:
+        """마지막으로 끝난 fetch_data의 샤드 통계
+        
+        Returns:
+            Dict[str, Any]: 샤드 수, 요청/재시도 수, 소요 시간 합계/최대, 가장 느린 샤드
+        """
+        return shard_stats(self.shard_timings)
+    
+    def _fetch_shards(
+        self,
+        executor: ThreadPoolExecutor,
+        date: datetime,
+        shards: List[KamisShard],
+        item_codes: Optional[List[str]],
+        timings: List[ShardTiming]
+    ) -> List[Tuple[KamisShard, int, List[Dict[str, Any]]]]:
+        """샤드들을 동시에 요청하고 실패한 샤드만 재시도 (시도마다 timings에 추가)
+        
+        Returns:
+            샤드 순서대로 (샤드, 응답 원본 행 수, 파싱된 데이터)
+        
+        Raises:
+            Exception: 재시도 후에도 실패한 샤드의 마지막 예외
+        """
+        results: Dict[KamisShard, Tuple[int, List[Dict[str, Any]]]] = {}
+        remaining = list(shards)
+        
+        for attempt in range(1, self.shard_retries + 2):
+            futures = [
+                # 호출 스레드의 컨텍스트(응답 크기 집계 등)를 샤드 스레드로 전달
+                (shard, executor.submit(
+                    contextvars.copy_context().run, self._fetch_shard, date, shard, item_codes, attempt, timings
+                ))
+                for shard in remaining
+            ]
+            
+            failed = []
+            last_error: Optional[Exception] = None
+            for shard, future in futures:
+                try:
+                    results[shard] = future.result()
+                except Exception as e:
+                    failed.append(shard)
+                    last_error = e
+            
+            if not failed:
+                break
+            
+            if attempt > self.shard_retries:
+                logger.error(
+                    f"KAMIS 샤드 {len(failed)}개 최종 실패: "
+                    f"{', '.join(shard.label for shard in failed)}"
+                )
+                raise last_error
+            
+            logger.warning(
+                f"KAMIS 샤드 {len(failed)}개 실패, 재시도 ({attempt}/{self.shard_retries}): "
+                f"{', '.join(shard.label for shard in failed)}"
+            )
+            remaining = failed
+        
+        return [(shard, *results[shard]) for shard in shards]
+    
+    def _fetch_shard(
+        self,
+        date: datetime,
+        shard: KamisShard,
+        item_codes: Optional[List[str]],
+        attempt: int,
+        timings: List[ShardTiming]
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """샤드 하나 요청 (소요 시간을 호출한 fetch_data의 timings에 기록)
+        
+        Returns:
+            (응답 원본 행 수, 파싱된 데이터) - 원본 행 수로 다음 페이지 여부를 판단
+        """
+        params = self._build_params(
+            date,
+            market_codes=[shard.market_code] if shard.market_code else None,
+            item_codes=item_codes
+        )
+        params[self.PAGE_PARAM] = shard.page
+        params[self.PAGE_SIZE_PARAM] = self.page_size
+        
+        started = time.perf_counter()
+        timing = ShardTiming(shard=shard, attempt=attempt, seconds=0.0)
+        try:
+            response = self.make_request(self.ENDPOINT, params)
+            items = response.get('data') or []
+            parsed = list(self.parse_items(items))
+            timing.rows = len(parsed)
+            return len(items), parsed
+        except Exception as e:
+            timing.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            timing.seconds = time.perf_counter() - started
+            timings.append(timing)
+            logger.debug(
+                f"KAMIS 샤드 {shard.label} (시도 {attempt}): "
+                f"{timing.rows}건, {timing.seconds:.2f}s"
+                + (f", 실패: {timing.error}" if timing.error else "")
+            )
+    
+    def _next_shards(
+        self,
+        pages: List[Tuple[KamisShard, int, List[Dict[str, Any]]]],
+        merged: Dict[Tuple, Dict[str, Any]]
+    ) -> List[KamisShard]:
+        """받은 페이지를 병합하고 다음에 요청할 페이지 샤드 반환
+        
+        시장의 마지막 페이지가 가득 찼고 새 레코드가 있었으면 다음 PAGE_PREFETCH개 페이지를
+        요청합니다. 페이지 파라미터를 무시하는 응답(같은 데이터 반복)은 새 레코드가 없으므로 멈춥니다.
+        """
+        finished = set()
+        last_page: Dict[Optional[str], int] = {}
+        
+        for shard, raw_count, rows in pages:
+            new_rows = 0
+            for row in rows:
+                key = tuple(row.get(field) for field in DEDUPE_FIELDS)
+                if key not in merged:
+                    merged[key] = row
+                    new_rows += 1
+            
+            if raw_count < self.page_size or (rows and new_rows == 0):
+                finished.add(shard.market_code)
+            last_page[shard.market_code] = max(last_page.get(shard.market_code, 0), shard.page)
+        
+        next_shards = []
+        for market_code, page in last_page.items():
+            if market_code in finished:
+                continue
+            if page >= MAX_PAGES:
+                logger.warning(f"KAMIS 시장 {market_code or 'all'}: 최대 페이지 수({MAX_PAGES}) 도달")
+                continue
+            next_shards.extend(
+                KamisShard(market_code, page + offset)
+                for offset in range(1, PAGE_PREFETCH + 1)
+                if page + offset <= MAX_PAGES
+            )
+        return next_shards
+    
+    def _log_shard_summary(self, target_date: str, elapsed: float, timings: List[ShardTiming]):
+        """fetch_data 한 번의 샤드별 소요 시간 요약 로깅"""
+        stats = shard_stats(timings)
+        logger.info(
+            f"KAMIS 샤드 요청 완료: {stats['shards']}개 샤드, {stats['requests']}회 요청 "
+            f"(재시도 {stats['retries']}), {elapsed:.2f}s "
+            f"(최장 {stats.get('slowest_shard')} {stats.get('seconds_max', 0)}s)",
+            extra={
+                'date': target_date,
+                **stats,
+                'shard_timings': [
+                    {
+                        'shard': timing.shard.label,
+                        'attempt': timing.attempt,
+                        'seconds': round(timing.seconds, 3),
+                        'rows': timing.rows,
+                        'error': timing.error,
+                    }
+                    for timing in timings
+                ],
+            }
+        )
+    
+    def _build_params(self, date: datetime, **kwargs) -> Dict[str, Any]:
+        """API 요청 파라미터 생성
+        
+        Args:
+            date: 수집할 날짜
+            **kwargs: market_codes, item_codes (선택적)
+        
+        Returns:
+            Dict[str, Any]: 요청 파라미터
+        """
+        params = {
+            'p_yyyy': date.strftime("%Y"),
+            'p_period': '1',  # 일별
+            'p_returntype': 'json',
+            'p_productclscode': self.SEAFOOD_CATEGORY,
+            'p_regday': date.strftime("%Y-%m-%d"),
+        }
+        
+        # 시장 코드가 지정된 경우
+        market_codes = kwargs.get('market_codes')
+        if market_codes:
+            params['p_countycode'] = ','.join(market_codes)
+        
+        # 품목 코드가 지정된 경우
+        item_codes = kwargs.get('item_codes')
+        if item_codes:
+            params['p_itemcategorycode'] = ','.join(item_codes)
+        
+        return params
     
     def parse_response(self, response: Dict) -> List[Dict[str, Any]]:
         """KAMIS API 응답 파싱
@@ -138,56 +521,15 @@ class KamisPriceAdapter(BasePublicDataAdapter):
         Returns:
             List[Dict[str, Any]]: 파싱된 데이터 리스트
         """
-        parsed_data = []
-        
         try:
             # 응답 데이터 추출
             data_list = response.get('data', [])
             
             if not data_list:
                 logger.warning("KAMIS API 응답에 데이터가 없습니다")
-                return parsed_data
-            
-            for item in data_list:
-                try:
-                    # 필수 필드 확인
-                    if not self._validate_item(item):
-                        continue
-                    
-                    # 가격 추출 (day1 필드)
-                    price_str = item.get('day1', '0')
-                    price = self._parse_price(price_str)
-                    
-                    if price <= 0:
-                        logger.debug(
-                            f"가격이 0 이하: {item.get('item_name')} = {price}"
-                        )
-                        continue
-                    
-                    # 데이터 변환
-                    parsed_item = {
-                        'raw_name': item.get('item_name', '').strip(),
-                        'item_code': item.get('item_code', ''),
-                        'kind_name': item.get('kind_name', '').strip(),
-                        'rank': item.get('rank', '').strip(),
-                        'unit': self._normalize_unit(item.get('unit', 'kg')),
-                        'price': price,
-                        'market_name': item.get('countyname', '').strip(),
-                        'market_code': item.get('countycode', ''),
-                        'date': item.get('regday', ''),
-                        'origin': '',  # KAMIS API는 원산지 정보 미제공
-                        'source': 'KAMIS',
-                    }
-                    
-                    parsed_data.append(parsed_item)
-                    
-                except Exception as e:
-                    logger.warning(
-                        f"항목 파싱 실패: {e}",
-                        extra={'item': item, 'error': str(e)}
-                    )
-                    continue
+                return []
             
+            parsed_data = list(self.parse_items(data_list))
             logger.info(f"KAMIS 응답 파싱 완료: {len(parsed_data)}건")
             
         except Exception as e:
@@ -199,6 +541,68 @@ class KamisPriceAdapter(BasePublicDataAdapter):
         
         return parsed_data
     
+    def parse_items(self, items: Iterable[Dict]) -> Iterator[Dict[str, Any]]:
+        """응답 항목을 한 건씩 변환 (parse_response/iter_data 공용)
+        
+        Args:
+            items: KAMIS 응답의 data 항목들 (리스트 또는 스트리밍 디코더)
+        
+        Yields:
+            Dict[str, Any]: 파싱된 데이터
+        """
+        for item in items:
+            try:
+                parsed_item = self._parse_item(item)
+                
+            except Exception as e:
+                logger.warning(
+                    f"항목 파싱 실패: {e}",
+                    extra={'item': item, 'error': str(e)}
+                )
+                record_dead_letter(STAGE_PARSE, type(e).__name__, item, str(e))
+                continue
+            
+            if parsed_item is not None:
+                yield parsed_item
+    
+    def _parse_item(self, item: Dict) -> Optional[Dict[str, Any]]:
+        """응답 항목 하나 변환
+        
+        Args:
+            item: KAMIS 응답 항목
+        
+        Returns:
+            Optional[Dict[str, Any]]: 파싱된 데이터 (필수 필드 누락, 가격 0 이하면 None)
+        """
+        # 필수 필드 확인
+        if not self._validate_item(item):
+            return None
+        
+        # 가격 추출 (day1 필드)
+        price_str = item.get('day1', '0')
+        price = self._parse_price(price_str)
+        
+        if price <= 0:
+            logger.debug(
+                f"가격이 0 이하: {item.get('item_name')} = {price}"
+            )
+            return None
+        
+        # 데이터 변환
+        return {
+            'raw_name': item.get('item_name', '').strip(),
+            'item_code': item.get('item_code', ''),
+            'kind_name': item.get('kind_name', '').strip(),
+            'rank': item.get('rank', '').strip(),
+            'unit': normalize_unit(item.get('unit')),
+            'price': price,
+            'market_name': item.get('countyname', '').strip(),
+            'market_code': item.get('countycode', ''),
+            'date': item.get('regday', ''),
+            'origin': '',  # KAMIS API는 원산지 정보 미제공
+            'source': 'KAMIS',
+        }
+    
     def _validate_item(self, item: Dict) -> bool:
         """항목 유효성 검증
         
@@ -234,8 +638,8 @@ class KamisPriceAdapter(BasePublicDataAdapter):
             float: 변환된 가격
         """
         try:
-            # 쉼표 제거
-            price_str = price_str.replace(',', '').strip()
+            # 쉼표 제거 (숫자로 온 경우 포함)
+            price_str = str(price_str).replace(',', '').strip()
             
             # 빈 문자열 처리
             if not price_str or price_str == '-':
@@ -254,44 +658,6 @@ class KamisPriceAdapter(BasePublicDataAdapter):
             logger.debug(f"가격 파싱 실패: {price_str} - {e}")
             return 0.0
     
-    def _normalize_unit(self, unit: str) -> str:
-        """단위 표준화
-        
-        Args:
-            unit: 원본 단위
-        
-        Returns:
-            str: 표준화된 단위
-        """
-        if not unit:
-            return 'kg'
-        
-        unit_lower = unit.lower().strip()
-        
-        # 단위 매핑
-        unit_map = {
-            'kg': 'kg',
-            '1kg': 'kg',
-            'kilogram': 'kg',
-            '킬로그램': 'kg',
-            '킬로': 'kg',
-            '마리': '마리',
-            '1마리': '마리',
-            'ea': '마리',
-            '개': '마리',
-            '상자': '상자',
-            '1상자': '상자',
-            'box': '상자',
-        }
-        
-        # 숫자 제거 (예: "10kg" -> "kg")
-        import re
-        unit_clean = re.sub(r'\d+', '', unit_lower).strip()
-        
-        normalized = unit_map.get(unit_clean, unit_map.get(unit_lower, 'kg'))
-        
-        return normalized
-    
     def get_market_mapping(self) -> Dict[str, int]:
         """KAMIS 시장 코드를 내부 market_id로 매핑
         
@@ -344,12 +710,15 @@ class KamisPriceAdapter(BasePublicDataAdapter):
                 # 날짜 변환
                 date_obj = datetime.strptime(data['date'], '%Y-%m-%d').date()
                 
+                # 표준 단위당 가격으로 변환 (예: 10kg 가격 → kg당 가격)
+                price, unit = parse_unit(data['unit']).unit_price(data['price'])
+                
                 # DailyPrice 객체 생성
                 daily_price = DailyPrice(
                     item_id=item_id,
                     market_id=market_id,
-                    price=data['price'],
-                    unit=data['unit'],
+                    price=price,
+                    unit=unit,
                     origin=data['origin'],
                     date=date_obj,
                     quantity=None,
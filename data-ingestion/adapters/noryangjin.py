@@ -1,31 +1,57 @@
 """
 노량진수산시장 데이터 수집 어댑터
 웹 스크래핑을 통해 노량진수산시장 가격 정보를 수집합니다.
+
+기본 파싱은 lxml HTMLPullParser로 price-table 행을 하나씩 읽고 처리한 요소를 바로
+해제하는 스트리밍 방식이며, BeautifulSoup 전체 트리 방식(_parse_html)과 같은 결과를 냅니다.
 """
-from datetime import datetime
-from typing import List
-import requests
+from datetime import date as date_type, datetime
+from typing import Iterator, List, Optional, Sequence
+import httpx
 from bs4 import BeautifulSoup
+from lxml import etree
 import logging
 import re
 from .base import MarketAdapter, RawPriceData
+from .dead_letters import STAGE_PARSE, record_dead_letter
+from .http_transport import HttpTransport, get_transport
+from .price_batch import RawPriceBatch
+from .units import normalize_unit
 
 logger = logging.getLogger(__name__)
 
+# 가격 문자열의 금액 (천 단위 구분 기호 허용)
+_AMOUNT_RE = re.compile(r'\d{1,3}(?:,\d{3})+|\d+')
+_WON_AMOUNT_RE = re.compile(r'(\d{1,3}(?:,\d{3})+|\d+)\s*원')
+
+# 스트리밍 파서에 한 번에 넣는 HTML 크기 (문자 수)
+PARSE_CHUNK_SIZE = 64 * 1024
+
+PRICE_TABLE_CLASS = 'price-table'
+
 
 class NoryangjinAdapter(MarketAdapter):
     """노량진수산시장 어댑터"""
     
     MARKET_ID = 2  # 노량진수산시장 ID
     
-    def __init__(self, base_url: str = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        transport: Optional[HttpTransport] = None,
+        streaming: bool = True
+    ):
         """
         Args:
             base_url: 노량진수산시장 가격 정보 페이지 URL
+            transport: HTTP 전송 계층 (기본값: 프로세스 공용 전송 계층)
+            streaming: True면 스트리밍 파서, False면 BeautifulSoup 파서 사용
         """
         # 실제 노량진수산시장 웹사이트 URL (예시)
         self.base_url = base_url or "http://www.noryangjin.co.kr/price/list"
         self.timeout = 30
+        self.transport = transport or get_transport()
+        self.streaming = streaming
     
     def get_market_id(self) -> int:
         """시장 ID 반환"""
@@ -43,9 +69,44 @@ class NoryangjinAdapter(MarketAdapter):
         """
         logger.info(f"Fetching Noryangjin market data for {date.strftime('%Y-%m-%d')}")
         
+        html = self._fetch_html(date)
+        try:
+            # HTML 파싱
+            if self.streaming:
+                return list(self.iter_rows(html, date))
+            return self._parse_html(html, date)
+            
+        except Exception as e:
+            logger.error(f"Error parsing Noryangjin market data: {str(e)}")
+            raise
+    
+    def fetch_batch(self, date: datetime) -> RawPriceBatch:
+        """
+        노량진수산시장 데이터를 컬럼 배치로 수집 (백필용)
+        
+        스트리밍 파서가 반환하는 행을 바로 컬럼에 채우므로 RawPriceData 리스트를 만들지 않습니다.
+        
+        Args:
+            date: 조회 날짜
+            
+        Returns:
+            RawPriceBatch
+        """
+        html = self._fetch_html(date)
         try:
-            # 웹페이지 요청
-            response = requests.get(
+            if self.streaming:
+                return RawPriceBatch.from_records(self.iter_rows(html, date))
+            return RawPriceBatch.from_records(self._parse_html(html, date))
+            
+        except Exception as e:
+            logger.error(f"Error parsing Noryangjin market data: {str(e)}")
+            raise
+    
+    def _fetch_html(self, date: datetime) -> str:
+        """시세 페이지 요청"""
+        try:
+            response = self.transport.request_sync(
+                'GET',
                 self.base_url,
                 params={'date': date.strftime('%Y%m%d')},
                 timeout=self.timeout,
@@ -53,21 +114,140 @@ class NoryangjinAdapter(MarketAdapter):
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 }
             )
-            response.raise_for_status()
-            
-            # HTML 파싱
-            return self._parse_html(response.text, date)
+            return response.text
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch Noryangjin market data: {str(e)}")
             raise
-        except Exception as e:
-            logger.error(f"Error parsing Noryangjin market data: {str(e)}")
-            raise
+    
+    def iter_rows(self, html: str, date: datetime) -> Iterator[RawPriceData]:
+        """
+        HTML을 스트리밍 파싱하여 가격 데이터를 한 행씩 반환
+        
+        전체 트리를 만들지 않고 첫 번째 price-table의 <tr>이 닫힐 때마다 처리한 뒤
+        요소를 해제하며, 테이블이 끝나면 나머지 문서는 읽지 않습니다.
+        _parse_html과 같은 규칙(첫 행은 헤더, td 4개 미만/품목명 없음/가격 0 이하 제외)을 따릅니다.
+        
+        Args:
+            html: HTML 문자열
+            date: 조회 날짜
+            
+        Yields:
+            RawPriceData
+        """
+        parser = etree.HTMLPullParser(events=('start', 'end'))
+        table = None
+        row_index = 0
+        count = 0
+        
+        for offset in range(0, len(html), PARSE_CHUNK_SIZE):
+            parser.feed(html[offset:offset + PARSE_CHUNK_SIZE])
+            
+            for event, elem in parser.read_events():
+                if table is None:
+                    if event == 'start' and elem.tag == 'table' and _has_class(elem, PRICE_TABLE_CLASS):
+                        table = elem
+                    continue
+                
+                if elem.tag == 'tr':
+                    if event == 'start':
+                        row_index += 1
+                    elif row_index > 1:  # 헤더 제외
+                        cols = [_element_text(td) for td in elem.iter('td')]
+                        price_data = self._parse_row(cols, date, elem)
+                        if price_data is not None:
+                            count += 1
+                            yield price_data
+                    
+                    # price-table 바로 아래(또는 tbody 아래) 행만 해제 (중첩 테이블 행은 바깥 행과 함께 해제)
+                    if event == 'end' and table in (elem.getparent(), elem.getparent().getparent()):
+                        _release(elem)
+                
+                elif event == 'end' and elem is table:
+                    logger.info(f"Parsed {count} items from Noryangjin market")
+                    return
+        
+        parser.close()
+        if table is None:
+            logger.warning("Price table not found in HTML")
+        else:
+            logger.info(f"Parsed {count} items from Noryangjin market")
+    
+    def _parse_row(self, cols: Sequence[str], date: datetime, row=None) -> Optional[RawPriceData]:
+        """
+        테이블 한 행(td 텍스트 목록)을 RawPriceData로 변환 (두 파서 공용)
+        
+        파싱할 수 없는 행은 셀 목록을 실패 행으로 기록하고 건너뜁니다.
+        
+        Returns:
+            RawPriceData, 건너뛸 행이면 None
+        """
+        try:
+            return self._parse_cells(cols, date)
+            
+        except (ValueError, IndexError) as e:
+            logger.warning(f"Failed to parse row: {row if row is not None else cols}, error: {str(e)}")
+            record_dead_letter(STAGE_PARSE, type(e).__name__, list(cols), str(e))
+            return None
+    
+    def _parse_cells(self, cols: Sequence[str], date: datetime) -> Optional[RawPriceData]:
+        """
+        td 텍스트 목록을 RawPriceData로 변환
+        
+        Returns:
+            RawPriceData, 건너뛸 행(td 4개 미만, 품목명 없음, 가격 0 이하)이면 None
+            
+        Raises:
+            ValueError, IndexError: 파싱할 수 없는 행
+        """
+        if len(cols) < 4:
+            return None
+        
+        # 품목명
+        raw_name = cols[0]
+        if not raw_name:
+            return None
+        
+        # 산지
+        origin = cols[1]
+        
+        # 규격/단위
+        unit = self._extract_unit(cols[2])
+        
+        # 가격
+        price = self._extract_price(cols[3])
+        
+        if price <= 0:
+            return None
+        
+        return RawPriceData(
+            raw_name=raw_name,
+            price=price,
+            unit=unit,
+            date=date,
+            origin=origin,
+            source='노량진수산시장'
+        )
+    
+    def parse_dead_letter(self, record: List[str], target_date: date_type) -> Optional[RawPriceData]:
+        """
+        저장된 실패 행(td 텍스트 목록) 다시 파싱 (replay.py, 네트워크 요청 없음)
+        
+        Args:
+            record: 파싱에 실패했던 행의 셀 텍스트 목록
+            target_date: 수집일
+            
+        Returns:
+            RawPriceData (시장 ID 포함), 건너뛸 행이면 None
+        """
+        price_data = self._parse_cells(record, datetime.combine(target_date, datetime.min.time()))
+        if price_data is not None:
+            price_data.market_id = self.MARKET_ID
+        return price_data
     
     def _parse_html(self, html: str, date: datetime) -> List[RawPriceData]:
         """
-        HTML 파싱하여 가격 데이터 추출
+        HTML 파싱하여 가격 데이터 추출 (BeautifulSoup 전체 트리 방식)
         
         Args:
             html: HTML 문자열
@@ -91,43 +271,10 @@ class NoryangjinAdapter(MarketAdapter):
         rows = price_table.find_all('tr')[1:]  # 헤더 제외
         
         for row in rows:
-            try:
-                cols = row.find_all('td')
-                
-                if len(cols) < 4:
-                    continue
-                
-                # 품목명
-                raw_name = cols[0].get_text(strip=True)
-                if not raw_name:
-                    continue
-                
-                # 산지
-                origin = cols[1].get_text(strip=True)
-                
-                # 규격/단위
-                unit_text = cols[2].get_text(strip=True)
-                unit = self._extract_unit(unit_text)
-                
-                # 가격
-                price_text = cols[3].get_text(strip=True)
-                price = self._extract_price(price_text)
-                
-                if price <= 0:
-                    continue
-                
-                results.append(RawPriceData(
-                    raw_name=raw_name,
-                    price=price,
-                    unit=unit,
-                    date=date,
-                    origin=origin,
-                    source='노량진수산시장'
-                ))
-                
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse row: {row}, error: {str(e)}")
-                continue
+            cols = [td.get_text(strip=True) for td in row.find_all('td')]
+            price_data = self._parse_row(cols, date, row)
+            if price_data is not None:
+                results.append(price_data)
         
         logger.info(f"Parsed {len(results)} items from Noryangjin market")
         return results
@@ -136,16 +283,21 @@ class NoryangjinAdapter(MarketAdapter):
         """
         가격 텍스트에서 숫자 추출
         
+        "원"이 붙은 금액을 우선 사용하고, 없으면 마지막 숫자를 가격으로 봅니다.
+        숫자를 모두 이어 붙이면 "1kg 18,500원"이 118500이 되므로 이어 붙이지 않습니다.
+        
         Args:
-            price_text: 가격 문자열 (예: "18,500원", "18500")
+            price_text: 가격 문자열 (예: "18,500원", "18500", "1kg 18,500원")
             
         Returns:
             가격 (float)
         """
-        # 숫자만 추출
-        numbers = re.findall(r'\d+', price_text.replace(',', ''))
+        match = _WON_AMOUNT_RE.search(price_text)
+        if match:
+            return float(match.group(1).replace(',', ''))
+        numbers = _AMOUNT_RE.findall(price_text)
         if numbers:
-            return float(''.join(numbers))
+            return float(numbers[-1].replace(',', ''))
         return 0.0
     
     def _extract_unit(self, unit_text: str) -> str:
@@ -156,15 +308,23 @@ class NoryangjinAdapter(MarketAdapter):
             unit_text: 단위 문자열 (예: "1kg", "10마리", "1상자")
             
         Returns:
-            표준 단위
+            수량을 보존한 표준 단위 (예: "kg", "10마리", "상자")
         """
-        unit_text = unit_text.lower()
-        
-        if 'kg' in unit_text or '킬로' in unit_text:
-            return 'kg'
-        elif '마리' in unit_text or 'ea' in unit_text:
-            return '마리'
-        elif '상자' in unit_text or 'box' in unit_text:
-            return '상자'
-        else:
-            return 'kg'  # 기본값
+        return normalize_unit(unit_text)
+
+
+def _has_class(elem, class_name: str) -> bool:
+    return class_name in (elem.get('class') or '').split()
+
+
+def _element_text(elem) -> str:
+    """BeautifulSoup get_text(strip=True)와 같은 규칙 (조각별 strip 후 이어 붙임)"""
+    return ''.join(piece.strip() for piece in elem.itertext())
+
+
+def _release(elem):
+    """처리한 행과 그 앞 형제 요소 해제 (트리가 커지지 않도록)"""
+    elem.clear(keep_tail=False)
+    parent = elem.getparent()
+    while elem.getprevious() is not None:
+        del parent[0]
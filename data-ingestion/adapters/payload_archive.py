@@ -0,0 +1,320 @@
+"""
+원본 응답 보관소 (payload archive)
+
+스케줄러가 수집한 어댑터별 원본 HTTP 응답을 (어댑터, 수집일) 단위로 압축 보관하고,
+보관한 응답을 네트워크 요청 없이 다시 돌려주는 ArchiveTransport를 제공합니다.
+- 보관 경로: PAYLOAD_ARCHIVE_DIR/<어댑터>/<YYYY>/<MM>/<YYYY-MM-DD>.payloads.gz
+- 파일 형식: gzip 안에 응답마다 JSON 헤더 한 줄 + 본문 바이트 (본문은 인코딩 그대로 보관)
+- 같은 (어댑터, 수집일)을 다시 수집하면 마지막 수집 응답으로 교체 (임시 파일 후 교체)
+- API 키 파라미터(serviceKey, p_cert_key 등)는 보관하지 않으며 재생 시 요청 키에서도 제외
+- 조건부 요청의 304 응답은 본문이 없어 보관하지 않음
+
+record_payloads() 블록 밖(백필, 벤치마크, 단독 어댑터 호출 등)에서는 아무것도 모으지 않습니다.
+"""
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Union
+from urllib.parse import urlencode
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 보관소 루트 디렉터리 / gzip 압축 수준 (1: 빠름 ~ 9: 작음)
+PAYLOAD_ARCHIVE_DIR = os.getenv("PAYLOAD_ARCHIVE_DIR", ".archive/payloads")
+PAYLOAD_ARCHIVE_COMPRESS_LEVEL = int(os.getenv("PAYLOAD_ARCHIVE_COMPRESS_LEVEL", "6"))
+
+# 보관/재생 키에서 제외할 인증 파라미터
+SECRET_PARAMS = frozenset({"serviceKey", "ServiceKey", "p_cert_key", "apiKey", "api_key"})
+
+ARCHIVE_SUFFIX = ".payloads.gz"
+
+
+@dataclass
+class ArchivedPayload:
+    """보관한 응답 하나"""
+    method: str
+    url: str
+    params: Dict[str, str] = field(default_factory=dict)   # 인증 파라미터 제외 (GET 쿼리 또는 POST 폼)
+    status: int = 200
+    content_type: Optional[str] = None
+    body: bytes = b""
+
+    @property
+    def key(self) -> str:
+        return request_key(self.method, self.url, self.params)
+
+
+class PayloadRecorder:
+    """record_payloads 블록 안에서 받은 응답 (여러 스레드에서 추가해도 안전)"""
+
+    def __init__(self):
+        self.payloads: List[ArchivedPayload] = []
+        self._lock = threading.Lock()
+
+    def add(self, payload: ArchivedPayload):
+        with self._lock:
+            self.payloads.append(payload)
+
+    @property
+    def bytes(self) -> int:
+        return sum(len(payload.body) for payload in self.payloads)
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+
+_payload_recorder: ContextVar[Optional[PayloadRecorder]] = ContextVar("payload_recorder", default=None)
+
+
+@contextmanager
+def record_payloads() -> Iterator[PayloadRecorder]:
+    """
+    블록 안에서 받은 원본 응답 수집
+
+    measure_payload와 마찬가지로 현재 컨텍스트만 모으므로, 다른 스레드로 요청을 넘길 때는
+    contextvars.copy_context().run으로 감싸야 함께 모입니다.
+
+    사용 예:
+        with record_payloads() as recorder:
+            raw_data = adapter.fetch_data(date)
+        archive.write(adapter_name, date, recorder.payloads)
+    """
+    recorder = PayloadRecorder()
+    token = _payload_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _payload_recorder.reset(token)
+
+
+def recording() -> bool:
+    """응답을 모으는 중인지 (모으지 않으면 스트리밍 본문을 모아 둘 필요 없음)"""
+    return _payload_recorder.get() is not None
+
+
+def record_response(
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    data: Optional[Dict[str, Any]],
+    status: int,
+    content_type: Optional[str],
+    body: bytes
+):
+    """응답 기록 (record_payloads 블록 밖이거나 304면 무시) - HttpTransport에서 호출"""
+    recorder = _payload_recorder.get()
+    if recorder is None or status == 304:
+        return
+    recorder.add(ArchivedPayload(
+        method=method.upper(),
+        url=url,
+        params=public_params(params if params is not None else data),
+        status=status,
+        content_type=content_type,
+        body=body,
+    ))
+
+
+def public_params(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """인증 파라미터를 뺀 요청 파라미터 (값은 문자열)"""
+    return {
+        str(name): str(value)
+        for name, value in (params or {}).items()
+        if name not in SECRET_PARAMS and value is not None
+    }
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, Any]]) -> str:
+    """응답을 찾는 키 (메서드 + URL + 정렬한 공개 파라미터)"""
+    query = urlencode(sorted(public_params(params).items()))
+    return f"{method.upper()} {url}" + (f"?{query}" if query else "")
+
+
+class PayloadArchive:
+    """수집일 단위로 나눈 로컬 원본 응답 보관소"""
+
+    def __init__(self, root: Union[str, Path] = PAYLOAD_ARCHIVE_DIR, compress_level: int = PAYLOAD_ARCHIVE_COMPRESS_LEVEL):
+        """
+        Args:
+            root: 보관소 루트 디렉터리
+            compress_level: gzip 압축 수준 (1~9)
+        """
+        self.root = Path(root)
+        self.compress_level = compress_level
+
+    def path(self, adapter: str, day: date) -> Path:
+        """(어댑터, 수집일) 보관 파일 경로"""
+        day = _as_date(day)
+        return self.root / adapter / f"{day:%Y}" / f"{day:%m}" / f"{day.isoformat()}{ARCHIVE_SUFFIX}"
+
+    def write(self, adapter: str, day: date, payloads: Sequence[ArchivedPayload]) -> Optional[Path]:
+        """
+        응답 보관 (같은 수집일 파일이 있으면 교체)
+
+        임시 파일에 쓴 뒤 os.replace로 교체하므로 쓰는 도중 중단되어도 이전 파일이 남습니다.
+
+        Returns:
+            보관 파일 경로 (응답이 없으면 None)
+        """
+        if not payloads:
+            return None
+        path = self.path(adapter, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=ARCHIVE_SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=self.compress_level, mtime=0
+            ) as stream:
+                for payload in payloads:
+                    header = asdict(payload)
+                    header["size"] = len(header.pop("body"))
+                    stream.write(json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n")
+                    stream.write(payload.body)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return path
+
+    def read(self, adapter: str, day: date) -> List[ArchivedPayload]:
+        """
+        보관한 응답 읽기
+
+        Raises:
+            FileNotFoundError: 보관한 응답이 없는 경우
+        """
+        payloads = []
+        with gzip.open(self.path(adapter, day), "rb") as stream:
+            while True:
+                line = stream.readline()
+                if not line:
+                    break
+                header = json.loads(line)
+                size = header.pop("size")
+                body = stream.read(size)
+                if len(body) != size:
+                    raise ValueError(f"Truncated payload archive: {self.path(adapter, day)}")
+                payloads.append(ArchivedPayload(body=body, **header))
+        return payloads
+
+    def adapters(self) -> List[str]:
+        """응답을 보관한 어댑터 이름"""
+        if not self.root.is_dir():
+            return []
+        return sorted(entry.name for entry in self.root.iterdir() if entry.is_dir())
+
+    def dates(self, adapter: str, start: Optional[date] = None, end: Optional[date] = None) -> List[date]:
+        """어댑터의 보관 수집일 (start/end 포함, 오름차순)"""
+        days = []
+        for path in (self.root / adapter).glob(f"*/*/*{ARCHIVE_SUFFIX}"):
+            try:
+                day = date.fromisoformat(path.name[:-len(ARCHIVE_SUFFIX)])
+            except ValueError:
+                continue
+            if (start is None or day >= start) and (end is None or day <= end):
+                days.append(day)
+        return sorted(days)
+
+
+class ArchiveMissError(httpx.RequestError):
+    """보관소에 없는 요청 (httpx.HTTPError 하위 클래스이므로 어댑터의 네트워크 오류 처리를 그대로 탐)"""
+
+
+class ArchiveTransport:
+    """
+    보관한 응답을 돌려주는 전송 계층 (HttpTransport와 같은 메서드, 네트워크/속도 제한 없음)
+
+    같은 키의 요청이 여러 번 보관되어 있으면 보관 순서대로 돌려주고, 마지막 응답은 계속 재사용합니다.
+    measure_payload/record_payloads 집계도 HttpTransport와 같이 동작합니다.
+    """
+
+    def __init__(self, payloads: Sequence[ArchivedPayload]):
+        self._payloads: Dict[str, Deque[ArchivedPayload]] = defaultdict(deque)
+        for payload in payloads:
+            self._payloads[payload.key].append(payload)
+        self._lock = threading.Lock()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ) -> httpx.Response:
+        return self.request_sync(method, url, params=params, data=data)
+
+    async def request_many(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        return_exceptions: bool = True
+    ) -> List[Union[httpx.Response, BaseException]]:
+        return self.request_many_sync(requests, return_exceptions)
+
+    def request_sync(self, method: str, url: str, **kwargs) -> httpx.Response:
+        from .http_transport import _record_payload
+
+        params = kwargs.get('params')
+        data = kwargs.get('data')
+        payload = self._take(method, url, params if params is not None else data)
+        request = httpx.Request(method.upper(), url, params=params if method.upper() == "GET" else None)
+        headers = {"Content-Type": payload.content_type} if payload.content_type else {}
+        response = httpx.Response(payload.status, headers=headers, content=payload.body, request=request)
+        if not response.is_success:
+            response.raise_for_status()
+        _record_payload(len(payload.body))
+        record_response(method, url, params, data, payload.status, payload.content_type, payload.body)
+        return response
+
+    def request_many_sync(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        return_exceptions: bool = True
+    ) -> List[Union[httpx.Response, BaseException]]:
+        responses: List[Union[httpx.Response, BaseException]] = []
+        for kwargs in requests:
+            kwargs = dict(kwargs)
+            try:
+                responses.append(self.request_sync(kwargs.pop('method'), kwargs.pop('url'), **kwargs))
+            except Exception as error:
+                if not return_exceptions:
+                    raise
+                responses.append(error)
+        return responses
+
+    def stream_sync(self, method: str, url: str, chunk_size: int = 64 * 1024, **kwargs) -> Iterator[bytes]:
+        body = self.request_sync(method, url, **kwargs).content
+        for offset in range(0, len(body), chunk_size):
+            yield body[offset:offset + chunk_size]
+
+    def close(self):
+        self._payloads.clear()
+
+    def _take(self, method: str, url: str, params: Optional[Dict[str, Any]]) -> ArchivedPayload:
+        key = request_key(method, url, params)
+        with self._lock:
+            queue = self._payloads.get(key)
+            if not queue:
+                raise ArchiveMissError(f"No archived response for {key}")
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
@@ -0,0 +1,228 @@
+"""
+컬럼 단위 가격 배치 (NumPy)
+
+대량 수집(백필)에서 행마다 RawPriceData → dict → DB 파라미터로 객체를 세 번 만들지 않도록,
+어댑터 → DataNormalizer → PriceRepository.copy_upsert 사이를 컬럼 배열로 넘깁니다.
+- RawPriceBatch: 어댑터 수집 결과 (fetch_price_batch로 생성)
+- NormalizedPriceBatch: 정규화 결과 (market_prices 컬럼 순서로 iter_rows)
+
+검증과 단위 변환은 배열 연산으로 처리하고, 문자열 컬럼은 object 배열로 둡니다.
+"""
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import RawPriceData
+from .units import parse_unit
+
+# market_prices 저장 컬럼 순서 (PriceRepository.copy_upsert와 동일)
+PRICE_COLUMNS = ("item_id", "market_id", "date", "price", "unit", "origin", "source")
+
+# RawPriceBatch.market_id에서 "레코드별 시장 없음" 표시
+NO_MARKET = -1
+
+
+@dataclass
+class RawPriceBatch:
+    """어댑터 수집 결과 (컬럼 배열, 모든 배열의 길이가 같음)"""
+    raw_name: np.ndarray   # object
+    price: np.ndarray      # float64
+    unit: np.ndarray       # object
+    date: np.ndarray       # object (datetime.date)
+    origin: np.ndarray     # object
+    source: np.ndarray     # object
+    market_id: np.ndarray  # int64 (NO_MARKET이면 어댑터 시장 사용)
+
+    @classmethod
+    def from_records(cls, records: Iterable[RawPriceData]) -> "RawPriceBatch":
+        """
+        RawPriceData들로 배치 생성
+
+        제너레이터를 넘기면 레코드 객체를 모아 두지 않고 바로 컬럼에 채웁니다.
+        datetime 날짜는 date로 바꿉니다.
+        """
+        raw_names, prices, units, dates, origins, sources, market_ids = ([] for _ in _RAW_FIELDS)
+        for record in records:
+            raw_names.append(record.raw_name)
+            prices.append(record.price)
+            units.append(record.unit)
+            dates.append(record.date)
+            origins.append(record.origin or "")
+            sources.append(record.source or "")
+            market_ids.append(record.market_id)
+
+        return cls(
+            raw_name=_object_array(raw_names),
+            price=np.asarray(prices, dtype=np.float64),
+            unit=_object_array(units),
+            date=_object_array([_as_date(value) for value in dates]),
+            origin=_object_array(origins),
+            source=_object_array(sources),
+            market_id=np.asarray(
+                [NO_MARKET if market_id is None else market_id for market_id in market_ids],
+                dtype=np.int64
+            ),
+        )
+
+    @classmethod
+    def empty(cls) -> "RawPriceBatch":
+        return cls.from_records(())
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def take(self, index: np.ndarray) -> "RawPriceBatch":
+        """불리언 마스크 또는 인덱스 배열로 행 선택"""
+        return RawPriceBatch(**{name: getattr(self, name)[index] for name in _RAW_FIELDS})
+
+    def valid_mask(self) -> np.ndarray:
+        """
+        저장할 수 있는 행 마스크 (DataNormalizer._validate_data와 같은 규칙)
+
+        품목명/단위가 비어 있지 않고 가격 > 0 (가격 상한은 단위 변환 후 단가에 적용)
+        """
+        return (
+            _non_blank(self.raw_name)
+            & _non_blank(self.unit)
+            & (self.price > 0)
+        )
+
+    def resolve_market_ids(self, default: Optional[int]) -> np.ndarray:
+        """레코드별 시장이 없으면 default로 채운 시장 ID 배열"""
+        fill = NO_MARKET if default is None else default
+        return np.where(self.market_id == NO_MARKET, fill, self.market_id)
+
+    def iter_records(self) -> Iterator[RawPriceData]:
+        """RawPriceData로 되돌리기 (페이로드 해시 등 행 단위 처리용)"""
+        for raw_name, price, unit, price_date, origin, source, market_id in zip(
+            self.raw_name.tolist(), self.price.tolist(), self.unit.tolist(), self.date.tolist(),
+            self.origin.tolist(), self.source.tolist(), self.market_id.tolist()
+        ):
+            yield RawPriceData(
+                raw_name=raw_name,
+                price=price,
+                unit=unit,
+                date=price_date,
+                origin=origin,
+                source=source,
+                market_id=None if market_id == NO_MARKET else market_id,
+            )
+
+
+@dataclass
+class NormalizedPriceBatch:
+    """정규화 결과 (market_prices 저장 컬럼 배열)"""
+    item_id: np.ndarray    # int64
+    market_id: np.ndarray  # int64
+    date: np.ndarray       # object (datetime.date)
+    price: np.ndarray      # float64 (표준 단위당 가격)
+    unit: np.ndarray       # object (표준 단위)
+    origin: np.ndarray     # object
+    source: np.ndarray     # object
+
+    @classmethod
+    def empty(cls) -> "NormalizedPriceBatch":
+        return cls(
+            item_id=np.empty(0, dtype=np.int64),
+            market_id=np.empty(0, dtype=np.int64),
+            date=np.empty(0, dtype=object),
+            price=np.empty(0, dtype=np.float64),
+            unit=np.empty(0, dtype=object),
+            origin=np.empty(0, dtype=object),
+            source=np.empty(0, dtype=object),
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence["NormalizedPriceBatch"]) -> "NormalizedPriceBatch":
+        """여러 배치를 하나로 합침"""
+        batches = [batch for batch in batches if len(batch)]
+        if not batches:
+            return cls.empty()
+        if len(batches) == 1:
+            return batches[0]
+        return cls(**{
+            name: np.concatenate([getattr(batch, name) for batch in batches])
+            for name in PRICE_COLUMNS
+        })
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def take(self, index: np.ndarray) -> "NormalizedPriceBatch":
+        """불리언 마스크 또는 인덱스 배열로 행 선택"""
+        return NormalizedPriceBatch(**{name: getattr(self, name)[index] for name in PRICE_COLUMNS})
+
+    def iter_rows(self) -> Iterator[tuple]:
+        """PRICE_COLUMNS 순서의 행 튜플 (NumPy 스칼라가 아닌 파이썬 값)"""
+        return zip(*(getattr(self, name).tolist() for name in PRICE_COLUMNS))
+
+    def to_dicts(self) -> List[dict]:
+        """diff_upsert 입력 형식 (행 수가 적을 때만 사용)"""
+        return [dict(zip(PRICE_COLUMNS, row)) for row in self.iter_rows()]
+
+
+def convert_unit_prices(prices: np.ndarray, units: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    가격 배열을 표준 단위당 가격으로 변환 (units.convert_prices의 배열 버전)
+
+    고유한 규격 표기만 parse_unit으로 파싱하고, 수량 나누기는 배열 연산으로 처리합니다.
+
+    Args:
+        prices: 표기 수량당 가격 (float64)
+        units: 규격 표기 (object)
+
+    Returns:
+        (단가 배열, 표준 단위 배열)
+    """
+    codes: Dict[Optional[str], int] = {}
+    inverse = np.fromiter(
+        (codes.setdefault(unit, len(codes)) for unit in units.tolist()),
+        dtype=np.int64,
+        count=len(units)
+    )
+    parsed = [parse_unit(unit) for unit in codes]
+
+    quantities = np.array([p.quantity for p in parsed], dtype=np.float64)
+    convert = np.array([p.convertible and p.quantity != 1 for p in parsed], dtype=bool)
+    standard_units = _object_array([p.unit for p in parsed])
+
+    row_quantities = quantities[inverse]
+    converted = np.where(convert[inverse], np.round(prices / row_quantities, 2), prices)
+    return converted, standard_units[inverse]
+
+
+def fetch_price_batch(adapter, target_date: datetime) -> RawPriceBatch:
+    """
+    어댑터 수집 결과를 배치로 반환
+
+    어댑터에 fetch_batch가 있으면 사용하고(레코드 리스트를 만들지 않음), 없으면 fetch_data 결과를 변환합니다.
+    """
+    fetch_batch = getattr(adapter, "fetch_batch", None)
+    if fetch_batch is not None:
+        return fetch_batch(target_date)
+    return RawPriceBatch.from_records(adapter.fetch_data(target_date))
+
+
+_RAW_FIELDS = tuple(field.name for field in fields(RawPriceBatch))
+
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _object_array(values: list) -> np.ndarray:
+    # 슬라이스 대입은 date 등 원소마다 배열 변환을 시도해 느리므로 fromiter 사용
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _non_blank(values: np.ndarray) -> np.ndarray:
+    """None/빈 문자열/공백만 있는 문자열이 아닌 행 마스크"""
+    if not len(values):
+        return np.zeros(0, dtype=bool)
+    return np.fromiter(
+        (bool(value and value.strip()) for value in values.tolist()),
+        dtype=bool,
+        count=len(values)
+    )
@@ -4,14 +4,20 @@
 공공데이터 포털의 다양한 API를 통합하기 위한 기본 어댑터 클래스를 제공합니다.
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple, Union
 from datetime import datetime
 from enum import Enum
 import logging
-import requests
-import time
 import hashlib
 import json
+import threading
+import time
+
+import ijson
+
+from .http_transport import HttpTransport, get_transport
+from .response_cache import CachedResponse, ResponseCache, get_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -24,26 +30,49 @@ class DataCategory(Enum):
     REGULATION = "regulation"
 
 
+@dataclass
+class _PreparedRequest:
+    """캐시 조회를 마친 요청 (cached가 fresh면 네트워크 요청 생략)"""
+    url: str
+    kwargs: Dict[str, Any]
+    cache_key: Optional[str] = None
+    cached: Optional[CachedResponse] = None
+    hit: bool = False
+
+
 class BasePublicDataAdapter(ABC):
     """공공데이터 API 어댑터 기본 클래스
     
     공통 기능:
-    - API 호출 로직 (재시도, 타임아웃)
+    - API 호출 로직 (공용 비동기 전송 계층, 비차단 재시도, 타임아웃)
     - 에러 처리 및 로깅
-    - 캐시 키 생성
+    - 응답 캐시 (카테고리별 TTL, ETag/Last-Modified 재검증)
     """
     
-    def __init__(self, api_key: str, base_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        transport: Optional[HttpTransport] = None,
+        response_cache: Optional[ResponseCache] = None,
+        use_cache: bool = True
+    ):
         """
         Args:
             api_key: 공공데이터 API 키
             base_url: API 기본 URL
+            transport: HTTP 전송 계층 (기본값: 프로세스 공용 전송 계층)
+            response_cache: 응답 캐시 (기본값: 환경변수로 설정된 프로세스 공용 캐시)
+            use_cache: False면 응답 캐시를 사용하지 않음
         """
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = 30  # 초
         self.max_retries = 3
-        self.session = requests.Session()
+        self.transport = transport or get_transport()
+        self.response_cache = (response_cache or get_response_cache()) if use_cache else None
+        self.cache_stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'errors': 0}
+        self._cache_stats_lock = threading.Lock()
         
     @abstractmethod
     def get_category(self) -> DataCategory:
@@ -124,7 +153,45 @@ class BasePublicDataAdapter(ABC):
         params: Optional[Dict[str, Any]] = None,
         method: str = "GET"
     ) -> Dict[str, Any]:
-        """API 요청 실행 (재시도 로직 포함)
+        """API 요청 실행 (응답 캐시, 재시도 로직 포함)
+        
+        1. 캐시가 TTL 이내면 네트워크 요청 없이 반환
+        2. 만료된 캐시에 ETag/Last-Modified가 있으면 조건부 요청 (304면 캐시 재사용)
+        3. 그 외에는 요청 후 get_cache_ttl() 동안 캐시
+        
+        공용 전송 계층의 이벤트 루프에서 실행되므로 재시도 대기 중에도
+        다른 어댑터의 요청을 막지 않습니다.
+        
+        Args:
+            endpoint: API 엔드포인트
+            params: 요청 파라미터
+            method: HTTP 메서드
+            
+        Returns:
+            Dict[str, Any]: API 응답
+            
+        Raises:
+            httpx.HTTPError: API 요청 실패 시
+        """
+        prepared = self._prepare_request(endpoint, params, method)
+        if prepared.hit:
+            return prepared.cached.body
+        
+        try:
+            response = self.transport.request_sync(**prepared.kwargs)
+        except Exception as error:
+            self._log_request_failure(prepared.url, error)
+            raise
+        
+        return self._handle_response(prepared, response)
+    
+    async def make_request_async(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET"
+    ) -> Dict[str, Any]:
+        """API 요청 실행 (비동기 버전, 응답 캐시/재시도 로직 포함)
         
         Args:
             endpoint: API 엔드포인트
@@ -133,73 +200,225 @@ class BasePublicDataAdapter(ABC):
             
         Returns:
             Dict[str, Any]: API 응답
+        """
+        prepared = self._prepare_request(endpoint, params, method)
+        if prepared.hit:
+            return prepared.cached.body
+        
+        try:
+            response = await self.transport.request(**prepared.kwargs)
+        except Exception as error:
+            self._log_request_failure(prepared.url, error)
+            raise
+        
+        return self._handle_response(prepared, response)
+    
+    def make_requests(
+        self,
+        endpoint: str,
+        params_list: Sequence[Optional[Dict[str, Any]]],
+        method: str = "GET"
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """여러 페이지/조건의 API 요청을 동시에 실행 (캐시 적중 요청은 생략)
+        
+        Args:
+            endpoint: API 엔드포인트
+            params_list: 요청별 파라미터 리스트
+            method: HTTP 메서드
+            
+        Returns:
+            요청 순서대로 API 응답 또는 실패한 요청의 예외
+        """
+        prepared_list = [self._prepare_request(endpoint, params, method) for params in params_list]
+        pending = [prepared for prepared in prepared_list if not prepared.hit]
+        responses = self.transport.request_many_sync([prepared.kwargs for prepared in pending])
+        response_map = {id(prepared): response for prepared, response in zip(pending, responses)}
+        
+        results: List[Union[Dict[str, Any], Exception]] = []
+        for prepared in prepared_list:
+            if prepared.hit:
+                results.append(prepared.cached.body)
+                continue
+            
+            response = response_map[id(prepared)]
+            if isinstance(response, BaseException):
+                self._log_request_failure(prepared.url, response)
+                results.append(response)
+                continue
+            try:
+                results.append(self._handle_response(prepared, response))
+            except ValueError as error:
+                self._log_request_failure(prepared.url, error)
+                results.append(error)
+        return results
+    
+    def iter_json_items(
+        self,
+        endpoint: str,
+        prefix: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET"
+    ) -> Iterator[Any]:
+        """대용량 JSON 응답을 받는 대로 디코딩하여 prefix 위치의 항목을 하나씩 반환
+        
+        응답 본문 전체나 디코딩된 전체 객체를 메모리에 두지 않으므로 응답 크기와 무관하게
+        메모리 사용량이 일정합니다. 응답 캐시는 사용하지 않습니다.
+        
+        Args:
+            endpoint: API 엔드포인트
+            prefix: ijson 경로 (예: 'data.item' - {"data": [...]}의 각 항목)
+            params: 요청 파라미터
+            method: HTTP 메서드
+            
+        Yields:
+            prefix 위치의 JSON 항목 (숫자는 float)
             
         Raises:
-            requests.RequestException: API 요청 실패 시
+            httpx.HTTPError: API 요청 실패 시
+            ijson.JSONError: 응답이 올바른 JSON이 아닌 경우
         """
-        from .retry_strategy import RetryStrategy
+        url, request_kwargs = self._build_request(endpoint, params, method)
+        self._log_request(_PreparedRequest(url=url, kwargs=request_kwargs))
+        
+        items = ijson.sendable_list()
+        decoder = ijson.items_coro(items, prefix, use_float=True)
+        count = 0
+        try:
+            for chunk in self.transport.stream_sync(**request_kwargs):
+                decoder.send(chunk)
+                for item in items:
+                    yield item
+                count += len(items)
+                del items[:]
+            decoder.close()
+            yield from items
+            count += len(items)
+        except Exception as error:
+            self._log_request_failure(url, error)
+            raise
+        
+        logger.info(f"API 스트리밍 수신 완료: {url} ({count}건)")
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """응답 캐시 통계 (hits: TTL 이내 적중, revalidated: 304 재사용, misses: 새로 받음)"""
+        with self._cache_stats_lock:
+            stats = dict(self.cache_stats)
+        lookups = stats['hits'] + stats['revalidated'] + stats['misses']
+        stats['hit_ratio'] = round((stats['hits'] + stats['revalidated']) / lookups, 3) if lookups else 0.0
+        return stats
+    
+    def _prepare_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        method: str
+    ) -> _PreparedRequest:
+        """캐시 조회 후 요청 준비 (재검증 가능하면 조건부 헤더 추가)"""
+        url, request_kwargs = self._build_request(endpoint, params, method)
+        prepared = _PreparedRequest(url=url, kwargs=request_kwargs)
+        
+        if self.response_cache is None or method.upper() != "GET":
+            self._log_request(prepared)
+            return prepared
+        
+        prepared.cache_key = self.get_cache_key(
+            endpoint=endpoint,
+            method=method.upper(),
+            params=params or {}
+        )
+        try:
+            prepared.cached = self.response_cache.get(prepared.cache_key)
+        except Exception as error:
+            self._count_cache('errors')
+            logger.warning(f"응답 캐시 조회 실패: {error}", extra={'cache_key': prepared.cache_key})
+        
+        if prepared.cached is not None:
+            if prepared.cached.is_fresh():
+                prepared.hit = True
+                self._count_cache('hits')
+                logger.debug(f"응답 캐시 적중: {url}", extra={'cache_key': prepared.cache_key})
+                return prepared
+            if prepared.cached.can_revalidate():
+                request_kwargs['headers'] = prepared.cached.conditional_headers()
         
+        self._log_request(prepared)
+        return prepared
+    
+    def _handle_response(self, prepared: _PreparedRequest, response) -> Dict[str, Any]:
+        """응답 처리 및 캐시 저장 (304면 보관 중인 캐시 재사용)"""
+        now = time.time()
+        
+        if response.status_code == 304 and prepared.cached is not None:
+            self._count_cache('revalidated')
+            logger.info(f"API 응답 변경 없음 (304), 캐시 재사용: {prepared.url}")
+            prepared.cached.stored_at = now
+            prepared.cached.expires_at = now + self.get_cache_ttl()
+            self._store_cache(prepared.cache_key, prepared.cached)
+            return prepared.cached.body
+        
+        body = response.json()
+        logger.info(f"API 요청 성공: {prepared.url}")
+        
+        if prepared.cache_key is not None:
+            self._count_cache('misses')
+            self._store_cache(prepared.cache_key, CachedResponse(
+                body=body,
+                stored_at=now,
+                expires_at=now + self.get_cache_ttl(),
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            ))
+        return body
+    
+    def _store_cache(self, cache_key: str, entry: CachedResponse):
+        try:
+            self.response_cache.set(cache_key, entry)
+        except Exception as error:
+            self._count_cache('errors')
+            logger.warning(f"응답 캐시 저장 실패: {error}", extra={'cache_key': cache_key})
+    
+    def _count_cache(self, name: str):
+        with self._cache_stats_lock:
+            self.cache_stats[name] += 1
+    
+    def _build_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        method: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """요청 URL과 전송 계층 인자 생성 (API 키 추가)"""
         url = f"{self.base_url}{endpoint}"
         
         # API 키를 파라미터에 추가
-        if params is None:
-            params = {}
+        params = dict(params or {})
         params['serviceKey'] = self.api_key
         
-        attempt = 0
-        last_error = None
-        
-        while attempt < self.max_retries:
-            try:
-                logger.info(
-                    f"API 요청 시도 {attempt + 1}/{self.max_retries}: {url}",
-                    extra={'params': self._sanitize_params(params)}
-                )
-                
-                if method.upper() == "GET":
-                    response = self.session.get(
-                        url,
-                        params=params,
-                        timeout=self.timeout
-                    )
-                else:
-                    response = self.session.post(
-                        url,
-                        data=params,
-                        timeout=self.timeout
-                    )
-                
-                response.raise_for_status()
-                
-                logger.info(f"API 요청 성공: {url}")
-                return response.json()
-                
-            except Exception as error:
-                last_error = error
-                attempt += 1
-                
-                # 재시도 여부 판단
-                if not RetryStrategy.should_retry(error, attempt):
-                    logger.error(
-                        f"API 요청 실패 (재시도 안함): {url}",
-                        extra={'error': str(error)}
-                    )
-                    raise
-                
-                # 재시도 대기
-                delay = RetryStrategy.get_delay(attempt, error)
-                logger.warning(
-                    f"API 요청 실패, {delay}초 후 재시도: {url}",
-                    extra={'error': str(error), 'attempt': attempt}
-                )
-                time.sleep(delay)
-        
-        # 모든 재시도 실패
+        request_kwargs: Dict[str, Any] = {
+            'method': method,
+            'url': url,
+            'timeout': self.timeout,
+            'max_retries': self.max_retries,
+        }
+        if method.upper() == "GET":
+            request_kwargs['params'] = params
+        else:
+            request_kwargs['data'] = params
+        return url, request_kwargs
+    
+    def _log_request(self, prepared: _PreparedRequest):
+        params = prepared.kwargs.get('params') or prepared.kwargs.get('data') or {}
+        logger.info(
+            f"API 요청: {prepared.url}",
+            extra={'params': self._sanitize_params(params)}
+        )
+    
+    def _log_request_failure(self, url: str, error: Exception):
+        """재시도 후 최종 실패 로그"""
         logger.error(
             f"API 요청 최종 실패: {url}",
-            extra={'error': str(last_error), 'attempts': self.max_retries}
+            extra={'error': str(error), 'attempts': self.max_retries}
         )
-        raise last_error
     
     def _sanitize_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """로그용 파라미터 정제 (API 키 마스킹)
@@ -232,14 +451,22 @@ class BasePublicDataAdapter(ABC):
             duplicate_count: 중복 건수
             execution_time: 실행 시간 (초)
         """
+        cache_stats = self.get_cache_stats()
         logger.info(
-            f"{self.__class__.__name__} 수집 완료",
+            f"{self.__class__.__name__} 수집 완료 "
+            f"(캐시 적중 {cache_stats['hits']}, 재검증 {cache_stats['revalidated']}, "
+            f"미적중 {cache_stats['misses']})",
             extra={
                 'adapter': self.__class__.__name__,
                 'category': self.get_category().value,
                 'success': success_count,
                 'failure': failure_count,
                 'duplicate': duplicate_count,
-                'execution_time': f"{execution_time:.2f}s"
+                'execution_time': f"{execution_time:.2f}s",
+                'cache_hits': cache_stats['hits'],
+                'cache_revalidated': cache_stats['revalidated'],
+                'cache_misses': cache_stats['misses'],
+                'cache_errors': cache_stats['errors'],
+                'cache_hit_ratio': cache_stats['hit_ratio'],
             }
         )
@@ -0,0 +1,153 @@
+"""
+호스트별 요청 속도 제한 / 서킷 브레이커
+
+HttpTransport가 호스트(scheme://host:port)마다 하나씩 두고 모든 어댑터와
+백필 워커가 공유합니다.
+- TokenBucket: 초당 rate개, 최대 capacity개까지 몰아서 요청 (429 Retry-After 동안 전체 일시 정지)
+- CircuitBreaker: 연속 실패가 임계값을 넘으면 일정 시간 요청을 즉시 실패시키고,
+  이후 요청 하나만 통과시켜(half-open) 복구 여부 확인
+"""
+import logging
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """서킷이 열려 있어 요청하지 않고 실패 (재시도 대상 아님)"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}, retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한
+
+    acquire()는 토큰을 미리 예약하고 대기 시간만 돌려주므로 요청 순서대로 공평하게
+    간격이 벌어집니다 (대기는 호출 측에서 asyncio.sleep).
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: 초당 토큰 보충 수 (0 이하면 제한 없음)
+            capacity: 버킷 크기 (한 번에 몰아서 보낼 수 있는 요청 수)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나 예약 후 요청까지 기다려야 할 시간(초) 반환"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._paused_until - now)
+
+    def pause(self, seconds: float):
+        """서버가 요청한 시간(Retry-After) 동안 이 호스트의 모든 요청 보류"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class CircuitBreaker:
+    """
+    서킷 브레이커 (closed → open → half-open → closed)
+
+    연결 실패/타임아웃/5xx만 실패로 셉니다. 4xx·429는 서버가 응답한 것이므로 성공으로 봅니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, host: str, failure_threshold: int, recovery_timeout: float):
+        """
+        Args:
+            host: 대상 호스트 (로그용)
+            failure_threshold: 서킷을 여는 연속 실패 수
+            recovery_timeout: 열린 뒤 half-open으로 전환할 때까지의 시간 (초)
+        """
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """
+        요청 가능 여부 확인
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있거나 half-open 확인 요청이 진행 중인 경우
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                retry_in = self._opened_at + self.recovery_timeout - now
+                if retry_in > 0:
+                    raise CircuitOpenError(self.host, retry_in)
+                self.state = self.HALF_OPEN
+                logger.info(f"Circuit half-open for {self.host}, probing")
+
+            if self._probe_in_flight:
+                raise CircuitOpenError(self.host, 0.0)
+            self._probe_in_flight = True
+
+    def abort(self):
+        """결과 없이 끝난 요청 (취소) - half-open 확인 요청 자리만 반환"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record(self, error: Optional[Exception] = None):
+        """요청 결과 기록 (error가 None이면 성공)"""
+        with self._lock:
+            self._probe_in_flight = False
+            if error is None or not is_host_failure(error):
+                if self.state != self.CLOSED:
+                    logger.info(f"Circuit closed for {self.host}")
+                self.state = self.CLOSED
+                self._failures = 0
+                return
+
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        f"Circuit opened for {self.host} after {self._failures} failures "
+                        f"({type(error).__name__}), failing fast for {self.recovery_timeout}s"
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+def is_host_failure(error: Exception) -> bool:
+    """호스트 장애로 볼 실패인지 (연결 실패, 타임아웃, 5xx)"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return False
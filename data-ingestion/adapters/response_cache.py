@@ -0,0 +1,214 @@
+"""
+공공데이터 API 응답 캐시
+
+BasePublicDataAdapter.make_request가 get_cache_key/get_cache_ttl 기준으로 사용하는
+교체 가능한 응답 캐시입니다.
+- RedisResponseCache: 여러 프로세스/컨테이너가 공유 (REDIS_URL)
+- DiskResponseCache: 로컬 디렉터리에 JSON 파일로 저장
+
+TTL이 지난 항목도 STALE_RETENTION_SECONDS 동안 보관하여, 응답에 ETag/Last-Modified가
+있었다면 조건부 요청(If-None-Match/If-Modified-Since)으로 재검증합니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# TTL 만료 후 재검증용으로 항목을 더 보관하는 기간 (초)
+STALE_RETENTION_SECONDS = int(os.getenv("RESPONSE_CACHE_STALE_SECONDS", str(7 * 86400)))
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 API 응답"""
+    body: Any
+    stored_at: float
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """TTL 이내 여부"""
+        return (now or time.time()) < self.expires_at
+
+    def can_revalidate(self) -> bool:
+        """조건부 요청으로 재검증 가능 여부"""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """재검증 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CachedResponse":
+        return cls(**json.loads(raw))
+
+
+class ResponseCache(ABC):
+    """응답 캐시 백엔드 인터페이스"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시 항목 조회 (만료되었지만 재검증용으로 보관 중인 항목 포함)"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CachedResponse):
+        """캐시 항목 저장 (보관 기간: TTL + STALE_RETENTION_SECONDS)"""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        """캐시 항목 삭제"""
+        pass
+
+    @staticmethod
+    def retention_seconds(entry: CachedResponse) -> int:
+        """항목 보관 기간 (재검증 불가 항목은 TTL까지만)"""
+        remaining = max(1, int(entry.expires_at - time.time()))
+        if entry.can_revalidate():
+            return remaining + STALE_RETENTION_SECONDS
+        return remaining
+
+
+class RedisResponseCache(ResponseCache):
+    """Redis 백엔드"""
+
+    def __init__(self, url: str, prefix: str = "ingestion:"):
+        """
+        Args:
+            url: Redis URL (예: redis://redis:6379)
+            prefix: 키 접두사
+        """
+        import redis  # 선택 의존성
+
+        self.client = redis.Redis.from_url(url, socket_timeout=2, socket_connect_timeout=2)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        return CachedResponse.from_json(raw.decode("utf-8"))
+
+    def set(self, key: str, entry: CachedResponse):
+        self.client.set(self.prefix + key, entry.to_json(), ex=self.retention_seconds(entry))
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+
+class DiskResponseCache(ResponseCache):
+    """로컬 디스크 백엔드 (키당 JSON 파일 하나, 원자적 교체 저장)"""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: 캐시 디렉터리
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if time.time() > stored.get("retain_until", 0):
+            self.delete(key)
+            return None
+        return CachedResponse(**stored["entry"])
+
+    def set(self, key: str, entry: CachedResponse):
+        stored = {
+            "key": key,
+            "retain_until": time.time() + self.retention_seconds(entry),
+            "entry": asdict(entry),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(stored, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+
+def create_response_cache_from_env() -> Optional[ResponseCache]:
+    """
+    환경변수로 캐시 백엔드 생성
+
+    RESPONSE_CACHE_BACKEND:
+    - redis: REDIS_URL 사용 (연결 실패 시 disk로 대체)
+    - disk: RESPONSE_CACHE_DIR (기본 .cache/public_data)
+    - none: 캐시 사용 안 함
+    미설정 시 REDIS_URL이 있으면 redis, 없으면 disk
+    """
+    redis_url = os.getenv("REDIS_URL")
+    backend = os.getenv("RESPONSE_CACHE_BACKEND", "redis" if redis_url else "disk").lower()
+
+    if backend == "none":
+        return None
+
+    if backend == "redis":
+        try:
+            cache = RedisResponseCache(redis_url or "redis://localhost:6379")
+            cache.client.ping()
+            logger.info("Response cache: redis")
+            return cache
+        except Exception as e:
+            logger.warning(f"Redis response cache unavailable, falling back to disk: {e}")
+
+    directory = os.getenv("RESPONSE_CACHE_DIR", os.path.join(".cache", "public_data"))
+    logger.info(f"Response cache: disk ({directory})")
+    return DiskResponseCache(directory)
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_loaded = False
+_default_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """프로세스 공용 응답 캐시 (최초 호출 시 환경변수로 생성, 비활성화 시 None)"""
+    global _default_cache, _default_cache_loaded
+    with _default_lock:
+        if not _default_cache_loaded:
+            _default_cache = create_response_cache_from_env()
+            _default_cache_loaded = True
+        return _default_cache
@@ -4,7 +4,11 @@ API 재시도 전략
 API 호출 실패 시 재시도 로직을 제공합니다.
 """
 import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
+import httpx
 import requests
 
 logger = logging.getLogger(__name__)
@@ -13,38 +17,49 @@ logger = logging.getLogger(__name__)
 class RetryStrategy:
     """API 재시도 전략 클래스
     
-    Exponential backoff와 Rate limit 처리를 포함한 재시도 로직을 제공합니다.
+    Full-jitter exponential backoff와 Rate limit 처리를 포함한 재시도 로직을 제공합니다.
     """
     
+    # backoff 기준 시간 / 최대 대기 시간 (초)
+    BACKOFF_BASE_SECONDS = 1.0
+    BACKOFF_CAP_SECONDS = 30.0
+    
+    # Retry-After로 기다리는 최대 시간 (초) - 넘으면 이 값까지만 대기
+    MAX_RETRY_AFTER_SECONDS = 300.0
+    
+    # 호출 측이 시도 횟수를 정하지 않을 때의 최대 시도 횟수
+    DEFAULT_MAX_ATTEMPTS = 3
+    
     @staticmethod
-    def should_retry(error: Exception, attempt: int) -> bool:
+    def should_retry(error: Exception, attempt: int, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> bool:
         """재시도 여부 판단
         
         Args:
             error: 발생한 예외
             attempt: 현재 시도 횟수 (1부터 시작)
+            max_attempts: 최대 시도 횟수 (HttpTransport는 요청별 max_retries를 넘김)
             
         Returns:
             bool: 재시도 여부
         """
         # 최대 재시도 횟수 초과
-        if attempt >= 3:
+        if attempt >= max_attempts:
             logger.debug(f"최대 재시도 횟수 초과: {attempt}회")
             return False
         
         # Timeout 에러는 재시도
-        if isinstance(error, (requests.Timeout, TimeoutError)):
+        if isinstance(error, (requests.Timeout, httpx.TimeoutException, TimeoutError)):
             logger.debug("Timeout 에러 - 재시도")
             return True
         
-        # Connection 에러는 재시도
-        if isinstance(error, requests.ConnectionError):
+        # Connection 에러는 재시도 (httpx는 연결 끊김/프로토콜 오류 포함)
+        if isinstance(error, (requests.ConnectionError, httpx.TransportError)):
             logger.debug("Connection 에러 - 재시도")
             return True
         
         # HTTP 에러 처리
-        if isinstance(error, requests.HTTPError):
-            status_code = error.response.status_code
+        status_code = RetryStrategy._get_status_code(error)
+        if status_code is not None:
             
             # 5xx 서버 에러는 재시도
             if 500 <= status_code < 600:
@@ -71,62 +86,91 @@ class RetryStrategy:
         return False
     
     @staticmethod
-    def get_delay(attempt: int, error: Exception) -> int:
+    def get_delay(attempt: int, error: Exception) -> float:
         """재시도 대기 시간 계산
         
-        Exponential backoff 전략을 사용합니다:
-        - 1차 시도 실패: 1초 대기
-        - 2차 시도 실패: 2초 대기
-        - 3차 시도 실패: 4초 대기
+        Full-jitter exponential backoff 전략을 사용합니다:
+        0 ~ min(CAP, BASE * 2^(attempt-1)) 사이의 임의 시간
+        - 1차 시도 실패: 0~1초 대기
+        - 2차 시도 실패: 0~2초 대기
+        - 3차 시도 실패: 0~4초 대기
+        여러 워커가 동시에 실패해도 재시도 시점이 흩어져 서버에 몰리지 않습니다.
         
-        Rate Limit의 경우 Retry-After 헤더를 우선 사용합니다.
+        429/503 응답에 Retry-After 헤더가 있으면 그 값을 우선 사용합니다.
         
         Args:
             attempt: 현재 시도 횟수 (1부터 시작)
             error: 발생한 예외
             
         Returns:
-            int: 대기 시간 (초)
+            float: 대기 시간 (초)
         """
-        # Rate Limit의 경우 Retry-After 헤더 확인
-        if isinstance(error, requests.HTTPError):
-            if error.response.status_code == 429:
-                retry_after = RetryStrategy._get_retry_after(error)
-                if retry_after:
-                    logger.debug(f"Retry-After 헤더 사용: {retry_after}초")
-                    return retry_after
-        
-        # Exponential backoff: 2^(attempt-1) 초
-        # attempt=1 -> 1초, attempt=2 -> 2초, attempt=3 -> 4초
-        delay = 2 ** (attempt - 1)
-        logger.debug(f"Exponential backoff: {delay}초 (시도 {attempt}회)")
+        # Rate Limit/점검 응답의 경우 Retry-After 헤더 확인
+        retry_after = RetryStrategy.get_retry_after(error)
+        if retry_after is not None:
+            logger.debug(f"Retry-After 헤더 사용: {retry_after:.1f}초")
+            return retry_after
+        
+        ceiling = min(
+            RetryStrategy.BACKOFF_CAP_SECONDS,
+            RetryStrategy.BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)
+        )
+        delay = random.uniform(0, ceiling)
+        logger.debug(f"Full-jitter backoff: {delay:.2f}초 (최대 {ceiling}초, 시도 {attempt}회)")
         return delay
     
     @staticmethod
-    def _get_retry_after(error: requests.HTTPError) -> Optional[int]:
-        """Retry-After 헤더 값 추출
+    def _get_status_code(error: Exception) -> Optional[int]:
+        """HTTP 상태 코드 추출 (requests/httpx 공통, HTTP 에러가 아니면 None)
         
         Args:
-            error: HTTP 에러
+            error: 발생한 예외
             
         Returns:
-            Optional[int]: Retry-After 값 (초), 없으면 None
+            Optional[int]: 상태 코드
         """
-        try:
-            retry_after = error.response.headers.get('Retry-After')
-            if retry_after:
-                # 숫자 형식 (초)
-                if retry_after.isdigit():
-                    return int(retry_after)
-                
-                # HTTP-date 형식은 지원하지 않음 (복잡도 증가)
-                logger.warning(f"Retry-After HTTP-date 형식은 지원하지 않음: {retry_after}")
-                return None
-        except Exception as e:
-            logger.warning(f"Retry-After 헤더 파싱 실패: {e}")
+        if isinstance(error, (requests.HTTPError, httpx.HTTPStatusError)):
+            response = getattr(error, 'response', None)
+            if response is not None:
+                return response.status_code
+        return None
+    
+    @staticmethod
+    def get_retry_after(error: Exception) -> Optional[float]:
+        """429/503 응답의 Retry-After 헤더 값 추출
+        
+        초 단위 숫자와 HTTP-date(예: Wed, 21 Oct 2026 07:28:00 GMT) 형식을 모두 지원하며
+        MAX_RETRY_AFTER_SECONDS를 넘으면 그 값으로 제한합니다.
+        
+        Args:
+            error: HTTP 에러 (requests.HTTPError 또는 httpx.HTTPStatusError)
+            
+        Returns:
+            Optional[float]: Retry-After 값 (초), 없거나 해석할 수 없으면 None
+        """
+        if RetryStrategy._get_status_code(error) not in (429, 503):
             return None
         
-        return None
+        retry_after = error.response.headers.get('Retry-After')
+        if not retry_after:
+            return None
+        retry_after = retry_after.strip()
+        
+        # 숫자 형식 (초)
+        if retry_after.isdigit():
+            seconds = float(retry_after)
+        else:
+            # HTTP-date 형식
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                logger.warning(f"Retry-After 헤더 파싱 실패: {retry_after}")
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        
+        return min(seconds, RetryStrategy.MAX_RETRY_AFTER_SECONDS)
     
     @staticmethod
     def log_retry_attempt(
@@ -134,7 +178,7 @@ class RetryStrategy:
         attempt: int,
         max_retries: int,
         error: Exception,
-        delay: int
+        delay: float
     ):
         """재시도 로그 기록
         
@@ -153,7 +197,7 @@ class RetryStrategy:
                 'max_retries': max_retries,
                 'error_type': type(error).__name__,
                 'error_message': str(error),
-                'delay': delay
+                'delay': round(delay, 2)
             }
         )
     
@@ -0,0 +1,191 @@
+"""
+수량/단위 파서와 단가 변환
+
+시장마다 규격 표기가 다른 가격("10kg", "500g", "3마리", "1상자", "box")을 비교할 수 있도록
+수량과 단위를 분리하고, 가능한 경우 kg당/마리당 가격으로 변환합니다.
+- 어댑터: parse_unit(text).label로 수량을 보존한 표준 표기(예: "10kg", "3마리")를 넘김
+- DataNormalizer: convert_prices()로 배치 단위 단가 변환 (고유 표기만 한 번씩 파싱)
+
+상자는 중량을 알 수 없으므로 kg으로 바꾸지 않고 상자당 가격으로만 변환합니다.
+
+정규식과 별칭 표는 모듈 로드 시 한 번만 만들고, 파싱 결과는 표기별로 캐시합니다.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# 표준 단위
+KG = "kg"
+PIECE = "마리"
+BOX = "상자"
+
+# 단위 표기 → (표준 단위, 표준 단위로의 배율)
+UNIT_ALIASES = {
+    "kg": (KG, 1.0),
+    "kilogram": (KG, 1.0),
+    "kilo": (KG, 1.0),
+    "킬로그램": (KG, 1.0),
+    "킬로": (KG, 1.0),
+    "g": (KG, 0.001),
+    "gram": (KG, 0.001),
+    "그램": (KG, 0.001),
+    "마리": (PIECE, 1.0),
+    "미": (PIECE, 1.0),
+    "ea": (PIECE, 1.0),
+    "each": (PIECE, 1.0),
+    "pcs": (PIECE, 1.0),
+    "개": (PIECE, 1.0),
+    "상자": (BOX, 1.0),
+    "박스": (BOX, 1.0),
+    "box": (BOX, 1.0),
+}
+
+_ALIAS_PATTERN = "|".join(sorted((re.escape(alias) for alias in UNIT_ALIASES), key=len, reverse=True))
+
+# 수량 + 단위 (예: "10kg", "0.5 kg", "3마리", "1,000g") - 단위 뒤에 영문자가 이어지면 제외 (예: "gram"의 "g")
+_QUANTITY_RE = re.compile(
+    rf"(?P<qty>\d+(?:[.,]\d+)*)\s*(?P<unit>{_ALIAS_PATTERN})(?![a-z])"
+)
+# 수량 없는 단위 (예: "kg", "상자") - 다른 단어의 일부일 수 있는 한 글자 표기(g, 미, 개)는 수량이 있을 때만 인정
+_BARE_ALIAS_PATTERN = "|".join(
+    sorted((re.escape(alias) for alias in UNIT_ALIASES if len(alias) > 1), key=len, reverse=True)
+)
+_UNIT_RE = re.compile(rf"(?<![a-z])(?P<unit>{_BARE_ALIAS_PATTERN})(?![a-z])")
+
+# 저장 가능한 단위 표기 최대 길이 (market_prices.unit VARCHAR(20))
+MAX_UNIT_LENGTH = 20
+
+# 표기 파싱 결과 캐시 크기 (고유 표기 수는 시장 전체에서도 수백 개 수준)
+PARSE_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class ParsedUnit:
+    """파싱된 규격
+
+    Attributes:
+        quantity: 표기된 수량 (표준 단위 기준, 예: "500g" → 0.5)
+        unit: 표준 단위 (kg / 마리 / 상자, 알 수 없으면 원본 표기)
+        known: 알려진 단위인지
+    """
+    quantity: float
+    unit: str
+    known: bool = True
+
+    @property
+    def convertible(self) -> bool:
+        """표준 단위당(kg당/마리당/상자당) 가격으로 변환 가능한지"""
+        return self.known and self.quantity > 0
+
+    @property
+    def label(self) -> str:
+        """수량을 보존한 표준 표기 (예: "10kg", "0.5kg", "3마리", "상자")"""
+        if not self.known or self.quantity == 1:
+            return self.unit
+        return f"{self.quantity:g}{self.unit}"
+
+    def unit_price(self, price: float) -> Tuple[float, str]:
+        """
+        표기 수량당 가격을 표준 단위당 가격으로 변환
+
+        Returns:
+            (단가, 단위) - 변환할 수 없으면 (원래 가격, 표준 단위)
+        """
+        if not self.convertible or self.quantity == 1:
+            return price, self.unit
+        return round(price / self.quantity, 2), self.unit
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_unit(text: Optional[str], default: str = KG) -> ParsedUnit:
+    """
+    규격 표기에서 수량과 단위 추출
+
+    1. 중량 표기(kg/g)가 있으면 중량 우선 (예: "10kg 상자" → 10kg)
+    2. 마리/개 수 표기 (예: "3마리", "5미")
+    3. 상자 등 수량만 있는 포장 단위
+    4. 알 수 없는 표기는 원본을 단위로 유지 (비어 있으면 default)
+
+    Args:
+        text: 규격/단위 표기
+        default: 비어 있을 때 사용할 표준 단위
+
+    Returns:
+        ParsedUnit
+    """
+    if not text or not text.strip():
+        return ParsedUnit(1.0, default)
+
+    normalized = text.strip().lower()
+    if normalized in UNIT_ALIASES:
+        unit, factor = UNIT_ALIASES[normalized]
+        return ParsedUnit(factor, unit)
+
+    matches = [
+        (UNIT_ALIASES[match.group("unit")], _parse_quantity(match.group("qty")))
+        for match in _QUANTITY_RE.finditer(normalized)
+    ]
+    for preferred in (KG, PIECE, BOX):
+        for (unit, factor), quantity in matches:
+            if unit == preferred and quantity is not None:
+                return ParsedUnit(quantity * factor, unit)
+
+    match = _UNIT_RE.search(normalized)
+    if match:
+        unit, factor = UNIT_ALIASES[match.group("unit")]
+        return ParsedUnit(factor, unit)
+
+    return ParsedUnit(1.0, text.strip()[:MAX_UNIT_LENGTH], known=False)
+
+
+def normalize_unit(text: Optional[str], default: str = KG) -> str:
+    """규격 표기를 수량을 보존한 표준 표기로 변환 (예: "10 KG" → "10kg", "box" → "상자")"""
+    return parse_unit(text, default).label
+
+
+def convert_prices(
+    prices: Sequence[float],
+    units: Sequence[Optional[str]]
+) -> Tuple[List[float], List[str]]:
+    """
+    가격 배치를 표준 단위당 가격으로 변환
+
+    고유한 단위 표기만 한 번씩 파싱하고 결과를 모든 행에 적용합니다.
+
+    Args:
+        prices: 표기 수량당 가격
+        units: 규격 표기 (prices와 같은 길이)
+
+    Returns:
+        (단가 리스트, 표준 단위 리스트)
+    """
+    parsed = {text: parse_unit(text) for text in set(units)}
+    converted_prices: List[float] = []
+    converted_units: List[str] = []
+    for price, text in zip(prices, units):
+        unit_price, unit = parsed[text].unit_price(price)
+        converted_prices.append(unit_price)
+        converted_units.append(unit)
+    return converted_prices, converted_units
+
+
+def parse_units(units: Iterable[Optional[str]]) -> List[ParsedUnit]:
+    """규격 표기 배치 파싱 (고유 표기만 한 번씩 파싱)"""
+    units = list(units)
+    parsed = {text: parse_unit(text) for text in set(units)}
+    return [parsed[text] for text in units]
+
+
+def _parse_quantity(raw: str) -> Optional[float]:
+    """수량 문자열 → float ("1,000" → 1000, "0.5" → 0.5, "1,5" → 1.5)"""
+    if "," in raw and "." not in raw:
+        head, _, tail = raw.rpartition(",")
+        raw = raw.replace(",", "") if len(tail) == 3 else f"{head.replace(',', '')}.{tail}"
+    else:
+        raw = raw.replace(",", "")
+    try:
+        quantity = float(raw)
+    except ValueError:
+        return None
+    return quantity if quantity > 0 else None
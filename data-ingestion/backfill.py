@@ -0,0 +1,447 @@
+"""
+과거 데이터 백필 CLI
+
+지정한 기간의 시장 데이터를 어댑터별로 수집하여 저장합니다.
+- 소스(어댑터)별 동시 요청 수와 초당 요청 수 제한
+- 저장까지 끝난 (어댑터, 수집일)을 가격/격리/실패 행과 같은 트랜잭션으로
+  backfill_checkpoints 테이블에 기록하여 중단 후 다시 실행하면 남은 날짜부터 이어서 수집
+- 수집 스레드 → 제한된 크기의 큐 → 저장 스레드로 흘려보내며 batch_size 행마다
+  저장하므로 기간이 길어도 메모리 사용량이 일정
+- 수집 → 정규화 → 저장을 행 객체 대신 컬럼 배치(adapters.price_batch)로 넘기고,
+  PostgreSQL에는 COPY로 적재 (PriceRepository.copy_upsert)
+- 수집일 이전 가격 분포에서 크게 벗어난 가격은 저장하지 않고 격리 (outliers.OutlierDetector)
+- 파싱/정규화에 실패한 행은 ingestion_dead_letters 테이블에 저장 (replay.py로 재처리)
+- 모든 저장이 끝난 뒤(중단 포함) 삽입/갱신된 키로 post-commit 훅을 한 번 실행 (hooks.py)
+
+사용 예:
+    python backfill.py --start 2023-01-01 --end 2023-12-31
+    python backfill.py --start 2024-01-01 --end 2024-06-30 --adapters garak --concurrency 8 --rate 4
+"""
+import argparse
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional, Sequence
+
+from dotenv import load_dotenv
+
+from adapters.dead_letters import DeadLetter, collect_dead_letters
+from adapters.price_batch import NormalizedPriceBatch, RawPriceBatch, fetch_price_batch
+from hooks import PostCommitHook, run_hooks
+from pipeline import IngestionPipeline
+
+load_dotenv()
+
+logger = logging.getLogger("backfill")
+
+# 소스별 동시 요청 수
+CONCURRENCY_PER_SOURCE = int(os.getenv("BACKFILL_CONCURRENCY_PER_SOURCE", "4"))
+
+# 소스별 초당 요청 수 (0 이하면 제한 없음)
+RATE_PER_SOURCE = float(os.getenv("BACKFILL_RATE_PER_SOURCE", "2"))
+
+# 한 번에 저장할 최대 행 수
+BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "5000"))
+
+# 저장을 기다리는 수집 결과(일 단위) 최대 개수 - 저장이 밀리면 수집 스레드가 대기
+QUEUE_SIZE = 64
+
+
+class SourceThrottle:
+    """소스별 요청 간격 제한 (여러 수집 스레드가 공유)"""
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: 초당 요청 수 (0 이하면 제한 없음)
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self, stop_event: threading.Event):
+        """다음 요청 시각까지 대기 (중단 요청 시 즉시 반환)"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            stop_event.wait(slot - now)
+
+
+@dataclass
+class FetchedDay:
+    """수집 스레드가 저장 스레드로 넘기는 하루치 결과"""
+    adapter_name: str
+    market_id: int
+    target_date: date
+    batch: Optional[RawPriceBatch] = None
+    error: Optional[str] = None
+    dead_letters: List[DeadLetter] = field(default_factory=list)
+
+
+def adapter_key(adapter) -> str:
+    """CLI에서 쓰는 어댑터 이름 (GarakAdapter -> garak)"""
+    return adapter.__class__.__name__.replace("Adapter", "").lower()
+
+
+def date_range(start: date, end: date) -> List[date]:
+    """start부터 end까지 (end 포함)"""
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+class BackfillRunner:
+    """기간 백필 실행기"""
+
+    def __init__(
+        self,
+        adapters: List,
+        pipeline_factory: Callable[[], IngestionPipeline],
+        concurrency: int = CONCURRENCY_PER_SOURCE,
+        rate: float = RATE_PER_SOURCE,
+        batch_size: int = BATCH_SIZE,
+        hooks: Sequence[PostCommitHook] = ()
+    ):
+        """
+        Args:
+            adapters: 백필할 MarketAdapter 리스트
+            pipeline_factory: IngestionPipeline 생성 함수 (저장 스레드가 하나 사용)
+            concurrency: 소스별 동시 요청 수
+            rate: 소스별 초당 요청 수
+            batch_size: 한 번에 저장할 최대 행 수
+            hooks: 백필이 끝난 뒤 바뀐 키로 실행할 post-commit 훅
+        """
+        self.adapters = adapters
+        self.pipeline_factory = pipeline_factory
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.batch_size = max(1, batch_size)
+        self.hooks = list(hooks)
+
+        self._stop = threading.Event()
+        self._queue: "queue.Queue[FetchedDay]" = queue.Queue(maxsize=QUEUE_SIZE)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+        # 저장 대기 중인 정규화 행과 (어댑터, 수집일, 행 수)
+        self._buffer: List[NormalizedPriceBatch] = []
+        self._buffered_rows = 0
+        self._buffered_days: List[tuple] = []
+        self._quarantined: List[dict] = []
+        self._released: List[int] = []
+        self._dead_letters: List[tuple] = []
+        self._row_counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        # 저장(격리 해제 포함)으로 삽입/갱신된 (item_id, market_id, date) - 백필이 끝난 뒤 훅에 한 번 넘김
+        self._touched_keys: set = set()
+
+    def run(self, start: date, end: date, resume: bool = True) -> dict:
+        """
+        백필 실행
+
+        Args:
+            start: 시작일
+            end: 종료일 (포함)
+            resume: True면 체크포인트에 있는 날짜는 건너뜀
+
+        Returns:
+            어댑터별 계획/완료/실패 일수와 행 수 요약
+        """
+        from app.database.backfill_checkpoint_repository import BackfillCheckpointRepository
+
+        started = time.perf_counter()
+        pipeline = self.pipeline_factory()
+        checkpoints = BackfillCheckpointRepository(pipeline.session)
+        stats = {}
+        executors = []
+
+        try:
+            # 1. 어댑터별 남은 날짜 계산 및 수집 시작
+            for adapter in self.adapters:
+                name = adapter.__class__.__name__
+                days = date_range(start, end)
+                done = checkpoints.get_completed_dates(name, start, end) if resume else set()
+                todo = [day for day in days if day not in done]
+                stats[name] = _new_stats(len(days), len(done), len(todo))
+                logger.info(f"{name}: {len(todo)} days to fetch ({len(done)} already checkpointed)")
+                if todo:
+                    executors.append(self._start_source(adapter, todo))
+
+            # 2. 수집 결과를 받아 정규화/저장
+            self._write_loop(pipeline, checkpoints, stats)
+
+        except KeyboardInterrupt:
+            logger.warning("Interrupted - stopping fetchers and flushing fetched days")
+            self._stop.set()
+            self._write_loop(pipeline, checkpoints, stats)
+
+        finally:
+            self._stop.set()
+            for executor in executors:
+                executor.shutdown(wait=False, cancel_futures=True)
+            pipeline.close()
+
+        # 3. 저장이 끝난 뒤 바뀐 키로 post-commit 훅 실행
+        hook_results = self._run_hooks()
+
+        summary = {
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'wall_seconds': round(time.perf_counter() - started, 3),
+            'interrupted': any(s['completed'] + s['failed'] < s['to_fetch'] for s in stats.values()),
+            'rows': dict(self._row_counts),
+            'adapters': stats,
+            'hooks': hook_results,
+        }
+        _log_summary(summary)
+        return summary
+
+    def _run_hooks(self) -> List[dict]:
+        """
+        백필 중 바뀐 키로 post-commit 훅 실행 (바뀐 행이 없으면 실행하지 않음)
+
+        훅은 전용 세션 하나에서 차례로 실행하며, 실패는 훅 결과에만 기록합니다.
+        """
+        if not self.hooks or not self._touched_keys:
+            return []
+        pipeline = None
+        try:
+            pipeline = self.pipeline_factory()
+            return run_hooks(pipeline.session, self.hooks, self._touched_keys)
+        except Exception as e:
+            logger.warning(f"Failed to run post-commit hooks: {e}")
+            return []
+        finally:
+            if pipeline is not None:
+                pipeline.close()
+
+    def _start_source(self, adapter, days: List[date]) -> ThreadPoolExecutor:
+        """소스 하나의 날짜별 수집 작업 등록 (소스별 스레드풀 + 요청 간격 제한)"""
+        throttle = SourceThrottle(self.rate)
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix=f"backfill-{adapter_key(adapter)}"
+        )
+        with self._pending_lock:
+            self._pending += len(days)
+        for day in days:
+            future = executor.submit(self._fetch_day, adapter, day, throttle)
+            future.add_done_callback(self._task_done)
+        return executor
+
+    def _task_done(self, _future):
+        with self._pending_lock:
+            self._pending -= 1
+
+    def _fetch_day(self, adapter, day: date, throttle: SourceThrottle):
+        """하루치 수집 (수집 스레드) - 결과는 큐로 전달, 큐가 차면 대기"""
+        if self._stop.is_set():
+            return
+        throttle.wait(self._stop)
+        if self._stop.is_set():
+            return
+
+        fetched = FetchedDay(adapter.__class__.__name__, adapter.get_market_id(), day)
+        try:
+            with collect_dead_letters() as parse_failures:
+                fetched.batch = fetch_price_batch(adapter, datetime.combine(day, datetime.min.time()))
+            fetched.dead_letters = parse_failures.letters
+        except Exception as e:
+            fetched.error = str(e)
+
+        while not self._stop.is_set():
+            try:
+                self._queue.put(fetched, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _fetchers_running(self) -> bool:
+        with self._pending_lock:
+            return self._pending > 0
+
+    def _write_loop(self, pipeline: IngestionPipeline, checkpoints, stats: dict):
+        """
+        저장 루프 (메인 스레드)
+
+        정규화하고 이상치 검사를 통과한 배치를 batch_size 행까지 모았다가 copy_upsert로 저장하고
+        (이상치는 price_quarantine, 파싱/정규화 실패 행은 ingestion_dead_letters에 기록),
+        저장이 커밋된 날짜만 체크포인트에 기록합니다.
+        빈 날짜(휴장일)도 완료로 기록합니다.
+        """
+        while self._fetchers_running() or not self._queue.empty():
+            try:
+                fetched = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            adapter_stats = stats[fetched.adapter_name]
+            if fetched.error is not None:
+                adapter_stats['failed'] += 1
+                logger.error(f"✗ {fetched.adapter_name} {fetched.target_date}: {fetched.error}")
+                continue
+
+            dead_letters = fetched.dead_letters
+            if fetched.batch is not None and len(fetched.batch):
+                with collect_dead_letters() as normalize_failures:
+                    normalized = pipeline.normalizer.normalize_batch(fetched.batch, fetched.market_id)
+                dead_letters = dead_letters + normalize_failures.letters
+                normalized, quarantined = pipeline.outlier_detector.split_batch(normalized)
+                self._released.extend(pipeline.outlier_detector.release_ids)
+            else:
+                normalized, quarantined = NormalizedPriceBatch.empty(), []
+            adapter_stats['fetched_records'] += len(fetched.batch) if fetched.batch is not None else 0
+            adapter_stats['normalized_records'] += len(normalized)
+            adapter_stats['quarantined_records'] += len(quarantined)
+            adapter_stats['dead_letter_records'] += len(dead_letters)
+            self._quarantined.extend(quarantined)
+            if dead_letters:
+                self._dead_letters.append((fetched.adapter_name, fetched.target_date, dead_letters))
+            self._buffer.append(normalized)
+            self._buffered_rows += len(normalized)
+            self._buffered_days.append((fetched.adapter_name, fetched.target_date, len(normalized)))
+
+            if self._buffered_rows >= self.batch_size:
+                self._flush(pipeline, checkpoints, stats)
+
+        if self._buffered_days:
+            self._flush(pipeline, checkpoints, stats)
+
+    def _flush(self, pipeline: IngestionPipeline, checkpoints, stats: dict):
+        """
+        버퍼 저장 후 해당 날짜들을 체크포인트에 기록
+
+        격리/해제, 실패 행, 가격, 체크포인트를 한 트랜잭션으로 커밋하므로 중간에 실패하면
+        아무것도 남지 않고 체크포인트도 기록되지 않아 다음 실행에서 그 날짜들을 다시 수집
+        """
+        batch = NormalizedPriceBatch.concat(self._buffer)
+        days, quarantined, released, dead_letters = (
+            self._buffered_days, self._quarantined, self._released, self._dead_letters
+        )
+        self._buffer, self._buffered_days, self._buffered_rows = [], [], 0
+        self._quarantined, self._released, self._dead_letters = [], [], []
+
+        stage_start = time.perf_counter()
+        touched_keys: set = set()
+        try:
+            pipeline.quarantine_repository.quarantine(quarantined, commit=False)
+            pipeline.quarantine_repository.release(released, changed_keys=touched_keys, commit=False)
+            for adapter_name, target_date, letters in dead_letters:
+                pipeline.dead_letter_repository.record(
+                    adapter_name, target_date, [asdict(letter) for letter in letters], commit=False
+                )
+            if len(batch):
+                row_counts = pipeline.repository.copy_upsert(
+                    batch.iter_rows(), changed_keys=touched_keys, commit=False
+                )
+            else:
+                row_counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+            checkpoints.mark_completed(days, commit=False)
+            pipeline.session.commit()
+        except Exception:
+            pipeline.session.rollback()
+            raise
+        # 커밋된 키만 post-commit 훅 대상
+        self._touched_keys |= touched_keys
+
+        for name, count in row_counts.items():
+            self._row_counts[name] += count
+        for adapter_name, _day, _count in days:
+            stats[adapter_name]['completed'] += 1
+
+        logger.info(
+            f"Flushed {len(days)} days / {len(batch)} rows in {time.perf_counter() - stage_start:.2f}s "
+            f"({row_counts['inserted']} inserted, {row_counts['updated']} updated, "
+            f"{row_counts['unchanged']} unchanged)"
+        )
+
+
+def _new_stats(planned: int, checkpointed: int, to_fetch: int) -> dict:
+    return {
+        'planned': planned,
+        'checkpointed': checkpointed,
+        'to_fetch': to_fetch,
+        'completed': 0,
+        'failed': 0,
+        'fetched_records': 0,
+        'normalized_records': 0,
+        'quarantined_records': 0,
+        'dead_letter_records': 0,
+    }
+
+
+def _log_summary(summary: dict):
+    """백필 결과 요약 로그"""
+    logger.info("-" * 60)
+    logger.info(f"Backfill Summary: {summary['start']} ~ {summary['end']} in {summary['wall_seconds']}s")
+    for name, stats in summary['adapters'].items():
+        logger.info(
+            f"  {name}: {stats['completed']}/{stats['to_fetch']} days completed, "
+            f"{stats['failed']} failed, {stats['checkpointed']} skipped (checkpointed), "
+            f"{stats['normalized_records']} records, {stats['quarantined_records']} quarantined, "
+            f"{stats['dead_letter_records']} dead-lettered"
+        )
+    rows = summary['rows']
+    logger.info(f"  Rows: {rows['inserted']} inserted, {rows['updated']} updated, {rows['unchanged']} unchanged")
+    for hook in summary['hooks']:
+        logger.info(f"  Hook {hook['hook']}: {hook['status']} in {hook['seconds']}s ({hook['affected']} affected)")
+    if summary['interrupted']:
+        logger.info("  Interrupted - run the same command again to resume")
+    logger.info("-" * 60)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="과거 시장 데이터 백필")
+    parser.add_argument("--start", required=True, type=date.fromisoformat, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="종료일 (YYYY-MM-DD, 포함, 기본: 오늘)")
+    parser.add_argument("--adapters", help="백필할 어댑터 (쉼표 구분, 예: garak,noryangjin / 기본: 설정된 전체)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY_PER_SOURCE, help="소스별 동시 요청 수")
+    parser.add_argument("--rate", type=float, default=RATE_PER_SOURCE, help="소스별 초당 요청 수 (0: 제한 없음)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="한 번에 저장할 최대 행 수")
+    parser.add_argument("--no-resume", action="store_true", help="체크포인트를 무시하고 전체 기간 다시 수집")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """백필 실행"""
+    from hooks import build_hooks
+    from scheduler import initialize_components
+
+    args = parse_args(argv)
+    if args.start > args.end:
+        logger.error("--start must not be after --end")
+        return 2
+
+    adapters, pipeline_factory = initialize_components()
+    if args.adapters:
+        wanted = {name.strip().lower() for name in args.adapters.split(",") if name.strip()}
+        available = {adapter_key(adapter) for adapter in adapters}
+        unknown = wanted - available
+        if unknown:
+            logger.error(f"Unknown or unconfigured adapters: {', '.join(sorted(unknown))} (available: {', '.join(sorted(available))})")
+            return 2
+        adapters = [adapter for adapter in adapters if adapter_key(adapter) in wanted]
+
+    runner = BackfillRunner(
+        adapters,
+        pipeline_factory,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        batch_size=args.batch_size,
+        hooks=build_hooks()
+    )
+    summary = runner.run(args.start, args.end, resume=not args.no_resume)
+
+    failed = sum(stats['failed'] for stats in summary['adapters'].values())
+    return 1 if failed or summary['interrupted'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""
+Data Ingestion 벤치마크
+
+- bench_noryangjin_parser: 노량진 HTML 파서 비교 (BeautifulSoup vs 스트리밍)
+- bench_kamis_streaming: KAMIS 응답 디코딩 비교 (전체 json 디코딩 vs ijson 스트리밍)
+"""
@@ -0,0 +1,206 @@
+"""
+KAMIS 응답 디코딩 벤치마크
+
+로컬 HTTP 서버로 합성 KAMIS 응답을 크기별로 제공하고, 기존 방식(fetch_data - 본문 전체를
+json으로 디코딩)과 스트리밍 방식(iter_data - ijson으로 받는 대로 디코딩)의 소요 시간과
+최대 메모리(RSS)를 비교합니다. 두 방식의 결과가 같은지도 해시로 확인합니다.
+측정마다 별도 프로세스에서 실행하므로 서로의 메모리 사용이 섞이지 않습니다.
+
+사용 예:
+    python benchmarks/bench_kamis_streaming.py
+    python benchmarks/bench_kamis_streaming.py --sizes 10000 100000 400000 --output kamis.json
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+MODES = ["list", "stream"]
+
+SPECIES = ["광어", "우럭", "참돔", "연어", "방어", "민어", "농어", "고등어", "갈치", "대게", "전복", "가리비"]
+COUNTIES = [("1101", "서울"), ("1102", "부산"), ("2100", "대구"), ("2200", "광주")]
+UNITS = ["1kg", "10마리", "1상자", "2kg"]
+
+
+def generate_response(path: str, items: int, seed: int = 42):
+    """items개 항목이 있는 합성 KAMIS 응답을 파일로 저장"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"condition": {"p_productclscode": "400"}, "data": [')
+        for index in range(items):
+            county_code, county_name = rng.choice(COUNTIES)
+            item = {
+                "item_name": f"{rng.choice(SPECIES)} {index % 97}",
+                "item_code": str(600 + index % 50),
+                "kind_name": "활",
+                "rank": rng.choice(["상품", "중품"]),
+                "unit": rng.choice(UNITS),
+                "day1": f"{rng.randint(3000, 120000):,}" if rng.random() > 0.02 else "-",
+                "countyname": county_name,
+                "countycode": county_code,
+                "regday": "2026-01-05",
+            }
+            if index:
+                f.write(",")
+            json.dump(item, f, ensure_ascii=False)
+        f.write("]}")
+
+
+def serve_file(path: str) -> ThreadingHTTPServer:
+    """모든 GET 요청에 path 파일을 청크로 보내는 로컬 서버 (백그라운드 스레드)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(os.path.getsize(path)))
+            self.end_headers()
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(64 * 1024)
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_worker(mode: str, base_url: str) -> dict:
+    """한 가지 방식으로 응답을 받아 파싱 (하위 프로세스 진입점)"""
+    os.environ["RESPONSE_CACHE_BACKEND"] = "none"
+    os.environ["HTTP_RATE_PER_HOST"] = "0"
+    from adapters.kamis_price_adapter import KamisPriceAdapter
+
+    logging.getLogger("adapters").setLevel(logging.ERROR)
+    adapter = KamisPriceAdapter(api_key="bench", base_url=base_url)
+    target_date = datetime(2026, 1, 5)
+    rss_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    hasher = hashlib.sha256()
+    count = 0
+    start = time.perf_counter()
+    if mode == "stream":
+        for row in adapter.iter_data(target_date):
+            hasher.update(repr(row).encode("utf-8"))
+            count += 1
+    else:
+        for row in adapter.fetch_data(target_date):
+            hasher.update(repr(row).encode("utf-8"))
+            count += 1
+    seconds = time.perf_counter() - start
+
+    rss_after_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    adapter.transport.close()
+    return {
+        "rows": count,
+        "output_sha256": hasher.hexdigest(),
+        "seconds": round(seconds, 4),
+        "peak_rss_mb": round(rss_after_kb / 1024, 1),
+        "fetch_rss_growth_mb": round((rss_after_kb - rss_before_kb) / 1024, 1),
+    }
+
+
+def run_mode(mode: str, base_url: str) -> dict:
+    """방식 하나를 별도 프로세스에서 실행하고 결과 수집"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", mode, "--base-url", base_url],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="KAMIS 응답 디코딩 벤치마크 (전체 디코딩 vs 스트리밍)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 300000], help="응답 항목 수 목록")
+    parser.add_argument("--seed", type=int, default=42, help="합성 응답 시드")
+    parser.add_argument("--output", help="JSON 리포트 저장 경로 (기본: stdout)")
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.base_url)))
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    cases = []
+    all_identical = True
+    for size in args.sizes:
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        server = None
+        try:
+            generate_response(path, size, args.seed)
+            server = serve_file(path)
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+            results = {}
+            for mode in MODES:
+                results[mode] = run_mode(mode, base_url)
+                logger.info(
+                    f"{size} items / {mode}: {results[mode]['rows']} rows, "
+                    f"{results[mode]['seconds']}s, peak RSS {results[mode]['peak_rss_mb']}MB"
+                )
+            response_bytes = os.path.getsize(path)
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+            os.remove(path)
+
+        identical = results["list"]["output_sha256"] == results["stream"]["output_sha256"]
+        all_identical = all_identical and identical
+        cases.append({
+            "items": size,
+            "response_bytes": response_bytes,
+            "identical_output": identical,
+            "results": results,
+        })
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "cases": cases,
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        logger.info(f"Report written to {args.output}")
+    else:
+        print(output)
+
+    if not all_identical:
+        logger.error("Outputs differ between list and stream modes")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+노량진 HTML 파서 벤치마크
+
+같은 페이지를 BeautifulSoup 파서(_parse_html)와 스트리밍 파서(iter_rows)로 파싱하여
+소요 시간과 최대 메모리(RSS)를 비교하고 두 결과가 같은지 확인합니다.
+파서마다 별도 프로세스에서 실행하므로 lxml/libxml2가 C 영역에서 쓰는 메모리까지 측정됩니다.
+
+사용 예:
+    # 저장해 둔 실제 페이지로 측정
+    python benchmarks/bench_noryangjin_parser.py --html recorded/noryangjin_20260105.html
+
+    # 합성 페이지 (행 수 지정)
+    python benchmarks/bench_noryangjin_parser.py --rows 50000 --repeat 3 --output parser.json
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+PARSERS = ["soup", "stream"]
+
+SPECIES = ["광어", "우럭", "참돔", "연어", "방어", "민어", "농어", "고등어", "갈치", "대게", "전복", "가리비"]
+ORIGINS = ["국산", "일본", "중국", "노르웨이", "러시아", "완도", "제주"]
+UNITS = ["1kg", "10마리", "1상자", "2kg", "1ea"]
+
+
+def generate_page(rows: int, seed: int = 42) -> str:
+    """price-table에 rows개 행이 있는 합성 페이지 (앞뒤로 메뉴/공지 등 다른 마크업 포함)"""
+    rng = random.Random(seed)
+    parts = [
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>노량진수산시장 시세</title></head><body>",
+        "<div class='nav'>" + "".join(f"<a href='/menu/{i}'>메뉴 {i}</a>" for i in range(200)) + "</div>",
+        "<table class='table price-table'><thead><tr><th>품목</th><th>산지</th><th>규격</th><th>가격</th></tr></thead><tbody>",
+    ]
+    for index in range(rows):
+        name = f"{rng.choice(SPECIES)}({'활' if rng.random() < 0.7 else '선어'}) {index % 97}"
+        price = f"{rng.randint(3000, 120000):,}원" if rng.random() > 0.02 else "-"
+        parts.append(
+            f"<tr class='row'><td class='name'><span>{name}</span></td><td>{rng.choice(ORIGINS)}</td>"
+            f"<td>{rng.choice(UNITS)}</td><td class='price'>{price}</td></tr>"
+        )
+    parts.append("</tbody></table>")
+    parts.append("<div class='notice'>" + "<p>공지사항</p>" * 500 + "</div></body></html>")
+    return "".join(parts)
+
+
+def run_worker(parser_name: str, html_path: str, repeat: int) -> dict:
+    """파서 하나를 현재 프로세스에서 실행 (하위 프로세스 진입점)"""
+    from adapters.noryangjin import NoryangjinAdapter
+
+    logging.getLogger("adapters.noryangjin").setLevel(logging.ERROR)
+    with open(html_path, encoding="utf-8") as f:
+        html = f.read()
+
+    adapter = NoryangjinAdapter(transport=object(), streaming=(parser_name == "stream"))
+    target_date = datetime(2026, 1, 1)
+    rss_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    timings = []
+    digest = None
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if parser_name == "stream":
+            rows = list(adapter.iter_rows(html, target_date))
+        else:
+            rows = adapter._parse_html(html, target_date)
+        timings.append(time.perf_counter() - start)
+
+        count = len(rows)
+        hasher = hashlib.sha256()
+        for row in rows:
+            hasher.update(repr(row).encode("utf-8"))
+        digest = hasher.hexdigest()
+        del rows
+
+    rss_after_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "rows": count,
+        "output_sha256": digest,
+        "seconds_best": round(min(timings), 4),
+        "seconds_mean": round(sum(timings) / len(timings), 4),
+        "peak_rss_mb": round(rss_after_kb / 1024, 1),
+        "parse_rss_growth_mb": round((rss_after_kb - rss_before_kb) / 1024, 1),
+    }
+
+
+def run_parser(parser_name: str, html_path: str, repeat: int) -> dict:
+    """파서를 별도 프로세스에서 실행하고 결과 수집"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", parser_name, "--html", html_path, "--repeat", str(repeat)],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="노량진 HTML 파서 벤치마크")
+    parser.add_argument("--html", help="저장해 둔 페이지 경로 (없으면 합성 페이지 생성)")
+    parser.add_argument("--rows", type=int, default=20000, help="합성 페이지 행 수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 페이지 시드")
+    parser.add_argument("--repeat", type=int, default=3, help="파서별 반복 횟수 (최소/평균 시간 기록)")
+    parser.add_argument("--output", help="JSON 리포트 저장 경로 (기본: stdout)")
+    parser.add_argument("--worker", choices=PARSERS, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.html, args.repeat)))
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    html_path = args.html
+    temp_path = None
+    if not html_path:
+        fd, temp_path = tempfile.mkstemp(suffix=".html")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(generate_page(args.rows, args.seed))
+        html_path = temp_path
+
+    try:
+        results = {}
+        for parser_name in PARSERS:
+            logger.info(f"Running parser: {parser_name}")
+            results[parser_name] = run_parser(parser_name, html_path, args.repeat)
+            logger.info(
+                f"{parser_name}: {results[parser_name]['rows']} rows, "
+                f"best {results[parser_name]['seconds_best']}s, "
+                f"peak RSS {results[parser_name]['peak_rss_mb']}MB"
+            )
+        page_bytes = os.path.getsize(html_path)
+    finally:
+        if temp_path:
+            os.remove(temp_path)
+
+    identical = results["soup"]["output_sha256"] == results["stream"]["output_sha256"]
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "page": {
+            "source": args.html or f"synthetic(rows={args.rows}, seed={args.seed})",
+            "bytes": page_bytes,
+        },
+        "repeat": args.repeat,
+        "identical_output": identical,
+        "speedup": round(results["soup"]["seconds_best"] / results["stream"]["seconds_best"], 2),
+        "results": results,
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        logger.info(f"Report written to {args.output}")
+    else:
+        print(output)
+
+    if not identical:
+        logger.error("Parser outputs differ")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+행 단위 vs 컬럼 배치 정규화 벤치마크
+
+같은 합성 수집 결과를 두 경로로 저장 직전 형태까지 만들고 소요 시간과 최대 메모리(RSS)를 비교합니다.
+- rows: RawPriceData 리스트 → DataNormalizer.normalize (dict 리스트) → diff_upsert 입력
+- batch: RawPriceBatch → DataNormalizer.normalize_batch → copy_upsert 입력 (iter_rows)
+경로마다 별도 프로세스에서 실행하며, 두 경로의 결과 행이 같은지 해시로 확인합니다.
+DB 조회 없이 측정하도록 품목명 매핑은 메모리 사전으로 대신합니다.
+
+사용 예:
+    python benchmarks/bench_price_batch.py --rows 1000000
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logger = logging.getLogger(__name__)
+
+MODES = ["rows", "batch"]
+
+SPECIES = ["광어", "우럭", "참돔", "연어", "방어", "민어", "농어", "고등어", "갈치", "대게", "전복", "가리비"]
+UNITS = ["kg", "1kg", "10kg", "500g", "3마리", "1상자", "box"]
+
+
+class DictAliasMatcher:
+    """품목명 → item_id 사전 매칭 (DB 없이 정규화 비용만 측정)"""
+
+    def __init__(self, names):
+        self.items = {name: index + 1 for index, name in enumerate(names)}
+
+    def match_item(self, raw_name, market_id):
+        return self.items.get(raw_name)
+
+    def match_items(self, keys):
+        return {(raw_name, market_id): self.items.get(raw_name) for raw_name, market_id in keys}
+
+
+def generate_records(rows: int, seed: int):
+    """합성 수집 결과 (품목명 1,200개, 날짜 365일, 2% 잘못된 가격, 3% 미등록 품목)"""
+    from adapters.base import RawPriceData
+
+    rng = random.Random(seed)
+    names = [f"{species}({grade}) {size}" for species in SPECIES for grade in ("활", "선어") for size in range(50)]
+    start = date(2025, 1, 1)
+    for index in range(rows):
+        name = rng.choice(names) if rng.random() > 0.03 else f"미등록{rng.randint(1, 500)}"
+        price = rng.randint(3000, 120000) if rng.random() > 0.02 else 0
+        yield RawPriceData(
+            raw_name=name,
+            price=float(price),
+            unit=rng.choice(UNITS),
+            date=datetime.combine(start + timedelta(days=index % 365), datetime.min.time()),
+            origin="국산",
+            source="benchmark",
+        )
+
+
+def run_worker(mode: str, rows: int, seed: int) -> dict:
+    """경로 하나를 현재 프로세스에서 실행 (하위 프로세스 진입점)"""
+    from adapters.price_batch import PRICE_COLUMNS, RawPriceBatch
+    from normalizer import DataNormalizer
+
+    logging.getLogger("normalizer").setLevel(logging.ERROR)
+    names = [f"{species}({grade}) {size}" for species in SPECIES for grade in ("활", "선어") for size in range(50)]
+    normalizer = DataNormalizer(DictAliasMatcher(names))
+    rss_before_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if mode == "batch":
+        batch = RawPriceBatch.from_records(generate_records(rows, seed))
+        fetched = time.perf_counter()
+        normalized = normalizer.normalize_batch(batch, market_id=1)
+        output = normalized.iter_rows()
+    else:
+        raw_data = list(generate_records(rows, seed))
+        fetched = time.perf_counter()
+        normalized = normalizer.normalize(raw_data, market_id=1)
+        output = (
+            tuple(
+                row[column].date() if column == "date" and isinstance(row[column], datetime) else row[column]
+                for column in PRICE_COLUMNS
+            )
+            for row in normalized
+        )
+
+    hasher = hashlib.sha256()
+    count = 0
+    for row in output:
+        hasher.update(repr(row).encode("utf-8"))
+        count += 1
+    finished = time.perf_counter()
+
+    rss_after_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "rows_out": count,
+        "output_sha256": hasher.hexdigest(),
+        "seconds_fetch": round(fetched - start, 3),
+        "seconds_normalize": round(finished - fetched, 3),
+        "seconds_total": round(finished - start, 3),
+        "peak_rss_mb": round(rss_after_kb / 1024, 1),
+        "rss_growth_mb": round((rss_after_kb - rss_before_kb) / 1024, 1),
+    }
+
+
+def run_mode(mode: str, rows: int, seed: int) -> dict:
+    """경로를 별도 프로세스에서 실행하고 결과 수집"""
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", mode, "--rows", str(rows), "--seed", str(seed)],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="행 단위 vs 컬럼 배치 정규화 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000000, help="수집 행 수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    parser.add_argument("--output", help="JSON 리포트 저장 경로 (기본: stdout)")
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.rows, args.seed)))
+        return 0
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    results = {}
+    for mode in MODES:
+        logger.info(f"Running mode: {mode}")
+        results[mode] = run_mode(mode, args.rows, args.seed)
+        logger.info(
+            f"{mode}: {results[mode]['rows_out']} rows, {results[mode]['seconds_total']}s, "
+            f"peak RSS {results[mode]['peak_rss_mb']}MB"
+        )
+
+    identical = results["rows"]["output_sha256"] == results["batch"]["output_sha256"]
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "rows": args.rows,
+        "identical_output": identical,
+        "speedup": round(results["rows"]["seconds_total"] / results["batch"]["seconds_total"], 2),
+        "results": results,
+    }
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        logger.info(f"Report written to {args.output}")
+    else:
+        print(output)
+
+    if not identical:
+        logger.error("Outputs differ between rows and batch modes")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
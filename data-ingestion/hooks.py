@@ -0,0 +1,177 @@
+"""
+수집 후 (post-commit) 훅
+
+스케줄러는 실행의 모든 저장이 커밋된 뒤 이번 실행에서 실제로 삽입/갱신된 (품목, 시장, 날짜) 키를 모아
+등록된 훅에 한 번씩 넘깁니다. 훅은 그 키에 해당하는 파생 데이터만 갱신합니다.
+- daily_avg_prices: 일별 평균 가격 materialized view 갱신 (database/init.sql)
+- dashboard_cache: BFF Redis의 품목 대시보드 캐시(items:{품목 ID}:dashboard:*) 중 바뀐 품목만 삭제
+
+사용할 훅은 INGESTION_POST_COMMIT_HOOKS(쉼표 구분, 실행 순서)로 선언합니다.
+새 훅은 PostCommitHook을 상속하여 POST_COMMIT_HOOKS에 등록합니다.
+바뀐 행이 없으면 훅을 실행하지 않으며, 훅 하나가 실패해도 나머지 훅은 실행합니다.
+"""
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 실행할 훅 (쉼표 구분, 적힌 순서대로 실행, 빈 값이면 훅 없음)
+POST_COMMIT_HOOKS_SETTING = os.getenv("INGESTION_POST_COMMIT_HOOKS", "daily_avg_prices,dashboard_cache")
+
+# 대시보드 캐시를 지울 Redis (BFF 캐시와 같은 인스턴스, 미설정 시 dashboard_cache 훅은 skipped)
+DASHBOARD_CACHE_REDIS_URL = os.getenv("DASHBOARD_CACHE_REDIS_URL", os.getenv("REDIS_URL", ""))
+
+# (item_id, market_id, date)
+PriceKey = Tuple[int, int, object]
+
+
+class PostCommitHook(ABC):
+    """저장이 커밋된 뒤 바뀐 키로 파생 데이터를 갱신하는 훅"""
+
+    name: str = ""
+
+    @abstractmethod
+    def refresh(self, session, keys: Set[PriceKey]) -> Optional[int]:
+        """
+        바뀐 키에 해당하는 파생 데이터 갱신
+
+        Args:
+            session: 훅 전용 DB 세션 (필요하면 훅에서 커밋)
+            keys: 이번 실행에서 삽입/갱신된 (item_id, market_id, date)
+
+        Returns:
+            갱신/삭제한 대상 수 (대상이 없는 환경이라 실행하지 않았으면 None → skipped)
+        """
+        pass
+
+
+class DailyAvgPricesHook(PostCommitHook):
+    """
+    daily_avg_prices materialized view 갱신
+
+    PostgreSQL은 materialized view의 일부만 갱신할 수 없으므로 바뀐 키가 있을 때 실행마다 한 번만
+    갱신합니다. 유니크 인덱스(uq_daily_avg_prices_key)가 있으면 CONCURRENTLY로 조회를 막지 않고 갱신합니다.
+    """
+
+    name = "daily_avg_prices"
+    view = "daily_avg_prices"
+
+    def refresh(self, session, keys: Set[PriceKey]) -> Optional[int]:
+        if session.get_bind().dialect.name != "postgresql":
+            return None
+        if not session.execute(
+            text("SELECT 1 FROM pg_matviews WHERE matviewname = :view"), {"view": self.view}
+        ).first():
+            return None
+
+        concurrently = session.execute(text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indrelid "
+            "WHERE c.relname = :view AND i.indisunique"
+        ), {"view": self.view}).first() is not None
+        session.execute(text(f"REFRESH MATERIALIZED VIEW {'CONCURRENTLY ' if concurrently else ''}{self.view}"))
+        session.commit()
+        return 1
+
+
+class DashboardCacheHook(PostCommitHook):
+    """
+    BFF 품목 대시보드 캐시 삭제 (바뀐 품목만)
+
+    대시보드는 조회일 이전의 최근 가격도 보여주므로 날짜와 관계없이 해당 품목의 캐시를 모두 지웁니다.
+    키 공간을 SCAN으로 한 번 훑어 바뀐 품목의 키만 UNLINK합니다 (KEYS 명령 미사용).
+    """
+
+    name = "dashboard_cache"
+    pattern = "items:*:dashboard:*"
+
+    def __init__(self, redis_url: str = DASHBOARD_CACHE_REDIS_URL):
+        self.redis_url = redis_url
+        self._client = None
+
+    def refresh(self, session, keys: Set[PriceKey]) -> Optional[int]:
+        if not self.redis_url:
+            return None
+
+        item_ids = {str(item_id) for item_id, _market_id, _date in keys}
+        client = self._get_client()
+        stale = []
+        deleted = 0
+        for cache_key in client.scan_iter(match=self.pattern, count=1000):
+            if cache_key.decode("utf-8").split(":", 2)[1] in item_ids:
+                stale.append(cache_key)
+            if len(stale) >= 500:
+                deleted += client.unlink(*stale)
+                stale.clear()
+        if stale:
+            deleted += client.unlink(*stale)
+        return deleted
+
+    def _get_client(self):
+        if self._client is None:
+            import redis  # 선택 의존성
+
+            self._client = redis.Redis.from_url(self.redis_url, socket_timeout=2, socket_connect_timeout=2)
+        return self._client
+
+
+# 훅 이름 → 생성 함수
+POST_COMMIT_HOOKS: Dict[str, Callable[[], PostCommitHook]] = {
+    DailyAvgPricesHook.name: DailyAvgPricesHook,
+    DashboardCacheHook.name: DashboardCacheHook,
+}
+
+
+def build_hooks(setting: str = POST_COMMIT_HOOKS_SETTING) -> List[PostCommitHook]:
+    """INGESTION_POST_COMMIT_HOOKS 설정으로 훅 생성 (모르는 이름은 경고 후 무시)"""
+    hooks = []
+    for name in (part.strip() for part in setting.split(",")):
+        if not name:
+            continue
+        factory = POST_COMMIT_HOOKS.get(name)
+        if factory is None:
+            logger.warning(f"Unknown post-commit hook: {name} (known: {', '.join(sorted(POST_COMMIT_HOOKS))})")
+            continue
+        hooks.append(factory())
+    return hooks
+
+
+def run_hooks(session, hooks: Iterable[PostCommitHook], keys: Set[PriceKey]) -> List[dict]:
+    """
+    훅을 차례로 실행하고 훅별 결과 반환 (실패한 훅은 롤백 후 다음 훅 계속)
+
+    Returns:
+        [{hook, status(success / skipped / failed), touched_keys, affected, seconds, error, error_class}]
+    """
+    results = []
+    for hook in hooks:
+        result = {
+            'hook': hook.name,
+            'status': 'success',
+            'touched_keys': len(keys),
+            'affected': 0,
+            'seconds': 0.0,
+            'error': None,
+            'error_class': None,
+        }
+        started = time.perf_counter()
+        try:
+            affected = hook.refresh(session, keys)
+            if affected is None:
+                result['status'] = 'skipped'
+            else:
+                result['affected'] = affected
+        except Exception as e:
+            session.rollback()
+            result.update(status='failed', error=str(e), error_class=type(e).__name__)
+            logger.error(f"✗ Post-commit hook {hook.name} failed: {e}")
+        result['seconds'] = round(time.perf_counter() - started, 3)
+        results.append(result)
+    return results
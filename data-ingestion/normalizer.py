@@ -2,16 +2,35 @@
 데이터 정규화 모듈
 
 원본 시장 데이터를 표준 형식으로 변환합니다.
-- 품목명 매핑 (AliasMatcher 활용)
-- 단위 변환 (kg, 마리, 상자 표준화)
+- 품목명 매핑 (AliasMatcher 활용, 배치마다 고유 이름만 한 번에 매핑)
+- 단위 변환 (규격의 수량을 반영하여 kg당/마리당/상자당 가격으로 변환, adapters.units)
 - 가격 검증 및 정제
+- 검증/품목명 매핑에 실패한 행은 collect_dead_letters() 블록 안이면 실패 행으로 기록 (replay.py로 재처리)
 """
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
+import numpy as np
+
 from adapters.base import RawPriceData
+from adapters.dead_letters import (
+    REASON_INVALID,
+    REASON_UNMATCHED,
+    STAGE_NORMALIZE,
+    collecting,
+    compact_record,
+    record_dead_letter,
+)
+from adapters.price_batch import NO_MARKET, NormalizedPriceBatch, RawPriceBatch, convert_unit_prices
+from adapters.units import convert_prices
 
 logger = logging.getLogger(__name__)
 
+# 저장하지 않을 가격 상한 (원, 표준 단위당 가격 기준)
+MAX_PRICE = 1000000
+
+# 품목명을 한 번에 매핑할 레코드 수 (스트리밍 입력도 이 단위로 모아서 처리)
+MATCH_BATCH_SIZE = 1000
+
 
 class DataNormalizer:
     """데이터 정규화 클래스"""
@@ -22,20 +41,15 @@ class DataNormalizer:
             alias_matcher: AliasMatcher 인스턴스 (품목명 매핑용)
         """
         self.alias_matcher = alias_matcher
-        self.stats = {
-            'total': 0,
-            'matched': 0,
-            'unmatched': 0,
-            'invalid': 0
-        }
+        self.stats = self._empty_stats()
     
     def normalize(self, raw_data: List[RawPriceData], market_id: int) -> List[dict]:
         """
         원본 데이터를 정규화
         
         1. 품목명 매핑 (AliasMatcher 활용)
-        2. 단위 변환 (kg, 마리, 상자 표준화)
-        3. 가격 검증
+        2. 단위 변환 (예: "10kg" 18,000원 → kg당 1,800원)
+        3. 가격 검증 (가격 상한은 변환한 단가에 적용)
         
         Args:
             raw_data: 원본 가격 데이터 리스트
@@ -44,51 +58,248 @@ class DataNormalizer:
         Returns:
             정규화된 데이터 딕셔너리 리스트
         """
-        normalized = []
-        self.stats = {'total': 0, 'matched': 0, 'unmatched': 0, 'invalid': 0}
+        return list(self.iter_normalize(raw_data, market_id))
+    
+    def iter_normalize(
+        self,
+        raw_data: Iterable[RawPriceData],
+        market_id: Optional[int] = None
+    ) -> Iterator[dict]:
+        """
+        원본 데이터를 한 건씩 정규화 (스트리밍 수집 결과용)
+        
+        레코드에 market_id가 지정되어 있으면 그 값을, 없으면 인자 market_id를 사용합니다.
+        MATCH_BATCH_SIZE건씩 모아 고유한 (품목명, 시장)만 alias_matcher.match_items로 한 번에
+        매핑하고, 결과는 이번 실행 동안 재사용합니다. 통계는 순회가 끝날 때 로깅됩니다.
+        
+        Args:
+            raw_data: 원본 가격 데이터 (리스트 또는 제너레이터)
+            market_id: 기본 시장 ID
+            
+        Yields:
+            정규화된 데이터 딕셔너리
+        """
+        self.stats = self._empty_stats()
+        resolved: Dict[Tuple[str, Optional[int]], Optional[int]] = {}
+        batch: List[Tuple[RawPriceData, Optional[int]]] = []
         
         for data in raw_data:
             self.stats['total'] += 1
+            record_market_id = data.market_id if data.market_id is not None else market_id
             
             # 데이터 검증
             if not self._validate_data(data):
                 self.stats['invalid'] += 1
+                record_dead_letter(STAGE_NORMALIZE, REASON_INVALID, compact_record(data, record_market_id))
+                continue
+            
+            batch.append((data, record_market_id))
+            
+            if len(batch) >= MATCH_BATCH_SIZE:
+                yield from self._normalize_batch(batch, resolved)
+                batch = []
+        
+        if batch:
+            yield from self._normalize_batch(batch, resolved)
+        
+        self.stats['lookups_avoided'] = (
+            self.stats['matched'] + self.stats['unmatched'] - self.stats['lookups']
+        )
+        
+        # 통계 로깅
+        logger.info(
+            f"Normalization complete: "
+            f"total={self.stats['total']}, "
+            f"matched={self.stats['matched']}, "
+            f"unmatched={self.stats['unmatched']}, "
+            f"invalid={self.stats['invalid']}, "
+            f"lookups={self.stats['lookups']} "
+            f"(avoided {self.stats['lookups_avoided']}), "
+            f"unit_converted={self.stats['unit_converted']}"
+        )
+    
+    def normalize_batch(
+        self,
+        batch: RawPriceBatch,
+        market_id: Optional[int] = None
+    ) -> NormalizedPriceBatch:
+        """
+        컬럼 배치 정규화 (대량 수집/백필용, normalize와 같은 규칙)
+        
+        검증과 단위 변환은 배열 연산으로, 품목명 매핑은 고유한 (품목명, 시장)만
+        한 번에 처리하며 행 단위 객체(dict)를 만들지 않습니다.
+        
+        Args:
+            batch: 어댑터 수집 결과 배치
+            market_id: 기본 시장 ID (레코드별 시장이 없을 때)
+            
+        Returns:
+            NormalizedPriceBatch
+        """
+        self.stats = self._empty_stats()
+        self.stats['total'] = len(batch)
+        
+        # 데이터 검증
+        valid = batch.valid_mask()
+        rejected = [batch.take(~valid)]
+        batch = batch.take(valid)
+        
+        # 단위 변환 후 가격 상한 검증 (상자 단위 가격도 표준 단위당 가격으로 비교)
+        prices, units = convert_unit_prices(batch.price, batch.unit)
+        within = prices <= MAX_PRICE
+        rejected.append(batch.take(~within))
+        batch, prices, units = batch.take(within), prices[within], units[within]
+        
+        self.stats['invalid'] = sum(len(invalid) for invalid in rejected)
+        if self.stats['invalid']:
+            logger.warning(f"Invalid records skipped: {self.stats['invalid']}")
+            for invalid in rejected:
+                if len(invalid):
+                    self._record_dead_letters(invalid, market_id, REASON_INVALID)
+        market_ids = batch.resolve_market_ids(market_id)
+        
+        # 품목명 매핑 (고유 키만)
+        codes: Dict[Tuple[str, Optional[int]], int] = {}
+        inverse = np.fromiter(
+            (
+                codes.setdefault((raw_name, record_market_id), len(codes))
+                for raw_name, record_market_id in zip(batch.raw_name.tolist(), market_ids.tolist())
+            ),
+            dtype=np.int64,
+            count=len(batch)
+        )
+        resolved = self._match_items(list(codes)) if codes else {}
+        self.stats['lookups'] = len(codes)
+        
+        key_item_ids = np.array([resolved.get(key) or 0 for key in codes], dtype=np.int64)
+        item_ids = key_item_ids[inverse] if len(codes) else np.empty(0, dtype=np.int64)
+        matched = item_ids > 0
+        self.stats['matched'] = int(matched.sum())
+        self.stats['unmatched'] = len(batch) - self.stats['matched']
+        self.stats['lookups_avoided'] = len(batch) - self.stats['lookups']
+        
+        if self.stats['unmatched']:
+            self._record_dead_letters(batch.take(~matched), market_id, REASON_UNMATCHED)
+        
+        # 단위 변환 결과 (매핑된 행만)
+        batch, prices, units = batch.take(matched), prices[matched], units[matched]
+        self.stats['unit_converted'] = int((prices != batch.price).sum())
+        
+        logger.info(
+            f"Batch normalization complete: "
+            f"total={self.stats['total']}, "
+            f"matched={self.stats['matched']}, "
+            f"unmatched={self.stats['unmatched']}, "
+            f"invalid={self.stats['invalid']}, "
+            f"lookups={self.stats['lookups']} "
+            f"(avoided {self.stats['lookups_avoided']}), "
+            f"unit_converted={self.stats['unit_converted']}"
+        )
+        
+        return NormalizedPriceBatch(
+            item_id=item_ids[matched],
+            market_id=market_ids[matched],
+            date=batch.date,
+            price=prices,
+            unit=units,
+            origin=batch.origin,
+            source=batch.source,
+        )
+    
+    def _normalize_batch(
+        self,
+        batch: List[Tuple[RawPriceData, Optional[int]]],
+        resolved: Dict[Tuple[str, Optional[int]], Optional[int]]
+    ) -> Iterator[dict]:
+        """
+        검증을 통과한 레코드 배치 정규화
+        
+        아직 매핑하지 않은 고유 (품목명, 시장)만 모아 한 번에 매핑하고 resolved에 기록합니다.
+        
+        Args:
+            batch: (원본 데이터, 시장 ID) 리스트
+            resolved: 이번 실행의 매핑 결과 {(품목명, 시장 ID): Item ID 또는 None}
+            
+        Yields:
+            정규화된 데이터 딕셔너리
+        """
+        pending = list(dict.fromkeys(
+            (data.raw_name, record_market_id)
+            for data, record_market_id in batch
+            if (data.raw_name, record_market_id) not in resolved
+        ))
+        if pending:
+            resolved.update(self._match_items(pending))
+            self.stats['lookups'] += len(pending)
+        
+        # 단위 변환 (고유 규격 표기만 한 번씩 파싱)
+        unit_prices, units = convert_prices(
+            [data.price for data, _ in batch],
+            [data.unit for data, _ in batch]
+        )
+        
+        for (data, record_market_id), unit_price, unit in zip(batch, unit_prices, units):
+            # 가격 범위 검증 (규격 수량으로 나눈 단가 기준)
+            if unit_price > MAX_PRICE:  # 단가 100만원 초과
+                self.stats['invalid'] += 1
+                logger.warning(
+                    f"Price too high for '{data.raw_name}': {unit_price} per {unit}"
+                )
+                record_dead_letter(STAGE_NORMALIZE, REASON_INVALID, compact_record(data, record_market_id))
                 continue
             
             # 품목명 매핑
-            item_id = self.alias_matcher.match_item(data.raw_name, market_id)
+            item_id = resolved.get((data.raw_name, record_market_id))
             
             if item_id is None:
                 # 매핑 실패 시 스킵
                 self.stats['unmatched'] += 1
                 logger.debug(
                     f"Unmatched item: '{data.raw_name}' "
-                    f"(market_id={market_id}, price={data.price})"
+                    f"(market_id={record_market_id}, price={data.price})"
                 )
+                record_dead_letter(STAGE_NORMALIZE, REASON_UNMATCHED, compact_record(data, record_market_id))
                 continue
             
             self.stats['matched'] += 1
+            if unit_price != data.price:
+                self.stats['unit_converted'] += 1
             
-            normalized.append({
+            yield {
                 'item_id': item_id,
-                'market_id': market_id,
+                'market_id': record_market_id,
                 'date': data.date,
-                'price': data.price,
-                'unit': self._normalize_unit(data.unit),
+                'price': unit_price,
+                'unit': unit,
                 'origin': data.origin or '',
                 'source': data.source or '',
-            })
-        
-        # 통계 로깅
-        logger.info(
-            f"Normalization complete: "
-            f"total={self.stats['total']}, "
-            f"matched={self.stats['matched']}, "
-            f"unmatched={self.stats['unmatched']}, "
-            f"invalid={self.stats['invalid']}"
-        )
+            }
+    
+    @staticmethod
+    def _record_dead_letters(batch: RawPriceBatch, market_id: Optional[int], reason: str):
+        """배치에서 버린 행을 실패 행으로 기록 (collect_dead_letters 블록 밖이면 행을 만들지 않음)"""
+        if not collecting():
+            return
+        for data, record_market_id in zip(batch.iter_records(), batch.resolve_market_ids(market_id).tolist()):
+            record_market_id = None if record_market_id == NO_MARKET else record_market_id
+            record_dead_letter(STAGE_NORMALIZE, reason, compact_record(data, record_market_id))
+    
+    def _match_items(
+        self,
+        keys: List[Tuple[str, Optional[int]]]
+    ) -> Dict[Tuple[str, Optional[int]], Optional[int]]:
+        """
+        (품목명, 시장 ID) 목록 매핑
         
-        return normalized
+        alias_matcher에 일괄 매핑(match_items)이 없으면 키마다 match_item을 호출합니다.
+        """
+        match_items = getattr(self.alias_matcher, 'match_items', None)
+        if match_items is not None:
+            return match_items(keys)
+        return {
+            (raw_name, market_id): self.alias_matcher.match_item(raw_name, market_id)
+            for raw_name, market_id in keys
+        }
     
     def _validate_data(self, data: RawPriceData) -> bool:
         """
@@ -112,13 +323,6 @@ class DataNormalizer:
             )
             return False
         
-        # 가격 범위 검증 (너무 높거나 낮은 가격 필터링)
-        if data.price > 1000000:  # 100만원 초과
-            logger.warning(
-                f"Price too high for '{data.raw_name}': {data.price}"
-            )
-            return False
-        
         # 단위 검증
         if not data.unit or not data.unit.strip():
             logger.warning(f"Empty unit for '{data.raw_name}'")
@@ -126,47 +330,24 @@ class DataNormalizer:
         
         return True
     
-    def _normalize_unit(self, unit: str) -> str:
+    @staticmethod
+    def _empty_stats() -> dict:
         """
-        단위 표준화
+        빈 통계
         
-        Args:
-            unit: 원본 단위
-            
-        Returns:
-            표준화된 단위
-        """
-        if not unit:
-            return 'kg'
-        
-        unit_lower = unit.lower().strip()
-        
-        # 단위 매핑 테이블
-        unit_map = {
-            'kg': 'kg',
-            'kilogram': 'kg',
-            '킬로그램': 'kg',
-            '킬로': 'kg',
-            'kilo': 'kg',
-            '마리': '마리',
-            'ea': '마리',
-            'each': '마리',
-            'pcs': '마리',
-            '개': '마리',
-            '상자': '상자',
-            'box': '상자',
-            '박스': '상자',
+        lookups는 실제로 매핑한 고유 (품목명, 시장) 수, lookups_avoided는
+        이미 매핑한 결과를 재사용하여 생략한 매핑 수, unit_converted는
+        규격 수량으로 나눠 단가로 변환한 행 수입니다.
+        """
+        return {
+            'total': 0,
+            'matched': 0,
+            'unmatched': 0,
+            'invalid': 0,
+            'lookups': 0,
+            'lookups_avoided': 0,
+            'unit_converted': 0,
         }
-        
-        # 매핑 테이블에서 찾기
-        normalized = unit_map.get(unit_lower)
-        
-        if normalized:
-            return normalized
-        
-        # 매핑되지 않은 단위는 로그 기록 후 원본 반환
-        logger.debug(f"Unknown unit: '{unit}', using as-is")
-        return unit
     
     def get_stats(self) -> dict:
         """
@@ -0,0 +1,403 @@
+"""
+가격 이상치 검사 모듈
+
+정규화된 가격을 같은 (품목, 시장, 단위)의 최근 가격 분포와 비교하여, 파싱 오류 등으로
+크게 벗어난 가격은 market_prices에 쓰지 않고 price_quarantine 테이블에 격리합니다.
+- 기준 분포: 수집일 이전 OUTLIER_WINDOW_DAYS일의 저장된 가격 (PriceRepository.get_price_samples 1회 조회)
+- 판정: 수정 Z 점수 0.6745 * |가격 - 중앙값| / MAD 가 OUTLIER_MAD_THRESHOLD 초과
+  (MAD는 중앙값의 OUTLIER_MIN_RELATIVE_MAD 비율 이상으로 보정하여 가격이 한동안 같았던 품목의 정상 변동은 허용)
+- 기준 가격이 OUTLIER_MIN_SAMPLES개 미만인 키는 판정하지 않고 그대로 저장
+- OUTLIER_BASELINE_START가 있으면 그 이전 가격은 기준 분포에서 제외 (예: 단위 기준이 바뀐 날)
+- 서로 다른 OUTLIER_RELEASE_DAYS일 동안 비슷한 수준(OUTLIER_RELEASE_TOLERANCE 이내)의 가격이 이어지면
+  실제 가격 변동으로 보고 격리하지 않음 (대기 중인 격리 가격도 함께 저장하도록 release_ids에 기록)
+
+중앙값/MAD는 키별 반복 없이 정렬과 구간 인덱싱으로 모든 키를 한 번에 계산합니다.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+from adapters.price_batch import PRICE_COLUMNS, NormalizedPriceBatch
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 이상치 검사 사용 여부
+OUTLIER_DETECTION_ENABLED = os.getenv("OUTLIER_DETECTION_ENABLED", "true").lower() == "true"
+
+# 기준 분포 기간 (수집일 이전 N일)
+OUTLIER_WINDOW_DAYS = int(os.getenv("OUTLIER_WINDOW_DAYS", "30"))
+
+# 이상치로 판정하는 수정 Z 점수 (Iglewicz-Hoaglin 권장값 3.5)
+OUTLIER_MAD_THRESHOLD = float(os.getenv("OUTLIER_MAD_THRESHOLD", "3.5"))
+
+# 판정에 필요한 최소 기준 가격 수
+OUTLIER_MIN_SAMPLES = int(os.getenv("OUTLIER_MIN_SAMPLES", "5"))
+
+# MAD 하한 (중앙값 대비 비율) - 기본 0.05이면 중앙값에서 약 26% 이내 변동은 항상 허용
+OUTLIER_MIN_RELATIVE_MAD = float(os.getenv("OUTLIER_MIN_RELATIVE_MAD", "0.05"))
+
+# 기준 분포 시작일 (YYYY-MM-DD, 비어 있으면 제한 없음) - 이전 가격은 단위 기준이 달라 비교하지 않을 때 사용
+OUTLIER_BASELINE_START = os.getenv("OUTLIER_BASELINE_START", "")
+BASELINE_START = date.fromisoformat(OUTLIER_BASELINE_START) if OUTLIER_BASELINE_START else None
+
+# 같은 수준의 가격이 서로 다른 이 일수만큼 이어지면 격리하지 않고 자동 해제 (0이면 해제하지 않음)
+OUTLIER_RELEASE_DAYS = int(os.getenv("OUTLIER_RELEASE_DAYS", "3"))
+
+# 같은 수준으로 보는 가격 차이 (연속 구간 첫 가격 대비 비율)
+OUTLIER_RELEASE_TOLERANCE = float(os.getenv("OUTLIER_RELEASE_TOLERANCE", "0.1"))
+
+# 정규분포에서 MAD를 표준편차 단위로 맞추는 상수
+MAD_SCALE = 0.6745
+
+# 격리 사유
+REASON_MAD_OUTLIER = "mad_outlier"
+
+PriceKey = Tuple[int, int, str]
+
+
+@dataclass
+class OutlierCheck:
+    """행별 검사 결과 (모든 배열은 입력 행 순서)"""
+    outlier: np.ndarray   # bool
+    median: np.ndarray    # float64 (기준 분포가 없으면 nan)
+    mad: np.ndarray       # float64 (보정 전 MAD)
+    samples: np.ndarray   # int64
+    score: np.ndarray     # float64 (기준 분포가 없으면 0)
+
+
+class OutlierDetector:
+    """최근 가격 분포 기반 이상치 검사"""
+
+    def __init__(
+        self,
+        price_repository,
+        enabled: bool = OUTLIER_DETECTION_ENABLED,
+        window_days: int = OUTLIER_WINDOW_DAYS,
+        threshold: float = OUTLIER_MAD_THRESHOLD,
+        min_samples: int = OUTLIER_MIN_SAMPLES,
+        min_relative_mad: float = OUTLIER_MIN_RELATIVE_MAD,
+        quarantine_repository=None,
+        baseline_start: Optional[date] = BASELINE_START,
+        release_days: int = OUTLIER_RELEASE_DAYS,
+        release_tolerance: float = OUTLIER_RELEASE_TOLERANCE
+    ):
+        """
+        Args:
+            price_repository: PriceRepository 인스턴스 (기준 가격 조회용)
+            enabled: False면 모든 행을 그대로 통과
+            window_days: 기준 분포 기간 (일)
+            threshold: 이상치 판정 수정 Z 점수
+            min_samples: 판정에 필요한 최소 기준 가격 수
+            min_relative_mad: 중앙값 대비 MAD 하한 비율
+            quarantine_repository: PriceQuarantineRepository 인스턴스 (없으면 자동 해제하지 않음)
+            baseline_start: 기준 분포 시작일 (이전 가격은 제외, None이면 제한 없음)
+            release_days: 같은 수준의 가격이 서로 다른 이 일수만큼 이어지면 자동 해제 (1 이하면 해제하지 않음)
+            release_tolerance: 같은 수준으로 보는 가격 차이 비율
+        """
+        self.price_repository = price_repository
+        self.quarantine_repository = quarantine_repository
+        self.enabled = enabled
+        self.window_days = window_days
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.min_relative_mad = min_relative_mad
+        self.baseline_start = baseline_start
+        self.release_days = release_days
+        self.release_tolerance = release_tolerance
+        self.stats = self._empty_stats()
+        # 마지막 검사에서 자동 해제한 대기 중 격리 가격 ID (호출 측에서 quarantine_repository.release로 저장)
+        self.release_ids: List[int] = []
+
+    def split_rows(self, rows: List[dict]) -> Tuple[List[dict], List[dict]]:
+        """
+        정규화된 딕셔너리 리스트 검사 (스케줄러용)
+
+        Returns:
+            (저장할 행, 격리할 행) - 격리할 행에는 기준 분포와 점수, 사유가 추가됨
+        """
+        self.stats = self._empty_stats()
+        self.release_ids = []
+        if not self.enabled or not rows:
+            return rows, []
+
+        check = self.check(
+            [row['item_id'] for row in rows],
+            [row['market_id'] for row in rows],
+            [row['unit'] for row in rows],
+            [row['date'] for row in rows],
+            np.asarray([row['price'] for row in rows], dtype=np.float64)
+        )
+        flagged = check.outlier.tolist()
+        clean = [row for row, is_outlier in zip(rows, flagged) if not is_outlier]
+        quarantined = [
+            self._quarantine_row(row, check, index)
+            for index, (row, is_outlier) in enumerate(zip(rows, flagged)) if is_outlier
+        ]
+        return clean, quarantined
+
+    def split_batch(self, batch: NormalizedPriceBatch) -> Tuple[NormalizedPriceBatch, List[dict]]:
+        """
+        컬럼 배치 검사 (백필용)
+
+        Returns:
+            (저장할 배치, 격리할 행 딕셔너리 리스트)
+        """
+        self.stats = self._empty_stats()
+        self.release_ids = []
+        if not self.enabled or not len(batch):
+            return batch, []
+
+        check = self.check(batch.item_id, batch.market_id, batch.unit, batch.date, batch.price)
+        flagged = batch.take(check.outlier)
+        quarantined = [
+            self._quarantine_row(dict(zip(PRICE_COLUMNS, row)), check, index)
+            for row, index in zip(flagged.iter_rows(), np.flatnonzero(check.outlier).tolist())
+        ]
+        return batch.take(~check.outlier), quarantined
+
+    def check(
+        self,
+        item_ids: Sequence[int],
+        market_ids: Sequence[int],
+        units: Sequence[str],
+        dates: Sequence,
+        prices: np.ndarray
+    ) -> OutlierCheck:
+        """
+        가격들을 (품목, 시장, 단위)별 최근 분포와 비교
+
+        기준 기간은 입력 중 가장 이른 수집일 이전 window_days일이며(baseline_start 이전 제외),
+        기준 가격은 한 번에 조회합니다. 이상치로 판정된 행이 있으면 계속 격리된 같은 수준의 가격인지 확인해 해제합니다.
+        """
+        item_ids = _as_list(item_ids)
+        market_ids = _as_list(market_ids)
+        units = _as_list(units)
+        row_dates = [_as_date(value) for value in _as_list(dates)]
+
+        # 입력 키 코드화
+        codes: Dict[PriceKey, int] = {}
+        row_codes = np.fromiter(
+            (codes.setdefault(key, len(codes)) for key in zip(item_ids, market_ids, units)),
+            dtype=np.int64,
+            count=len(prices)
+        )
+
+        # 기준 가격 조회 (입력 키에 해당하는 것만)
+        end_date = min(row_dates)
+        start_date = end_date - timedelta(days=self.window_days)
+        if self.baseline_start is not None:
+            start_date = max(start_date, self.baseline_start)
+        samples = self.price_repository.get_price_samples(
+            {(item_id, market_id) for item_id, market_id, _unit in codes},
+            start_date,
+            end_date
+        ) if start_date < end_date else []
+        sample_codes = np.fromiter(
+            (codes.get((item_id, market_id, unit), -1) for item_id, market_id, unit, _price in samples),
+            dtype=np.int64,
+            count=len(samples)
+        )
+        sample_prices = np.fromiter(
+            (price for _item_id, _market_id, _unit, price in samples),
+            dtype=np.float64,
+            count=len(samples)
+        )
+        known = sample_codes >= 0
+        median, mad, counts = robust_baseline(sample_codes[known], sample_prices[known], len(codes))
+
+        # 행별 판정
+        row_median = median[row_codes]
+        row_counts = counts[row_codes]
+        judged = row_counts >= self.min_samples
+        spread = np.maximum(mad[row_codes], row_median * self.min_relative_mad)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            score = np.where(judged, MAD_SCALE * np.abs(prices - row_median) / spread, 0.0)
+        score = np.nan_to_num(score, nan=0.0, posinf=0.0)
+        outlier = judged & (score > self.threshold)
+        released = 0
+        if outlier.any() and self.quarantine_repository is not None and self.release_days > 1:
+            accepted = self._release_persistent(item_ids, market_ids, units, row_dates, prices, outlier, end_date)
+            released = int(accepted.sum())
+            outlier &= ~accepted
+
+        self.stats.update(
+            checked=len(prices),
+            keys=len(codes),
+            baseline_samples=int(known.sum()),
+            no_baseline=int((~judged).sum()),
+            quarantined=int(outlier.sum()),
+            released=released + len(self.release_ids),
+        )
+        logger.info(
+            f"Outlier check: checked={self.stats['checked']}, keys={self.stats['keys']}, "
+            f"baseline_samples={self.stats['baseline_samples']}, "
+            f"no_baseline={self.stats['no_baseline']}, quarantined={self.stats['quarantined']}, "
+            f"released={self.stats['released']}"
+        )
+
+        return OutlierCheck(
+            outlier=outlier,
+            median=row_median,
+            mad=mad[row_codes],
+            samples=row_counts,
+            score=score,
+        )
+
+    def _release_persistent(
+        self,
+        item_ids: list,
+        market_ids: list,
+        units: list,
+        row_dates: List[date],
+        prices: np.ndarray,
+        outlier: np.ndarray,
+        end_date: date
+    ) -> np.ndarray:
+        """
+        계속 격리된 같은 수준의 가격 해제
+
+        이상치가 있는 (품목, 시장, 단위)별로 최근 window_days일의 저장 가격, 대기 중 격리 가격, 입력 행을 날짜순으로 보며
+        구간 첫 가격과 release_tolerance 넘게 다른 가격이 나오면 새 구간을 시작합니다.
+        구간이 서로 다른 release_days일에 이르면 구간의 격리 가격을 모두 해제하므로, 단위 기준이 바뀌었거나
+        실제 시세가 움직여 기준 분포가 따라가지 못하는 가격도 며칠 뒤에는 저장됩니다
+        (해제된 수준의 저장 가격이 구간에 남으므로 다음 수집의 같은 수준 가격도 격리하지 않음).
+
+        Returns:
+            해제할 입력 행 마스크 (대기 중 격리 가격 ID는 self.release_ids에 추가)
+        """
+        flagged_keys = {
+            (item_ids[index], market_ids[index], units[index])
+            for index in np.flatnonzero(outlier).tolist()
+        }
+        pairs = {(item_id, market_id) for item_id, market_id, _unit in flagged_keys}
+        start_date = end_date - timedelta(days=self.window_days)
+
+        # 키별 관측 (날짜, 가격, 대기 중 격리 ID, 입력 행 번호) - 저장 가격은 ID/행 번호 모두 None
+        observations: Dict[PriceKey, list] = {key: [] for key in flagged_keys}
+        for item_id, market_id, unit, price_date, price in self.price_repository.get_recent_prices(
+            pairs, start_date, end_date
+        ):
+            if (item_id, market_id, unit) in observations:
+                observations[(item_id, market_id, unit)].append((price_date, price, None, None))
+        for entry_id, item_id, market_id, unit, entry_date, price in self.quarantine_repository.get_pending_prices(
+            pairs, start_date, end_date
+        ):
+            if (item_id, market_id, unit) in observations:
+                observations[(item_id, market_id, unit)].append((entry_date, price, entry_id, None))
+        for index, key in enumerate(zip(item_ids, market_ids, units)):
+            if key in observations:
+                observations[key].append((row_dates[index], float(prices[index]), None, index))
+
+        accepted = np.zeros(len(prices), dtype=bool)
+        released = set()
+        for key, entries in observations.items():
+            run: list = []
+            for entry in sorted(entries, key=lambda entry: entry[0]):
+                if run and abs(entry[1] - run[0][1]) > self.release_tolerance * run[0][1]:
+                    run = []
+                run.append(entry)
+                if len({member[0] for member in run}) < self.release_days:
+                    continue
+                for _date, _price, entry_id, index in run:
+                    if entry_id is not None and entry_id not in released:
+                        released.add(entry_id)
+                        self.release_ids.append(entry_id)
+                    elif index is not None and outlier[index] and not accepted[index]:
+                        accepted[index] = True
+                        logger.warning(
+                            f"Releasing persistent price: item_id={key[0]}, market_id={key[1]}, "
+                            f"date={row_dates[index]}, price={float(prices[index])} {key[2]} "
+                            f"({len(run)} prices within {self.release_tolerance:.0%} since {run[0][0]})"
+                        )
+        return accepted
+
+    def _quarantine_row(self, row: dict, check: OutlierCheck, index: int) -> dict:
+        """격리할 행 (정규화 행 + 기준 분포/점수/사유)"""
+        quarantined = {
+            **row,
+            'price': float(row['price']),
+            'baseline_median': round(float(check.median[index]), 2),
+            'baseline_mad': round(float(check.mad[index]), 2),
+            'sample_count': int(check.samples[index]),
+            'score': round(float(check.score[index]), 2),
+            'reason': REASON_MAD_OUTLIER,
+        }
+        logger.warning(
+            f"Quarantined price: item_id={row['item_id']}, market_id={row['market_id']}, "
+            f"date={_as_date(row['date'])}, price={quarantined['price']} {row['unit']} "
+            f"(median {quarantined['baseline_median']}, score {quarantined['score']})"
+        )
+        return quarantined
+
+    @staticmethod
+    def _empty_stats() -> dict:
+        return {
+            'checked': 0,
+            'keys': 0,
+            'baseline_samples': 0,
+            'no_baseline': 0,
+            'quarantined': 0,
+            'released': 0,
+        }
+
+    def get_stats(self) -> dict:
+        """마지막 검사 통계 반환"""
+        return self.stats.copy()
+
+
+def robust_baseline(
+    codes: np.ndarray,
+    values: np.ndarray,
+    n_groups: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    그룹별 중앙값, MAD, 표본 수
+
+    Args:
+        codes: 값마다 그룹 번호 (0 ~ n_groups-1)
+        values: 값
+        n_groups: 그룹 수
+
+    Returns:
+        (중앙값, MAD, 표본 수) - 값이 없는 그룹의 중앙값/MAD는 nan
+    """
+    median, counts = _grouped_median(codes, values, n_groups)
+    deviations = np.abs(values - median[codes]) if len(values) else values
+    mad, _ = _grouped_median(codes, deviations, n_groups)
+    return median, mad, counts
+
+
+def _grouped_median(
+    codes: np.ndarray,
+    values: np.ndarray,
+    n_groups: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """그룹 번호 → 값 순으로 정렬한 뒤 그룹마다 가운데 위치의 값을 골라 중앙값 계산"""
+    counts = np.bincount(codes, minlength=n_groups).astype(np.int64)
+    median = np.full(n_groups, np.nan)
+    present = counts > 0
+    if not present.any():
+        return median, counts
+
+    sorted_values = values[np.lexsort((values, codes))]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    lower = starts + (counts - 1) // 2
+    upper = starts + counts // 2
+    median[present] = (sorted_values[lower[present]] + sorted_values[upper[present]]) / 2
+    return median, counts
+
+
+def _as_list(values) -> list:
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
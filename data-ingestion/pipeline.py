@@ -0,0 +1,121 @@
+"""
+어댑터별 수집 파이프라인
+
+어댑터는 스레드풀에서 동시에 실행되므로 DB 세션, AliasMatcher, DataNormalizer,
+OutlierDetector, 리포지토리를 공유하지 않고 어댑터마다 새로 만들어 사용합니다.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class AdapterTimeoutError(Exception):
+    """어댑터 실행이 마감 시간을 넘김"""
+    pass
+
+
+@dataclass
+class IngestionPipeline:
+    """어댑터 하나를 처리하는 정규화/검사/저장 구성 요소 (전용 DB 세션 포함)"""
+    session: Any
+    normalizer: Any
+    repository: Any
+    state_repository: Any
+    outlier_detector: Any
+    quarantine_repository: Any
+    run_repository: Any
+    dead_letter_repository: Any
+    watermark_repository: Any
+    job_repository: Any
+
+    def close(self):
+        """세션 반환 (커밋되지 않은 변경은 롤백)"""
+        try:
+            self.session.rollback()
+        finally:
+            self.session.close()
+
+
+def make_pipeline_factory(session_factory: Callable) -> Callable[[], IngestionPipeline]:
+    """
+    세션 팩토리로 IngestionPipeline 생성 함수 만들기
+
+    Args:
+        session_factory: SQLAlchemy sessionmaker
+
+    Returns:
+        호출할 때마다 새 세션을 가진 IngestionPipeline을 반환하는 함수
+    """
+    # Core Service 모듈은 initialize_components()에서 sys.path에 추가됨
+    from app.aliases.matcher import AliasMatcher
+    from app.database.price_repository import PriceRepository
+    from app.database.ingestion_state_repository import IngestionStateRepository
+    from app.database.price_quarantine_repository import PriceQuarantineRepository
+    from app.database.ingestion_run_repository import IngestionRunRepository
+    from app.database.ingestion_dead_letter_repository import IngestionDeadLetterRepository
+    from app.database.ingestion_watermark_repository import IngestionWatermarkRepository
+    from app.database.ingestion_job_repository import IngestionJobRepository
+    from normalizer import DataNormalizer
+    from outliers import OutlierDetector
+
+    def factory() -> IngestionPipeline:
+        session = session_factory()
+        repository = PriceRepository(session)
+        quarantine_repository = PriceQuarantineRepository(session)
+        return IngestionPipeline(
+            session=session,
+            normalizer=DataNormalizer(AliasMatcher(session)),
+            repository=repository,
+            state_repository=IngestionStateRepository(session),
+            outlier_detector=OutlierDetector(repository, quarantine_repository=quarantine_repository),
+            quarantine_repository=quarantine_repository,
+            run_repository=IngestionRunRepository(session),
+            dead_letter_repository=IngestionDeadLetterRepository(session),
+            watermark_repository=IngestionWatermarkRepository(session),
+            job_repository=IngestionJobRepository(session)
+        )
+
+    return factory
+
+
+def compute_payload_hash(raw_data: Sequence[Any]) -> str:
+    """
+    수집한 원본 데이터의 내용 해시 (SHA-256)
+    
+    레코드 순서가 바뀌어도 같은 해시가 되도록 레코드별 직렬화 결과를 정렬합니다.
+    오늘 수집은 어댑터가 수집 시각(datetime.now())을 레코드 날짜에 넣으므로
+    datetime 값은 날짜만 반영합니다 (같은 날 다시 수집한 같은 내용은 같은 해시).
+    
+    Args:
+        raw_data: RawPriceData(또는 dict) 리스트
+    
+    Returns:
+        64자리 16진수 해시
+    """
+    serialized = sorted(
+        json.dumps(
+            _hash_fields(asdict(record) if is_dataclass(record) else record),
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        for record in raw_data
+    )
+    digest = hashlib.sha256()
+    for line in serialized:
+        digest.update(line.encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def _hash_fields(record: dict) -> dict:
+    """해시에 넣을 레코드 필드 (datetime은 날짜만)"""
+    return {
+        key: value.date() if isinstance(value, datetime) else value
+        for key, value in record.items()
+    }
@@ -0,0 +1,302 @@
+"""
+수집 실패 행 재처리 CLI
+
+ingestion_dead_letters에 남은 행(파싱 실패, 검증/품목명 매핑 실패)을 네트워크 요청 없이 다시 처리합니다.
+별칭을 추가하거나 파서를 고친 뒤 실행하면:
+1. parse 단계 행은 저장된 원본 조각을 어댑터의 parse_dead_letter()로 다시 파싱하고,
+   normalize 단계 행은 저장된 RawPriceData 필드를 그대로 복원
+2. 모든 행을 DataNormalizer로 한 번에 정규화 (고유 품목명만 매핑)
+3. 수집일별 이상치 검사 후 diff_upsert 한 번으로 저장 (이상치는 price_quarantine에 격리)
+4. 저장/격리된 행과 이제는 건너뛰는 행은 resolved, 여전히 실패하는 행은 pending으로 두고 사유 갱신
+5. 바뀐 (품목, 시장, 날짜) 키가 있으면 스케줄러와 같은 post-commit 훅 실행 (뷰 갱신, 캐시 삭제)
+
+사용 예:
+    python replay.py --list
+    python replay.py
+    python replay.py --adapters noryangjin --stage parse --start 2026-10-01 --dry-run
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from collections import defaultdict
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence
+
+from dotenv import load_dotenv
+
+from adapters.base import RawPriceData
+from adapters.dead_letters import STAGE_NORMALIZE, STAGE_PARSE, collect_dead_letters, compact_record, restore_record
+from hooks import PostCommitHook, build_hooks, run_hooks
+from pipeline import IngestionPipeline
+
+load_dotenv()
+
+logger = logging.getLogger("replay")
+
+
+def _garak_parser():
+    from adapters.garak import GarakAdapter
+    return GarakAdapter(api_key="")
+
+
+def _noryangjin_parser():
+    from adapters.noryangjin import NoryangjinAdapter
+    return NoryangjinAdapter()
+
+
+def _kamis_parser():
+    from adapters.kamis_price_adapter import KamisPriceAdapter
+    return KamisPriceAdapter(api_key="")
+
+
+# parse 단계 실패 행을 다시 파싱할 어댑터 (parse_dead_letter는 네트워크 요청을 하지 않으므로 API 키 없이 생성)
+PARSER_FACTORIES: Dict[str, Callable] = {
+    "GarakAdapter": _garak_parser,
+    "NoryangjinAdapter": _noryangjin_parser,
+    "KamisPriceAdapter": _kamis_parser,
+}
+
+
+class DeadLetterReplayer:
+    """수집 실패 행 재처리기"""
+
+    def __init__(
+        self,
+        pipeline_factory: Callable[[], IngestionPipeline],
+        parser_factories: Dict[str, Callable] = PARSER_FACTORIES,
+        hooks: Sequence[PostCommitHook] = ()
+    ):
+        """
+        Args:
+            pipeline_factory: IngestionPipeline 생성 함수
+            parser_factories: {어댑터 클래스 이름: 어댑터 생성 함수} (처음 필요할 때 생성)
+            hooks: 저장 후 바뀐 키로 실행할 post-commit 훅
+        """
+        self.pipeline_factory = pipeline_factory
+        self.parser_factories = parser_factories
+        self.hooks = list(hooks)
+        self._parsers: Dict[str, object] = {}
+
+    def run(
+        self,
+        adapter: Optional[str] = None,
+        stage: Optional[str] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        limit: Optional[int] = None,
+        dry_run: bool = False
+    ) -> dict:
+        """
+        재처리 실행
+
+        Args:
+            adapter: 어댑터 클래스 이름 필터 (예: NoryangjinAdapter)
+            stage: 실패 단계 필터 (parse / normalize)
+            start: 수집일 시작 (포함)
+            end: 수집일 끝 (포함)
+            limit: 최대 행 수
+            dry_run: True면 다시 파싱/정규화한 결과만 집계하고 저장하지 않음
+
+        Returns:
+            재처리 요약
+        """
+        started = time.perf_counter()
+        pipeline = self.pipeline_factory()
+        try:
+            entries = pipeline.dead_letter_repository.get_pending(adapter, stage, start, end, limit)
+            logger.info(f"Replaying {len(entries)} dead letters" + (" (dry run)" if dry_run else ""))
+            summary = self._replay(pipeline, entries, dry_run)
+        finally:
+            pipeline.close()
+
+        summary['dry_run'] = dry_run
+        summary['wall_seconds'] = round(time.perf_counter() - started, 3)
+        _log_summary(summary)
+        return summary
+
+    def _replay(self, pipeline: IngestionPipeline, entries: List, dry_run: bool) -> dict:
+        summary = _new_summary(len(entries))
+        resolved: List[int] = []
+        failures: Dict[int, dict] = {}
+
+        # 1. 원본 복원 (parse 단계는 다시 파싱)
+        replayable = []
+        for entry in entries:
+            try:
+                raw = self._restore(entry)
+            except Exception as e:
+                failures[entry.id] = {'reason': type(e).__name__, 'error': str(e)}
+                continue
+            if raw is None:
+                # 고친 파서가 건너뛰는 행 (헤더, 가격 없음 등)
+                resolved.append(entry.id)
+                summary['skipped'] += 1
+                continue
+            replayable.append((entry, raw))
+        summary['parse_failed'] = len(failures)
+
+        # 2. 정규화 - 다시 실패한 행은 compact_record 형식으로 모임
+        with collect_dead_letters() as normalize_failures:
+            normalized = pipeline.normalizer.normalize([raw for _entry, raw in replayable], None)
+        still_failing = {tuple(letter.record): letter for letter in normalize_failures.letters}
+        for entry, raw in replayable:
+            letter = still_failing.get(tuple(compact_record(raw, raw.market_id)))
+            if letter is None:
+                resolved.append(entry.id)
+            else:
+                failures[entry.id] = {'reason': letter.reason, 'error': letter.error}
+        summary['normalize_failed'] = len(failures) - summary['parse_failed']
+        summary['normalized'] = len(normalized)
+
+        if dry_run:
+            summary['resolved'] = len(resolved)
+            summary['still_failing'] = len(failures)
+            return summary
+
+        # 3. 수집일별 이상치 검사 (기준 분포가 수집일마다 다름) 후 한 번에 저장
+        rows_by_date = defaultdict(list)
+        for row in normalized:
+            rows_by_date[row['date']].append(row)
+        clean, quarantined, released_ids = [], [], []
+        for rows in rows_by_date.values():
+            day_clean, day_quarantined = pipeline.outlier_detector.split_rows(rows)
+            clean.extend(day_clean)
+            quarantined.extend(day_quarantined)
+            released_ids.extend(pipeline.outlier_detector.release_ids)
+
+        pipeline.quarantine_repository.quarantine(quarantined)
+        touched_keys = set()
+        pipeline.quarantine_repository.release(released_ids, changed_keys=touched_keys)
+        summary['rows'] = pipeline.repository.diff_upsert(clean, changed_keys=touched_keys)
+        summary['quarantined'] = len(quarantined)
+
+        # 4. 저장이 커밋된 뒤 상태 갱신 (중간에 실패해도 다시 실행하면 같은 결과)
+        pipeline.dead_letter_repository.mark_replayed(resolved, failures)
+        summary['resolved'] = len(resolved)
+        summary['still_failing'] = len(failures)
+
+        # 5. 바뀐 키로 post-commit 훅 실행
+        if self.hooks and touched_keys:
+            summary['hooks'] = run_hooks(pipeline.session, self.hooks, touched_keys)
+        return summary
+
+    def _restore(self, entry) -> Optional[RawPriceData]:
+        """실패 행을 RawPriceData로 복원 (다시 건너뛸 행이면 None, 파싱 실패는 예외)"""
+        record = json.loads(entry.record)
+        if entry.stage == STAGE_NORMALIZE:
+            return restore_record(record)
+        if entry.stage != STAGE_PARSE:
+            raise ValueError(f"Unknown dead letter stage: {entry.stage}")
+        return self._parser(entry.adapter).parse_dead_letter(record, entry.target_date)
+
+    def _parser(self, adapter_name: str):
+        if adapter_name not in self._parsers:
+            factory = self.parser_factories.get(adapter_name)
+            if factory is None:
+                raise LookupError(f"No parser registered for {adapter_name}")
+            self._parsers[adapter_name] = factory()
+        return self._parsers[adapter_name]
+
+
+def _new_summary(entries: int) -> dict:
+    return {
+        'entries': entries,
+        'skipped': 0,
+        'parse_failed': 0,
+        'normalize_failed': 0,
+        'normalized': 0,
+        'quarantined': 0,
+        'resolved': 0,
+        'still_failing': 0,
+        'rows': {'inserted': 0, 'updated': 0, 'unchanged': 0},
+        'hooks': [],
+    }
+
+
+def _log_summary(summary: dict):
+    """재처리 결과 요약 로그"""
+    logger.info("-" * 60)
+    logger.info(
+        f"Replay Summary: {summary['entries']} dead letters in {summary['wall_seconds']}s"
+        + (" (dry run, nothing written)" if summary['dry_run'] else "")
+    )
+    logger.info(f"  Resolved: {summary['resolved']} ({summary['skipped']} now skipped by parser)")
+    logger.info(
+        f"  Still failing: {summary['still_failing']} "
+        f"(parse {summary['parse_failed']}, normalize {summary['normalize_failed']})"
+    )
+    rows = summary['rows']
+    logger.info(
+        f"  Rows: {summary['normalized']} normalized, {rows['inserted']} inserted, {rows['updated']} updated, "
+        f"{rows['unchanged']} unchanged, {summary['quarantined']} quarantined"
+    )
+    for hook in summary['hooks']:
+        logger.info(f"  Hook {hook['hook']}: {hook['status']} in {hook['seconds']}s ({hook['affected']} affected)")
+    logger.info("-" * 60)
+
+
+def _log_pending(counts: List[dict]):
+    """재처리 대기 행 목록"""
+    if not counts:
+        logger.info("No pending dead letters")
+        return
+    for entry in counts:
+        logger.info(
+            f"  {entry['adapter']} {entry['stage']}/{entry['reason']}: {entry['count']} rows "
+            f"({entry['first_date']} ~ {entry['last_date']})"
+        )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="수집 실패 행 재처리 (네트워크 요청 없음)")
+    parser.add_argument("--adapters", help="재처리할 어댑터 (쉼표 구분, 예: garak,noryangjin / 기본: 전체)")
+    parser.add_argument("--stage", choices=(STAGE_PARSE, STAGE_NORMALIZE), help="실패 단계 (기본: 전체)")
+    parser.add_argument("--start", type=date.fromisoformat, help="수집일 시작 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="수집일 끝 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--limit", type=int, help="최대 행 수 (어댑터를 지정하면 어댑터별)")
+    parser.add_argument("--dry-run", action="store_true", help="다시 파싱/정규화한 결과만 집계하고 저장하지 않음")
+    parser.add_argument("--list", action="store_true", help="재처리 대기 행 수만 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """재처리 실행"""
+    from scheduler import initialize_components
+
+    args = parse_args(argv)
+    if args.start and args.end and args.start > args.end:
+        logger.error("--start must not be after --end")
+        return 2
+
+    # 어댑터는 사용하지 않고 DB 파이프라인만 사용
+    _adapters, pipeline_factory = initialize_components()
+
+    if args.list:
+        pipeline = pipeline_factory()
+        try:
+            _log_pending(pipeline.dead_letter_repository.get_pending_counts())
+        finally:
+            pipeline.close()
+        return 0
+
+    adapter_names = [None]
+    if args.adapters:
+        wanted = {name.strip().lower() for name in args.adapters.split(",") if name.strip()}
+        known = {name.replace("Adapter", "").lower(): name for name in PARSER_FACTORIES}
+        unknown = wanted - set(known)
+        if unknown:
+            logger.error(f"Unknown adapters: {', '.join(sorted(unknown))} (known: {', '.join(sorted(known))})")
+            return 2
+        adapter_names = [known[name] for name in sorted(wanted)]
+
+    # 여전히 실패하는 행(아직 별칭이 없는 품목 등)은 다음 재처리를 기다리므로 오류로 보지 않음
+    replayer = DeadLetterReplayer(pipeline_factory, hooks=build_hooks())
+    for adapter_name in adapter_names:
+        replayer.run(adapter_name, args.stage, args.start, args.end, args.limit, args.dry_run)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""Data Ingestion 테스트 공통 설정 (서비스 모듈은 패키지가 아니므로 경로 추가)"""
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+
+# Core Service 모듈(app.database)은 테스트마다 만드는 sqlite DB로 사용 (기본 엔진은 연결하지 않음)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(TESTS_DIR)), "core-service"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
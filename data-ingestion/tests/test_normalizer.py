@@ -0,0 +1,46 @@
+"""DataNormalizer 가격 상한 테스트 (상한은 단위 변환 후 단가에 적용)"""
+from datetime import date
+
+import pytest
+
+from adapters.base import RawPriceData
+from adapters.dead_letters import REASON_INVALID, collect_dead_letters
+from adapters.price_batch import RawPriceBatch
+from normalizer import DataNormalizer
+
+
+class AliasMatcher:
+    """모든 품목명을 품목 1로 매핑"""
+
+    def match_items(self, keys):
+        return {key: 1 for key in keys}
+
+
+RECORDS = [
+    # 20kg 상자 120만원 → kg당 6만원 (저장)
+    RawPriceData(raw_name="광어(활)", price=1200000.0, unit="20kg", date=date(2026, 10, 19), source="garak"),
+    # kg당 120만원 (상한 초과)
+    RawPriceData(raw_name="우럭(활)", price=1200000.0, unit="kg", date=date(2026, 10, 19), source="garak"),
+]
+
+
+def _normalize_rows(normalizer):
+    return [(row['price'], row['unit']) for row in normalizer.normalize(RECORDS, market_id=1)]
+
+
+def _normalize_batch(normalizer):
+    batch = normalizer.normalize_batch(RawPriceBatch.from_records(RECORDS), market_id=1)
+    return list(zip(batch.price.tolist(), batch.unit.tolist()))
+
+
+@pytest.mark.parametrize("normalize", [_normalize_rows, _normalize_batch])
+def test_max_price_applies_to_unit_price(normalize):
+    normalizer = DataNormalizer(AliasMatcher())
+    with collect_dead_letters() as failures:
+        rows = normalize(normalizer)
+
+    assert rows == [(60000.0, "kg")]
+    assert normalizer.stats['invalid'] == 1
+    assert [(letter.reason, letter.record[0]) for letter in failures.letters] == [
+        (REASON_INVALID, "우럭(활)")
+    ]
@@ -0,0 +1,41 @@
+"""pipeline.compute_payload_hash 테스트"""
+from datetime import datetime
+
+from adapters.base import RawPriceData
+from pipeline import compute_payload_hash
+
+
+def _fetch(collect_date: datetime, price: float = 12000.0):
+    """GarakAdapter/NoryangjinAdapter처럼 받은 수집 시각을 레코드 날짜에 넣은 수집 결과"""
+    return [
+        RawPriceData(raw_name="광어(활)", price=price, unit="kg", date=collect_date, source="garak"),
+        RawPriceData(raw_name="우럭(활)", price=9000.0, unit="kg", date=collect_date, source="garak"),
+    ]
+
+
+def test_same_day_fetches_at_different_times_hash_equal():
+    morning = compute_payload_hash(_fetch(datetime(2026, 10, 19, 6, 0, 12, 345)))
+    evening = compute_payload_hash(_fetch(datetime(2026, 10, 19, 18, 30, 1, 7)))
+    assert morning == evening
+
+
+def test_record_order_does_not_change_hash():
+    records = _fetch(datetime(2026, 10, 19, 6, 0))
+    assert compute_payload_hash(records) == compute_payload_hash(list(reversed(records)))
+
+
+def test_changed_price_changes_hash():
+    collect_date = datetime(2026, 10, 19, 6, 0)
+    assert compute_payload_hash(_fetch(collect_date)) != compute_payload_hash(_fetch(collect_date, price=12500.0))
+
+
+def test_different_day_changes_hash():
+    assert compute_payload_hash(_fetch(datetime(2026, 10, 19, 6, 0))) != compute_payload_hash(
+        _fetch(datetime(2026, 10, 20, 6, 0))
+    )
+
+
+def test_dict_records_are_hashed():
+    records = [{"raw_name": "광어(활)", "price": 12000.0, "date": datetime(2026, 10, 19, 9, 0)}]
+    later = [{"raw_name": "광어(활)", "price": 12000.0, "date": datetime(2026, 10, 19, 21, 0)}]
+    assert compute_payload_hash(records) == compute_payload_hash(later)
@@ -0,0 +1,28 @@
+"""RetryStrategy.should_retry 시도 횟수 테스트"""
+import httpx
+
+from adapters.retry_strategy import RetryStrategy
+
+
+def _server_error() -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "http://example.com/prices")
+    response = httpx.Response(503, request=request)
+    return httpx.HTTPStatusError("Service Unavailable", request=request, response=response)
+
+
+def test_default_max_attempts():
+    error = _server_error()
+    assert RetryStrategy.should_retry(error, 2)
+    assert not RetryStrategy.should_retry(error, 3)
+
+
+def test_max_attempts_above_default_is_not_capped():
+    error = _server_error()
+    assert all(RetryStrategy.should_retry(error, attempt, max_attempts=6) for attempt in range(1, 6))
+    assert not RetryStrategy.should_retry(error, 6, max_attempts=6)
+
+
+def test_client_error_is_not_retried():
+    request = httpx.Request("GET", "http://example.com/prices")
+    error = httpx.HTTPStatusError("Not Found", request=request, response=httpx.Response(404, request=request))
+    assert not RetryStrategy.should_retry(error, 1, max_attempts=6)
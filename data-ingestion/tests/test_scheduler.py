@@ -0,0 +1,93 @@
+"""DataIngestionScheduler 보충 수집 테스트 (sqlite)"""
+import time
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from adapters.base import RawPriceData
+from pipeline import make_pipeline_factory
+from scheduler import DataIngestionScheduler
+
+TODAY = date.today()
+
+# 워터마크 다음 날부터 오늘까지 4일 보충 수집
+WATERMARK = TODAY - timedelta(days=4)
+
+# 이 날부터 가격이 두 배 (이상치 → 같은 가격이 3일 이어지면 자동 해제)
+SHIFT_FROM = TODAY - timedelta(days=2)
+
+
+class GarakAdapter:
+    """앞 날짜일수록 응답이 늦는 가짜 어댑터 (수집일을 동시에 실행하면 뒤 날짜가 먼저 저장됨)"""
+
+    def fetch_data(self, collect_date):
+        day = collect_date.date()
+        time.sleep(0.05 * (TODAY - day).days)
+        price = 20000.0 if day >= SHIFT_FROM else 10000.0
+        return [RawPriceData(raw_name="광어(활)", price=price, unit="kg", date=collect_date, source="garak")]
+
+    def get_market_id(self):
+        return 1
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """품목/별칭, 워터마크 이전 30일 가격, 워터마크가 있는 sqlite DB"""
+    from app.database.models import Base, IngestionWatermark, Item, ItemAlias, Market, MarketPrice
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'ingestion.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+
+    session = factory()
+    session.add(Market(id=1, name="가락", code="GARAK"))
+    session.add(Item(id=1, name_ko="광어", name_en="Flounder", category="fish", season_start=11, season_end=2))
+    session.add(ItemAlias(item_id=1, market_id=1, raw_name="광어(활)"))
+    for offset in range(30):
+        session.add(MarketPrice(
+            item_id=1, market_id=1, date=WATERMARK - timedelta(days=offset),
+            price=10000 + (offset % 3) * 100, unit="kg", source="garak"
+        ))
+    session.add(IngestionWatermark(adapter="GarakAdapter", last_success_date=WATERMARK))
+    session.commit()
+    session.close()
+
+    yield factory
+    engine.dispose()
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_catchup_outliers_do_not_depend_on_task_timing(session_factory, max_workers):
+    from app.database.models import MarketPrice, PriceQuarantine
+
+    scheduler = DataIngestionScheduler(
+        [GarakAdapter()], make_pipeline_factory(session_factory),
+        max_workers=max_workers, skip_unchanged=False
+    )
+    summary = scheduler.run_collection()
+
+    results = sorted(summary['adapters'], key=lambda result: result['target_date'])
+    assert [result['target_date'] for result in results] == [TODAY - timedelta(days=offset) for offset in (3, 2, 1, 0)]
+    assert [result['status'] for result in results] == ['success'] * 4
+    # 두 배 가격의 첫 두 날은 격리, 셋째 날 같은 수준이 3일 이어져 함께 해제
+    assert [result['quarantined'] for result in results] == [0, 1, 1, 0]
+
+    session = session_factory()
+    try:
+        stored = dict(
+            session.query(MarketPrice.date, MarketPrice.price).filter(MarketPrice.date > WATERMARK).all()
+        )
+        statuses = sorted(
+            (entry.date, entry.status) for entry in session.query(PriceQuarantine).all()
+        )
+    finally:
+        session.close()
+    assert {day: float(price) for day, price in stored.items()} == {
+        TODAY - timedelta(days=3): 10000.0,
+        TODAY - timedelta(days=2): 20000.0,
+        TODAY - timedelta(days=1): 20000.0,
+        TODAY: 20000.0,
+    }
+    assert statuses == [(TODAY - timedelta(days=2), 'released'), (TODAY - timedelta(days=1), 'released')]
@@ -0,0 +1,272 @@
+"""
+큐 모드 수집 워커
+
+INGESTION_MODE=queue인 스케줄러가 ingestion_jobs 테이블에 넣은 (어댑터, 수집일) 작업을 가져가 실행합니다.
+워커는 여러 노드에서 몇 개든 띄울 수 있습니다.
+- 작업은 SELECT ... FOR UPDATE SKIP LOCKED로 하나씩 가져가므로 같은 작업을 두 워커가 동시에 실행하지 않음
+- 가져간 작업은 가시성 제한(INGESTION_JOB_VISIBILITY_SECONDS) 동안 다른 워커에게 보이지 않으며,
+  그 안에 끝내지 못하면(워커 종료, 응답 없음) 다른 워커가 다시 실행 (at-least-once)
+- 실행 경로는 스케줄러의 직접 수집과 같음 (원본 해시 비교, 정규화, 이상치 격리, diff_upsert 저장)이므로
+  같은 작업이 두 번 실행되어도 저장 결과는 같음
+- 실패/마감 초과한 작업은 INGESTION_JOB_RETRY_SECONDS부터 두 배씩 늘려 기다린 뒤 다시 대기열로 (최대 INGESTION_JOB_MAX_ATTEMPTS회)
+- 실행의 마지막 작업을 끝낸 워커가 워터마크 갱신, post-commit 훅, 실행 기록 종료를 처리
+  (그 전에 워커가 멈추면 다른 워커가 대기열이 빌 때 이어서 처리)
+- 이 워커에 설정된 어댑터(API 키가 있는 어댑터)의 작업만 가져감
+
+사용 예:
+    python worker.py
+    python worker.py --concurrency 4 --adapters garak
+    python worker.py --once
+    python worker.py --status
+"""
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+from typing import Callable, List, Optional, Sequence
+
+from dotenv import load_dotenv
+
+from pipeline import IngestionPipeline
+
+load_dotenv()
+
+logger = logging.getLogger("worker")
+
+# 워커 프로세스 하나에서 동시에 실행할 작업 수
+WORKER_CONCURRENCY = int(os.getenv("INGESTION_WORKER_CONCURRENCY", "2"))
+
+# 가져간 작업을 다른 워커에게 숨기는 시간 (초) - 어댑터 마감 시간(ADAPTER_TIMEOUT_SECONDS)보다 길어야 함
+JOB_VISIBILITY_SECONDS = float(os.getenv("INGESTION_JOB_VISIBILITY_SECONDS", "300"))
+
+# 실패한 작업의 첫 재시도 대기 (초, 시도마다 두 배)
+JOB_RETRY_SECONDS = float(os.getenv("INGESTION_JOB_RETRY_SECONDS", "60"))
+
+# 대기 작업이 없을 때 다시 확인하는 간격 (초)
+POLL_SECONDS = float(os.getenv("INGESTION_WORKER_POLL_SECONDS", "5"))
+
+# 작업을 끝낸 것으로 보는 어댑터 상태 (나머지는 재시도)
+COMPLETED_STATUSES = ('success', 'unchanged', 'empty')
+
+
+class IngestionWorker:
+    """ingestion_jobs 큐 워커"""
+
+    def __init__(
+        self,
+        scheduler,
+        pipeline_factory: Callable[[], IngestionPipeline],
+        worker_id: Optional[str] = None,
+        concurrency: int = WORKER_CONCURRENCY,
+        visibility_seconds: float = JOB_VISIBILITY_SECONDS,
+        retry_seconds: float = JOB_RETRY_SECONDS,
+        poll_seconds: float = POLL_SECONDS
+    ):
+        """
+        Args:
+            scheduler: 작업 실행/실행 종료에 사용할 DataIngestionScheduler (이 워커의 어댑터, 훅 포함)
+            pipeline_factory: IngestionPipeline 생성 함수
+            worker_id: 워커 식별자 (기본: 호스트명:PID, 스레드마다 /번호를 붙여 locked_by에 기록)
+            concurrency: 동시에 실행할 작업 수
+            visibility_seconds: 작업 가시성 제한 (초)
+            retry_seconds: 첫 재시도 대기 (초)
+            poll_seconds: 대기 작업이 없을 때 확인 간격 (초)
+        """
+        self.scheduler = scheduler
+        self.pipeline_factory = pipeline_factory
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = max(1, concurrency)
+        self.visibility_seconds = visibility_seconds
+        self.retry_seconds = retry_seconds
+        self.poll_seconds = poll_seconds
+        self.adapter_names = [adapter.__class__.__name__ for adapter in scheduler.adapters]
+        self.stats = {'processed': 0, 'completed': 0, 'retried': 0, 'failed': 0, 'lost': 0}
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+
+        if visibility_seconds <= scheduler.adapter_timeout:
+            logger.warning(
+                f"Job visibility ({visibility_seconds}s) is not longer than the adapter timeout "
+                f"({scheduler.adapter_timeout}s) - slow jobs may run twice"
+            )
+
+    def run(self, once: bool = False) -> dict:
+        """
+        작업 처리 (stop()이 호출될 때까지, once=True면 가져갈 작업이 없어질 때까지)
+
+        Returns:
+            처리 통계 {processed, completed, retried, failed, lost}
+        """
+        logger.info(
+            f"Worker {self.worker_id} started: {self.concurrency} slots, "
+            f"adapters: {', '.join(self.adapter_names)}, visibility: {self.visibility_seconds}s"
+        )
+        threads = [
+            threading.Thread(target=self._loop, args=(f"{self.worker_id}/{slot}", once), name=f"worker-{slot}")
+            for slot in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.finish_runs()
+        logger.info(f"Worker {self.worker_id} stopped: {self.stats}")
+        return dict(self.stats)
+
+    def stop(self):
+        """진행 중인 작업을 끝낸 뒤 종료"""
+        self._stop.set()
+
+    def process_one(self, locked_by: str) -> bool:
+        """
+        작업 하나 가져와 실행
+
+        Returns:
+            작업을 실행했는지 (가져갈 작업이 없으면 False)
+        """
+        pipeline = self.pipeline_factory()
+        try:
+            job = pipeline.job_repository.claim(locked_by, self.visibility_seconds, self.adapter_names)
+            if job is None:
+                return False
+            job_id, run_id, adapter_name, target_date, attempt = (
+                job.id, job.run_id, job.adapter, job.target_date, job.attempts
+            )
+        finally:
+            pipeline.close()
+
+        logger.info(f"Job #{job_id}: {adapter_name} ({target_date}), attempt {attempt}")
+        result = self.scheduler.run_job(adapter_name, target_date)
+        status = self._record(job_id, locked_by, result)
+        self._count(status)
+
+        if status is None:
+            logger.warning(f"Job #{job_id}: Visibility timeout expired and another worker took it over, result dropped")
+        elif status == 'queued':
+            logger.warning(f"Job #{job_id}: {result['status']} ({result['error']}), queued for retry")
+        elif status == 'failed':
+            logger.error(f"✗ Job #{job_id}: {result['status']} after {attempt} attempts ({result['error']})")
+
+        if status in ('done', 'failed') and run_id is not None:
+            self.scheduler.finish_queued_run(run_id)
+        return True
+
+    def finish_runs(self):
+        """모든 작업이 끝났는데 종료 기록이 없는 실행 처리 (마지막 작업을 끝낸 워커가 그 전에 멈춘 경우)"""
+        pipeline = self.pipeline_factory()
+        try:
+            run_ids = pipeline.job_repository.get_finished_run_ids()
+        except Exception as e:
+            logger.warning(f"Failed to look up finished ingestion runs: {e}")
+            return
+        finally:
+            pipeline.close()
+        for run_id in run_ids:
+            self.scheduler.finish_queued_run(run_id)
+
+    def _loop(self, locked_by: str, once: bool):
+        while not self._stop.is_set():
+            try:
+                if self.process_one(locked_by):
+                    continue
+            except Exception as e:
+                # DB 연결 끊김 등 - 가져간 작업은 가시성 제한이 지나면 다른 워커가 다시 실행
+                logger.error(f"{locked_by}: {e}", exc_info=True)
+            if once:
+                return
+            self.finish_runs()
+            self._stop.wait(self.poll_seconds)
+
+    def _record(self, job_id: int, locked_by: str, result: dict) -> Optional[str]:
+        """결과 기록 - 끝난 작업은 done, 실패/마감 초과는 재시도 대기 또는 failed"""
+        pipeline = self.pipeline_factory()
+        try:
+            if result['status'] in COMPLETED_STATUSES:
+                return pipeline.job_repository.complete(job_id, locked_by, result)
+            return pipeline.job_repository.fail(job_id, locked_by, result, self.retry_seconds)
+        finally:
+            pipeline.close()
+
+    def _count(self, status: Optional[str]):
+        key = {'done': 'completed', 'queued': 'retried', 'failed': 'failed', None: 'lost'}[status]
+        with self._stats_lock:
+            self.stats['processed'] += 1
+            self.stats[key] += 1
+
+
+def _log_status(counts: List[dict]):
+    """어댑터/상태별 작업 수"""
+    if not counts:
+        logger.info("No ingestion jobs")
+        return
+    for entry in counts:
+        logger.info(
+            f"  {entry['adapter']} {entry['status']}: {entry['count']} jobs "
+            f"({entry['first_date']} ~ {entry['last_date']})"
+        )
+
+
+def select_adapters(adapters: Sequence, names: Optional[str]) -> List:
+    """--adapters로 고른 어댑터 (예: garak,noryangjin, 설정되지 않은 이름이면 ValueError)"""
+    if not names:
+        return list(adapters)
+    wanted = {name.strip().lower() for name in names.split(",") if name.strip()}
+    available = {adapter.__class__.__name__.replace("Adapter", "").lower(): adapter for adapter in adapters}
+    unknown = wanted - set(available)
+    if unknown:
+        raise ValueError(
+            f"Unknown or unconfigured adapters: {', '.join(sorted(unknown))} "
+            f"(available: {', '.join(sorted(available))})"
+        )
+    return [available[name] for name in sorted(wanted)]
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="큐 모드 수집 워커 (ingestion_jobs)")
+    parser.add_argument("--concurrency", type=int, default=WORKER_CONCURRENCY, help="동시에 실행할 작업 수")
+    parser.add_argument("--adapters", help="이 워커가 실행할 어댑터 (쉼표 구분, 예: garak,noryangjin / 기본: 설정된 전체)")
+    parser.add_argument("--once", action="store_true", help="가져갈 작업이 없으면 종료 (기본: 계속 대기)")
+    parser.add_argument("--status", action="store_true", help="어댑터/상태별 작업 수만 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """워커 실행"""
+    from adapters.payload_archive import PayloadArchive
+    from hooks import build_hooks
+    from scheduler import PAYLOAD_ARCHIVE_ENABLED, DataIngestionScheduler, initialize_components
+
+    args = parse_args(argv)
+    adapters, pipeline_factory = initialize_components()
+
+    if args.status:
+        pipeline = pipeline_factory()
+        try:
+            _log_status(pipeline.job_repository.get_status_counts())
+        finally:
+            pipeline.close()
+        return 0
+
+    try:
+        adapters = select_adapters(adapters, args.adapters)
+    except ValueError as e:
+        logger.error(str(e))
+        return 2
+
+    archive = PayloadArchive() if PAYLOAD_ARCHIVE_ENABLED else None
+    scheduler = DataIngestionScheduler(adapters, pipeline_factory, archive=archive, hooks=build_hooks())
+    worker = IngestionWorker(scheduler, pipeline_factory, concurrency=args.concurrency)
+
+    # 종료 신호를 받으면 진행 중인 작업까지만 끝내고 종료
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: worker.stop())
+
+    stats = worker.run(once=args.once)
+    return 1 if stats['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
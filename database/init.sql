@@ -103,6 +103,9 @@ GROUP BY item_id, market_id, date;
 -- Materialized View 인덱스
 CREATE INDEX idx_daily_avg_prices ON daily_avg_prices(item_id, market_id, date DESC);
 
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY용 유니크 인덱스 (수집 후 조회를 막지 않고 갱신)
+CREATE UNIQUE INDEX uq_daily_avg_prices_key ON daily_avg_prices(item_id, market_id, date);
+
 -- 주석
 COMMENT ON TABLE items IS '수산물 품목 정보';
 COMMENT ON TABLE markets IS '수산시장 정보';